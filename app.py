@@ -1,11 +1,33 @@
 import streamlit as st
-import pandas as pd
-import plotly.express as px
-import emoji
+import numpy as np
+import csv
+import io
 import os
-from rizzk_core import calculate_risk_reward, calculate_percentage_moves, calculate_risk_reward_ratio
-
-st.set_page_config(page_title="RIZZK Calculator", page_icon=emoji.emojize(":rocket:"), layout="wide")
+import tempfile
+import time
+import uuid
+from contextlib import nullcontext
+from rizzk_cache import RESULT_CACHE, cached_profit_ladder
+from rizzk_core import calculate_trade_metrics
+from rizzk_charts import bar_chart_spec, bar_figure_template, fill_bar_figure
+from rizzk_history import OwnedHistory, SQLiteHistory, TradeHistory
+from rizzk_memprof import SessionMemoryProfiler, interval_from_env, start_tracing
+from rizzk_montecarlo import simulate_equity_curves
+from rizzk_perf import LatencyLog
+from rizzk_sweep import price_levels, price_slider_range, sweep_entry_stop
+
+run_started = time.perf_counter()
+
+# pandas and plotly are imported inside the functions that draw tables and charts, so a
+# cold start renders the form without paying for them (see bench_imports.py)
+
+# UI glyphs as literals (formerly emoji.emojize shortcodes)
+ROCKET = "🚀"
+BOOM = "💥"
+FIRE = "🔥"
+BRAIN = "🧠"
+
+st.set_page_config(page_title="RIZZK Calculator", page_icon=ROCKET, layout="wide")
 
 # Helper to parse boolean-like env / secret values
 def _parse_bool(s):
@@ -20,22 +42,55 @@ def _parse_bool(s):
         return False
     return None
 
-# Determine default for Edgy mode (priority: st.secrets -> env var -> fallback False)
-edgy_default = None
-if hasattr(st, "secrets"):
+# Helper to parse the comma-separated profit target R multiples
+def _parse_r_multiples(s):
+    # Only the syntax is checked here; the core's ladder rejects non-positive, NaN and infinite levels
     try:
-        edgy_default = st.secrets.get('EDGY_MODE_DEFAULT')
-    except Exception:
-        edgy_default = None
+        multiples = [float(part) for part in s.split(",") if part.strip()]
+    except ValueError:
+        return None
+    return multiples or None
+
+# Read a boolean setting (priority: st.secrets -> env var -> fallback False)
+def _config_flag(name):
+    value = None
+    if hasattr(st, "secrets"):
+        try:
+            value = st.secrets.get(name)
+        except Exception:
+            value = None
+
+    if value is None:
+        value = os.environ.get(name)
+
+    value = _parse_bool(value)
+    if value is None:
+        value = False
+    return value
+
+edgy_default = _config_flag('EDGY_MODE_DEFAULT')
+low_latency_default = _config_flag('LOW_LATENCY_DEFAULT')
+# Opt-in per-section timings, shown as a breakdown table in the sidebar
+debug_timings = _config_flag('DEBUG_TIMINGS')
+# Opt-in tracemalloc profiling of session memory (process-wide tracing, sampled per session)
+debug_memory = _config_flag('DEBUG_MEMORY')
+if debug_memory:
+    start_tracing()
+
+
+def _latency():
+    if 'latency' not in st.session_state:
+        st.session_state.latency = LatencyLog()
+    return st.session_state.latency
 
-if edgy_default is None:
-    edgy_default = os.environ.get('EDGY_MODE_DEFAULT')
 
-edgy_default = _parse_bool(edgy_default)
-if edgy_default is None:
-    edgy_default = False
+# Times a section of the script into the session's LatencyLog; a no-op unless DEBUG_TIMINGS is on
+def _timed(section):
+    return _latency().time(section) if debug_timings else nullcontext()
 
-st.markdown("""
+
+with _timed("page setup: css"):
+    st.markdown("""
 <style>
     /* Enhanced Graphic Design */
     .main-header {
@@ -153,33 +208,298 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
-if 'history' not in st.session_state:
-    st.session_state.history = []
-
+# Optional persistent history file shared by every session (RIZZK_HISTORY_DB=path/to/history.db);
+# each user (or anonymous visitor) only sees and clears their own rows
+HISTORY_DB = os.environ.get('RIZZK_HISTORY_DB')
+# Days an anonymous visitor's rows are kept; 0 keeps them forever
 try:
-    with st.sidebar:
-        st.markdown("## About")
-        st.markdown("**Fuaad Abdullah** — Builder, trader, & GoblinOS rep")
-        st.markdown("[¯\_(ツ)_/¯ GoblinOSRep@gmail.com](mailto:GoblinOSRep@gmail.com)")
-        st.markdown("Built by a day trader to turn risk management into a first-class habit.")
-        st.markdown("---")
-        st.markdown("_🦇, refined, numbers-first. RIZZK is for traders who keep it sharp._")
-        # Toggle: 🦇 mode (ASCII emoticons) vs polished emoji UI
-        # Default set to False so the polished emoji UI is the default experience.
-        edgy_mode = st.checkbox("🦇 mode (ASCII emoticons)", value=edgy_default, help="Toggle ASCII emoticons vs polished emoji UI")
-
-    # Header: show ASCII + subtle emoji when edgy_mode enabled, otherwise polished header with emoji
-    if 'edgy_mode' in globals() and edgy_mode:
-        st.markdown('<h1 class="main-header">(⌐■_■) RIZZK Calculator ' + emoji.emojize(':rocket:') + '</h1>', unsafe_allow_html=True)
-    else:
-        st.markdown(f'<h1 class="main-header">RIZZK Calculator {emoji.emojize(":rocket:")}</h1>', unsafe_allow_html=True)
-    st.markdown('<p class="sub-header">Refined risk. Raw edge. Position sizing for traders who know their RIZZ.</p>', unsafe_allow_html=True)
-
-    st.caption("Example numbers. Tune to your own playbook.")
+    HISTORY_SESSION_DAYS = max(float(os.environ.get('RIZZK_HISTORY_SESSION_DAYS', 30)), 0.0)
+except ValueError:
+    HISTORY_SESSION_DAYS = 30.0
+HISTORY_TOKEN_PARAM = "history"
+HISTORY_PAGE_SIZE = 5
+# In-memory entries per session before older ones spill to compressed files in the temp dir
+try:
+    HISTORY_MEMORY_CAP = max(int(os.environ.get('RIZZK_HISTORY_CAP', 256)), 2)
+except ValueError:
+    HISTORY_MEMORY_CAP = 256
+
+
+@st.cache_resource
+def open_history_store(path):
+    return SQLiteHistory(path)
+
+
+# Anonymous rows nobody can reach any more (the link with their token is gone) are dropped after
+# HISTORY_SESSION_DAYS; cache_resource's ttl makes this run at most hourly per server process
+@st.cache_resource(ttl=3600, show_spinner=False)
+def prune_anonymous_history(path):
+    if HISTORY_SESSION_DAYS:
+        return open_history_store(path).prune("session:", HISTORY_SESSION_DAYS * 86400)
+    return 0
+
+
+# Owner key of this session's rows in the shared history: the signed-in user (st.login), so their
+# history follows them anywhere, or else a random token kept in the page URL, so a reload, a
+# bookmark or a server restart finds the same rows. Anyone with that URL can see them.
+def _history_owner():
+    email = st.user.get("email") if st.user.get("is_logged_in") else None
+    if email:
+        return f"user:{email}"
+    token = st.query_params.get(HISTORY_TOKEN_PARAM, "")
+    if len(token) != 32 or not all(c in "0123456789abcdef" for c in token):
+        token = uuid.uuid4().hex
+        st.query_params[HISTORY_TOKEN_PARAM] = token
+    return f"session:{token}"
+
+
+with _timed("page setup: history store"):
+    if 'history' not in st.session_state:
+        if HISTORY_DB:
+            prune_anonymous_history(HISTORY_DB)
+            st.session_state.history = OwnedHistory(open_history_store(HISTORY_DB), _history_owner())
+        else:
+            st.session_state.history = TradeHistory(max_entries=HISTORY_MEMORY_CAP, spill_dir=tempfile.gettempdir())
+
+SWEEP_METRICS = {
+    "Position Size": "position_size_rounded",
+    "Dollar Risk (whole shares)": "rounded_risk_amount",
+    "1:1 Target": "profit_1_1",
+    "2:1 Target": "profit_2_1",
+}
+
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def cached_sweep(position_type, account_size, risk_mode, risk_input, entry_price, stop_loss, span_pct, levels):
+    return sweep_entry_stop(
+        position_type, account_size, risk_mode, risk_input,
+        price_levels(entry_price, span_pct, levels), price_levels(stop_loss, span_pct, levels)
+    )
+
+
+# Fragment: changing the sweep controls reruns only this panel, not the whole script
+@st.fragment
+def render_sweep_heatmap(position_type, account_size, risk_mode, risk_input, entry_price, stop_loss):
+    with _timed("sweep"):
+        with st.expander("Entry x Stop Sweep"):
+            st.caption("Every entry/stop combination around your levels. Blank cells are setups RIZZK would reject.")
+            # st.expander doesn't defer its body, so the grid and heatmap are only built on request
+            if not st.toggle("Show sweep", key="sweep_enabled"):
+                return
+            import plotly.express as px
+
+            sweep_col1, sweep_col2, sweep_col3 = st.columns(3)
+            with sweep_col1:
+                metric_label = st.selectbox("Metric", list(SWEEP_METRICS), key="sweep_metric")
+            with sweep_col2:
+                levels = st.select_slider("Grid Levels", [50, 100, 250, 500], value=100, key="sweep_levels")
+            with sweep_col3:
+                span_pct = st.slider("Price Span (%)", 1.0, 25.0, 5.0, step=0.5, key="sweep_span")
+
+            sweep = cached_sweep(position_type, account_size, risk_mode, risk_input, entry_price, stop_loss, span_pct, levels)
+            grid = getattr(sweep, SWEEP_METRICS[metric_label])
+            fig = px.imshow(
+                grid.astype(float).filled(np.nan),
+                x=sweep.stops,
+                y=sweep.entries,
+                origin="lower",
+                aspect="auto",
+                color_continuous_scale="YlOrBr",
+                labels={"x": "Stop Loss ($)", "y": "Entry ($)", "color": metric_label},
+            )
+            st.plotly_chart(fig, width="stretch")
+
+
+WHAT_IF_SPAN_PCT = 10.0
+
+
+# Fragment: dragging a what-if slider reruns only these tiles, through the memoized core.
+# Slider values sit on a fixed tick grid (price_slider_range), so revisited prices are cache hits.
+@st.fragment
+def render_what_if(trade_id, position_type, account_size, risk_mode, risk_input, entry_price, stop_loss, baseline):
+    with st.expander("What-If Sliders"):
+        st.caption("Drag entry and stop to see how size and targets move. Your submitted numbers stay as they are.")
+        with _timed("what-if"):
+            entry_low, entry_high, entry_step = price_slider_range(entry_price, WHAT_IF_SPAN_PCT)
+            stop_low, stop_high, stop_step = price_slider_range(stop_loss, WHAT_IF_SPAN_PCT)
+            # Submitted prices snapped to the slider grid; off-grid prices can't be shown exactly
+            entry_default = min(max(round(round(entry_price / entry_step) * entry_step, 2), entry_low), entry_high)
+            stop_default = min(max(round(round(stop_loss / stop_step) * stop_step, 2), stop_low), stop_high)
+            # Keyed by submission, so a new calculation recenters the sliders
+            what_if_col1, what_if_col2 = st.columns(2)
+            with what_if_col1:
+                what_if_entry = st.slider(
+                    "Entry Price ($)", entry_low, entry_high, entry_default,
+                    step=entry_step, key=f"what_if_entry_{trade_id}"
+                )
+            with what_if_col2:
+                what_if_stop = st.slider(
+                    "Stop Loss Price ($)", stop_low, stop_high, stop_default,
+                    step=stop_step, key=f"what_if_stop_{trade_id}"
+                )
+
+            # Untouched sliders show the submitted calculation as is, without deltas
+            moved = (what_if_entry, what_if_stop) != (entry_default, stop_default)
+            if not moved:
+                metrics = baseline
+            else:
+                try:
+                    metrics = calculate_trade_metrics(position_type, account_size, risk_mode, risk_input, what_if_entry, what_if_stop)
+                except ValueError as e:
+                    st.warning(f"No valid setup at these levels: {e}")
+                    return
+
+            what_if_col1, what_if_col2, what_if_col3, what_if_col4, what_if_col5 = st.columns(5)
+            with what_if_col1:
+                st.metric("Position Size", f"{metrics.position_size_rounded} shares",
+                          f"{metrics.position_size_rounded - baseline.position_size_rounded:+d}" if moved else None)
+            with what_if_col2:
+                st.metric("Dollar Risk", f"${metrics.risk_amount:.2f}")
+            with what_if_col3:
+                st.metric("1:1 Target", f"${metrics.profit_1_1:.2f}",
+                          f"{metrics.profit_1_1 - baseline.profit_1_1:+.2f}" if moved else None)
+            with what_if_col4:
+                st.metric("2:1 Target", f"${metrics.profit_2_1:.2f}",
+                          f"{metrics.profit_2_1 - baseline.profit_2_1:+.2f}" if moved else None)
+            with what_if_col5:
+                st.metric("% Drop to Stop", f"{metrics.pct_drop_to_stop:.2f}%",
+                          f"{metrics.pct_drop_to_stop - baseline.pct_drop_to_stop:+.2f}" if moved else None,
+                          delta_color="inverse")
+
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def cached_simulation(account_size, risk_percentage, win_rate, reward_multiple, n_trades, n_paths, stop_distance):
+    return simulate_equity_curves(
+        account_size, risk_percentage, win_rate, reward_multiple, n_trades, n_paths,
+        stop_distance=stop_distance, seed=0
+    )
+
+
+@st.fragment
+def render_equity_simulation(account_size, risk_percentage, stop_distance):
+    with _timed("simulation"):
+        with st.expander("Equity Curve Simulation"):
+            st.caption(f"Compounds {risk_percentage:.2f}% risk per trade over many simulated trade sequences.")
+            with st.form("simulation_form"):
+                sim_col1, sim_col2 = st.columns(2)
+                with sim_col1:
+                    win_rate = st.slider("Win Rate (%)", 1, 99, 40) / 100
+                    n_trades = st.select_slider("Trades per Path", [100, 250, 500, 1000], value=1000)
+                with sim_col2:
+                    target = st.radio("Target", ["1:1", "2:1"], index=1, horizontal=True)
+                    n_paths = st.select_slider("Paths", [1_000, 10_000, 100_000], value=10_000)
+                simulate = st.form_submit_button("Simulate")
+            if not simulate:
+                return
+
+            with st.spinner("Simulating..."):
+                result = cached_simulation(
+                    account_size, risk_percentage, win_rate, 1.0 if target == "1:1" else 2.0,
+                    n_trades, n_paths, stop_distance
+                )
+            terminal = result.terminal_percentiles()
+            drawdown = result.drawdown_percentiles()
+            mc_col1, mc_col2, mc_col3, mc_col4 = st.columns(4)
+            with mc_col1:
+                st.metric("Median Ending Equity", f"${terminal[50]:,.0f}")
+            with mc_col2:
+                st.metric("5th Percentile Equity", f"${terminal[5]:,.0f}")
+            with mc_col3:
+                st.metric("Median Max Drawdown", f"{drawdown[50]:.1%}")
+            with mc_col4:
+                st.metric("Risk of Ruin", f"{result.risk_of_ruin:.2%}")
+            st.dataframe({
+                'Percentile': [f"{q}th" for q in terminal],
+                'Ending Equity': [f"${v:,.2f}" for v in terminal.values()],
+                'Max Drawdown': [f"{v:.1%}" for v in drawdown.values()],
+            }, hide_index=True)
+            st.caption("Ruin = equity falls to half the starting account. Positions rounded to whole shares.")
+
+BULK_PLAN_EXAMPLE = """position_type,entry_price,stop_loss
+Long,100,95
+Short,42.5,44"""
+
+
+@st.cache_data(max_entries=8, show_spinner=False)
+def cached_bulk_sizing(plan_csv, account_size, risk_mode, risk_input):
+    from io import StringIO
+
+    import pandas as pd
+    from rizzk_io import PLAN_READ_DTYPES, size_plan
+
+    plan = pd.read_csv(StringIO(plan_csv), dtype=PLAN_READ_DTYPES, skipinitialspace=True)
+    return size_plan(plan, {"account_size": account_size, "risk_mode": risk_mode, "risk_input": risk_input})
+
+
+# Fragment: sizes a whole trade plan through the batch engine; editing it leaves the rest of the page alone
+@st.fragment
+def render_bulk_sizing():
+    with _timed("bulk sizing"):
+        with st.expander("Bulk Sizing"):
+            st.caption(
+                "Upload or paste a trade plan CSV with position_type, entry_price and stop_loss columns. "
+                "account_size, risk_mode and risk_input columns are optional; missing ones use the values below."
+            )
+            uploaded = st.file_uploader("Trade Plan CSV", type=["csv"], key="bulk_file")
+            pasted = st.text_area("...or paste CSV rows", placeholder=BULK_PLAN_EXAMPLE, key="bulk_text")
+            bulk_col1, bulk_col2, bulk_col3 = st.columns(3)
+            with bulk_col1:
+                account_size = st.number_input("Account Size ($)", min_value=0.0, value=10000.0, step=100.0, key="bulk_account")
+            with bulk_col2:
+                risk_mode = st.radio("Risk Mode", ["% of Account", "Fixed $ Amount"], horizontal=True, key="bulk_risk_mode")
+            with bulk_col3:
+                risk_input = st.number_input("Risk (% or $)", min_value=0.0, value=1.0, step=0.1, key="bulk_risk_input")
+
+            try:
+                plan_csv = uploaded.getvalue().decode("utf-8-sig") if uploaded is not None else pasted
+            except UnicodeDecodeError:
+                st.error("Couldn't read that file: trade plans must be UTF-8 CSV text.")
+                return
+            if not plan_csv.strip():
+                return
+            try:
+                sized = cached_bulk_sizing(plan_csv, account_size, risk_mode, risk_input)
+            except ValueError as e:
+                st.error(f"Couldn't size that plan: {e}")
+                return
+
+            invalid = sized["error_code"] != 0
+            bulk_col1, bulk_col2, bulk_col3 = st.columns(3)
+            with bulk_col1:
+                st.metric("Setups", f"{len(sized):,}")
+            with bulk_col2:
+                st.metric("Invalid", f"{int(invalid.sum()):,}")
+            with bulk_col3:
+                st.metric("Total Dollar Risk", f"${sized['risk_amount'].sum():,.2f}")
+            only_invalid = st.checkbox("Only show rows with errors", key="bulk_only_invalid")
+            # Column headers sort the table client-side, so sorting never reruns the script
+            st.dataframe(
+                sized[invalid] if only_invalid else sized,
+                hide_index=True,
+                column_config={
+                    "position_size": st.column_config.NumberColumn("Theoretical Size", format="%.2f"),
+                    "position_size_rounded": st.column_config.NumberColumn("Shares"),
+                    "risk_amount": st.column_config.NumberColumn("Dollar Risk", format="$%.2f"),
+                    "profit_1_1": st.column_config.NumberColumn("1:1 Target", format="$%.2f"),
+                    "profit_2_1": st.column_config.NumberColumn("2:1 Target", format="$%.2f"),
+                    "stop_loss_amount": st.column_config.NumberColumn("Stop Loss Impact", format="$%.2f"),
+                    "pct_drop_to_stop": st.column_config.NumberColumn("% to Stop", format="%.2f%%"),
+                    "pct_move_to_1_1": st.column_config.NumberColumn("% to 1:1", format="%.2f%%"),
+                    "rr_1_1": None,
+                },
+            )
+            # Deferred: CSV formatting dominates the cost, so it only runs when the button is clicked
+            st.download_button(
+                "Download Sized Plan as CSV", lambda: sized.to_csv(index=False), "rizzk_sized_plan.csv", "text/csv",
+                key="bulk_download"
+            )
 
-    col_left, col_right = st.columns([1, 1.5])
 
-    with col_left:
+# Fragment: form widgets and submission only rerun the form; a submission stores the
+# inputs and then reruns the app so the results and history pick them up
+@st.fragment
+def render_form(edgy_mode):
+    with _timed("form"):
         with st.form("rizzk_form"):
             # Add position type selector
             position_label = "(ง'̀-'́)ง Position Type" if edgy_mode else "Position Type"
@@ -196,51 +516,104 @@ try:
                 account_size = st.number_input(account_label, min_value=0.0, value=10000.0, step=100.0, help="Total trading account balance")
                 if risk_mode == "% of Account":
                     risk_pct_label = "(ಠ_ಠ) Risk Percentage (%)" if edgy_mode else "Risk Percentage (%)"
-                    risk_percentage = st.number_input(risk_pct_label, min_value=0.0, max_value=100.0, value=1.0, step=0.1, help="Percentage of account to risk per trade")
+                    risk_input = st.number_input(risk_pct_label, min_value=0.0, max_value=100.0, value=1.0, step=0.1, help="Percentage of account to risk per trade")
                 else:
                     risk_amt_label = "ヽ(´ー｀)ﾉ Risk Amount ($)" if edgy_mode else "Risk Amount ($)"
-                    risk_amount_input = st.number_input(risk_amt_label, min_value=0.0, value=100.0, step=10.0, help="Fixed dollar amount to risk per trade")
+                    risk_input = st.number_input(risk_amt_label, min_value=0.0, value=100.0, step=10.0, help="Fixed dollar amount to risk per trade")
 
             with col2:
                 entry_label = "(ﾉ◕ヮ◕)ﾉ*:･ﾟ✧ Entry Price ($)" if edgy_mode else "Entry Price ($)"
                 entry_price = st.number_input(entry_label, min_value=0.0, value=100.0, step=0.1, help="Price at which you plan to enter the trade")
-                stop_label = "(╯‵□′)╯︵┻━┻ Stop Loss Price ($)" if edgy_mode else f"{emoji.emojize(':boom:')} Stop Loss Price ($)"
+                stop_label = "(╯‵□′)╯︵┻━┻ Stop Loss Price ($)" if edgy_mode else f"{BOOM} Stop Loss Price ($)"
                 stop_loss = st.number_input(stop_label, min_value=0.0, value=95.0, step=0.1, help="Price at which you will exit if the trade goes against you")
 
-            submitted = st.form_submit_button("Calculate", type="primary")
+            targets_label = "(•̀ᴗ•́)و Profit Targets (R multiples)" if edgy_mode else "Profit Targets (R multiples)"
+            targets_input = st.text_input(targets_label, value="1, 2", help="Comma-separated reward multiples of your risk, e.g. 0.5, 1, 2, 3")
 
-    with col_right:
-        if submitted:
-            # Input validation
-            if account_size <= 0:
-                st.error("Account size must be greater than 0.")
-                st.stop()
-            if entry_price <= 0:
-                st.error("Entry price must be greater than 0.")
-                st.stop()
-            if stop_loss <= 0:
-                st.error("Stop loss price must be greater than 0.")
-                st.stop()
-            if entry_price == stop_loss:
-                st.error("Entry price and stop loss cannot be the same.")
-                st.stop()
-
-            # Calculate using centralized function
-            risk_input = risk_percentage if risk_mode == "% of Account" else risk_amount_input
-            position_size, position_size_rounded, risk_amount, profit_1_1, profit_2_1, stop_loss_amount = calculate_risk_reward(
-                position_type, account_size, risk_mode, risk_input, entry_price, stop_loss
-            )
+            submitted = st.form_submit_button("Calculate", type="primary")
 
-            # Calculate percentage moves
-            pct_drop_to_stop, pct_move_to_1_1 = calculate_percentage_moves(entry_price, stop_loss, profit_1_1, position_type)
+    if submitted:
+        previous = st.session_state.get("trade_inputs")
+        st.session_state.trade_inputs = {
+            "id": previous["id"] + 1 if previous else 1,
+            "position_type": position_type,
+            "account_size": account_size,
+            "risk_mode": risk_mode,
+            "risk_input": risk_input,
+            "entry_price": entry_price,
+            "stop_loss": stop_loss,
+            "targets_input": targets_input,
+        }
+        st.rerun()
 
-            # Calculate R:R ratio
-            rr_1_1 = calculate_risk_reward_ratio(entry_price, stop_loss, profit_1_1, position_type)
 
+# Fragment: renders the last submitted calculation; interacting with it leaves the form and history alone
+@st.fragment
+def render_results(low_latency):
+    inputs = st.session_state.get("trade_inputs")
+    if inputs is None:
+        st.markdown("### Results Preview")
+        st.markdown("Fill the form on the left and hit Calculate to see your position sizing, risk metrics, and percentage moves here.")
+        st.markdown("---")
+        st.markdown(f"** {FIRE} Key Metrics** will show: Position Size, Dollar Risk, Profit Targets, R:R Ratio")
+        st.markdown("** Percentage Moves** will display: % Drop to Stop, % Move to 1:1 Target")
+        st.markdown("** Risk/Reward Chart** will visualize the scenarios")
+        return
+
+    with _timed("results"):
+        position_type = inputs["position_type"]
+        account_size = inputs["account_size"]
+        risk_mode = inputs["risk_mode"]
+        risk_input = inputs["risk_input"]
+        entry_price = inputs["entry_price"]
+        stop_loss = inputs["stop_loss"]
+
+        # Input validation
+        if account_size <= 0:
+            st.error("Account size must be greater than 0.")
+            return
+        if entry_price <= 0:
+            st.error("Entry price must be greater than 0.")
+            return
+        if stop_loss <= 0:
+            st.error("Stop loss price must be greater than 0.")
+            return
+        if entry_price == stop_loss:
+            st.error("Entry price and stop loss cannot be the same.")
+            return
+        r_multiples = _parse_r_multiples(inputs["targets_input"])
+        if r_multiples is None:
+            st.error("Profit targets must be comma-separated numbers.")
+            return
+
+        # Sizing, percentage moves and R:R in one pass through the core
+        with _timed("results: core math"):
+            # The core rejects setups the checks above don't cover (stop on the wrong side, risk over
+            # the account, oversized positions); the inputs persist, so report it here, not page-wide
+            try:
+                metrics = calculate_trade_metrics(position_type, account_size, risk_mode, risk_input, entry_price, stop_loss)
+                (position_size, position_size_rounded, risk_amount, profit_1_1, profit_2_1, stop_loss_amount,
+                 pct_drop_to_stop, pct_move_to_1_1, rr_1_1) = metrics
+                ladder = cached_profit_ladder(entry_price, stop_loss, position_size, r_multiples, None, position_type)
+            except ValueError as e:
+                st.error(str(e))
+                return
+            target_names = [f"{r:g}:1" for r in ladder.r_multiples]
+
+        # Save to history once per submission; the persistent store also indexes the furthest target's R:R
+        with _timed("results: history append"):
+            if st.session_state.get("recorded_trade") != inputs["id"]:
+                st.session_state.recorded_trade = inputs["id"]
+                history_extras = {"rr": max(r_multiples)} if HISTORY_DB else {}
+                st.session_state.history.append(
+                    position_type, account_size, risk_mode, risk_input, entry_price, stop_loss, metrics, **history_extras
+                )
+
+        with _timed("results: metric tiles"):
             st.markdown('<div class="success-msg">Calculation Complete!</div>', unsafe_allow_html=True)
 
             # KPI Dashboard
-            st.markdown(f"### {emoji.emojize(':fire:')} Key Metrics")
+            st.markdown(f"### {FIRE} Key Metrics")
             col1, col2, col3, col4, col5 = st.columns(5)
             with col1:
                 st.metric("Position Size", f"{position_size_rounded} shares")
@@ -264,90 +637,193 @@ try:
             with pct_col2:
                 st.metric("% Move to 1:1 Target", f"{pct_move_to_1_1:.2f}%")
 
-            # Chart
-            chart_data = pd.DataFrame({
-                'Scenario': ['Risk', '1:1 Profit', '2:1 Profit'],
-                'Amount': [risk_amount, abs(profit_1_1 - entry_price) * position_size, abs(profit_2_1 - entry_price) * position_size]
-            })
-            fig = px.bar(chart_data, x='Scenario', y='Amount', color_discrete_sequence=['#FFD700', '#FFD700', '#FFD700'])
-            st.plotly_chart(fig, use_container_width=True)
-
-            # Export results
-            results_df = pd.DataFrame({
-                'Metric': ['Theoretical Position Size', 'Rounded Position Size', 'Risk Amount', 'Stop Loss Impact', 'Profit 1:1', 'Profit 2:1'],
-                'Value': [f"{position_size:.2f} shares", f"{position_size_rounded} shares", f"${risk_amount:.2f}", f"${stop_loss_amount:.2f}", f"${profit_1_1:.2f}", f"${profit_2_1:.2f}"]
-            })
-            csv = results_df.to_csv(index=False)
-            st.download_button("Download Results as CSV", csv, "rizzk_results.csv", "text/csv")
-
-            # Save to history
-            calc = {
-                'position_type': position_type,
-                'account_size': account_size,
-                'risk_mode': risk_mode,
-                'risk_input': risk_percentage if risk_mode == "% of Account" else risk_amount_input,
-                'entry_price': entry_price,
-                'stop_loss': stop_loss,
-                'position_size': position_size,
-                'position_size_rounded': position_size_rounded,
-                'risk_amount': risk_amount,
-                'profit_1_1': profit_1_1,
-                'profit_2_1': profit_2_1
-            }
-            st.session_state.history.append(calc)
+        # Chart: risk vs. P&L at every profit target level
+        with _timed("results: chart"):
+            chart_labels = ['Risk'] + [f"{name} Profit" for name in target_names]
+            chart_values = [risk_amount] + ladder.pnl.tolist()
+            if low_latency:
+                st.vega_lite_chart(bar_chart_spec(chart_labels, chart_values), width="stretch")
+            else:
+                # One styled figure per session; each submission only swaps its bars (see bench_chart.py)
+                if 'bar_figure' not in st.session_state:
+                    st.session_state.bar_figure = bar_figure_template()
+                st.plotly_chart(fill_bar_figure(st.session_state.bar_figure, chart_labels, chart_values), width="stretch")
+
+        render_what_if(inputs["id"], position_type, account_size, risk_mode, risk_input, entry_price, stop_loss, metrics)
+        render_sweep_heatmap(position_type, account_size, risk_mode, risk_input, entry_price, stop_loss)
+        render_equity_simulation(account_size, risk_amount / account_size * 100, abs(entry_price - stop_loss))
+
+        # Export results
+        with _timed("results: export"):
+            results_csv = io.StringIO()
+            writer = csv.writer(results_csv, lineterminator="\n")
+            writer.writerow(['Metric', 'Value'])
+            writer.writerows(zip(
+                ['Theoretical Position Size', 'Rounded Position Size', 'Risk Amount', 'Stop Loss Impact'] + [f"Profit {name}" for name in target_names],
+                [f"{position_size:.2f} shares", f"{position_size_rounded} shares", f"${risk_amount:.2f}", f"${stop_loss_amount:.2f}"] + [f"${price:.2f}" for price in ladder.target_prices]
+            ))
+            st.download_button("Download Results as CSV", results_csv.getvalue(), "rizzk_results.csv", "text/csv")
+
+
+# Fragment: paging through or clearing history reruns only this panel
+@st.fragment
+def render_history():
+    with _timed("history"):
+        st.header(f"{BRAIN} Calculation History")
+        history_size = len(st.session_state.history)
+        if history_size:
+            page = 0
+            if history_size > HISTORY_PAGE_SIZE:
+                page_count = -(-history_size // HISTORY_PAGE_SIZE)
+                page = st.number_input(f"Page (of {page_count}, newest first)", min_value=1, max_value=page_count, value=1) - 1
+            recent = st.session_state.history.page(page, HISTORY_PAGE_SIZE)
+            for i, h in enumerate(recent):
+                with st.expander(f"Calc {page * HISTORY_PAGE_SIZE + i + 1}: {h.position_type}"):
+                    hist_col1, hist_col2, hist_col3, hist_col4 = st.columns(4)
+                    with hist_col1:
+                        st.metric("Account", f"${h.account_size}")
+                        st.metric("Entry", f"${h.entry_price}")
+                    with hist_col2:
+                        risk_label = "%" if h.risk_mode == '% of Account' else "$"
+                        st.metric("Risk", f"{h.risk_input}{risk_label}")
+                        st.metric("Stop", f"${h.stop_loss}")
+                    with hist_col3:
+                        st.metric("Position", f"{h.position_size_rounded} shares")
+                        st.caption(f"Theoretical: {h.position_size:.2f} shares")
+                        st.metric("Profit 1:1", f"${h.profit_1_1:.2f}")
+                    with hist_col4:
+                        st.metric("Dollar Risk", f"${h.risk_amount:.2f}")
+                        st.metric("R:R Ratio", f"{h.rr_1_1:.1f}:1")
+
+                    # Additional metrics row
+                    add_col1, add_col2 = st.columns(2)
+                    with add_col1:
+                        st.metric("% Drop to Stop", f"{h.pct_drop_to_stop:.2f}%")
+                    with add_col2:
+                        st.metric("% Move to 1:1 Target", f"{h.pct_move_to_1_1:.2f}%")
         else:
-            st.markdown("### Results Preview")
-            st.markdown("Fill the form on the left and hit Calculate to see your position sizing, risk metrics, and percentage moves here.")
+            st.write("No calculations yet. Run one and flex it here.")
+            st.caption("If this list is empty, either you're disciplined… or you're procrastinating.")
+    if st.button("Clear All History"):
+        st.session_state.history.clear()
+        st.rerun(scope="fragment")
+    if HISTORY_DB:
+        st.caption("This clears your saved history on this server, not your broker. Sadly.")
+    else:
+        st.caption("This only clears local session history, not your broker. Sadly.")
+
+
+def _mb(size_bytes):
+    return f"{size_bytes / 2**20:,.2f}"
+
+
+def _kb(size_bytes):
+    return f"{size_bytes / 2**10:,.1f}"
+
+
+def render_memory_panel():
+    if 'memory_profiler' not in st.session_state:
+        st.session_state.memory_profiler = SessionMemoryProfiler(interval_from_env())
+    profiler = st.session_state.memory_profiler
+    with st.sidebar.expander("Session Memory"):
+        if st.button("Sample Now", key="memory_sample"):
+            profiler.sample(st.session_state.to_dict())
+        else:
+            profiler.maybe_sample(st.session_state.to_dict())
+        first, latest = profiler.samples[0], profiler.samples[-1]
+        rss = f" · RSS {_mb(latest.rss_bytes)} MB" if latest.rss_bytes is not None else ""
+        st.caption(
+            f"Traced {_mb(latest.traced_bytes)} MB (peak {_mb(latest.peak_bytes)} MB){rss} · "
+            f"{len(profiler.samples)} samples, every {profiler.interval:g} s at most"
+        )
+        # This session's objects, against its first sample
+        st.markdown("| Session object | KB | Change (KB) |\n|---|---:|---:|\n" + "\n".join(
+            f"| {name} | {_kb(size)} | {_kb(size - first.objects.get(name, 0))} |"
+            for name, size in sorted(latest.objects.items(), key=lambda item: item[1], reverse=True)
+        ))
+        # Process-wide, so shared caches and other sessions show up here too
+        st.markdown("| Allocated by | MB |\n|---|---:|\n" + "\n".join(
+            f"| {package} | {_mb(size)} |" for package, size in list(latest.packages.items())[:8]
+        ))
+        if profiler.growth:
+            st.markdown("| Growth since last sample | MB | Blocks |\n|---|---:|---:|\n" + "\n".join(
+                f"| `{row.location}` | {_mb(row.size_diff_bytes)} | {row.count_diff:+d} |" for row in profiler.growth
+            ))
+        st.download_button(
+            "Download Memory Report", profiler.to_json, "rizzk_memory_report.json", "application/json",
+            key="memory_download"
+        )
+
+
+try:
+    with _timed("sidebar"):
+        with st.sidebar:
+            st.markdown("## About")
+            st.markdown("**Fuaad Abdullah** — Builder, trader, & GoblinOS rep")
+            st.markdown("[¯\_(ツ)_/¯ GoblinOSRep@gmail.com](mailto:GoblinOSRep@gmail.com)")
+            st.markdown("Built by a day trader to turn risk management into a first-class habit.")
             st.markdown("---")
-            st.markdown(f"** {emoji.emojize(':fire:')} Key Metrics** will show: Position Size, Dollar Risk, Profit Targets, R:R Ratio")
-            st.markdown("** Percentage Moves** will display: % Drop to Stop, % Move to 1:1 Target")
-            st.markdown("** Risk/Reward Chart** will visualize the scenarios")
+            st.markdown("_🦇, refined, numbers-first. RIZZK is for traders who keep it sharp._")
+            # Toggle: 🦇 mode (ASCII emoticons) vs polished emoji UI
+            # Default set to False so the polished emoji UI is the default experience.
+            edgy_mode = st.checkbox("🦇 mode (ASCII emoticons)", value=edgy_default, help="Toggle ASCII emoticons vs polished emoji UI")
+            low_latency = st.checkbox("⚡ Low-latency charts", value=low_latency_default, help="Draw the risk/reward chart natively instead of with Plotly")
 
-    st.markdown("---")
-    st.header(f"{emoji.emojize(':brain:')} Calculation History")
-    if st.session_state.history:
-        recent = st.session_state.history[-5:]
-        for i, h in enumerate(reversed(recent), start=1):
-            with st.expander(f"Calc {i}: {h['position_type']}"):
-                # Calculate additional metrics using centralized functions
-                pct_drop_to_stop, pct_move_to_1_1 = calculate_percentage_moves(h['entry_price'], h['stop_loss'], h['profit_1_1'], h['position_type'])
-                rr_ratio = calculate_risk_reward_ratio(h['entry_price'], h['stop_loss'], h['profit_1_1'], h['position_type'])
-                
-                hist_col1, hist_col2, hist_col3, hist_col4 = st.columns(4)
-                with hist_col1:
-                    st.metric("Account", f"${h['account_size']}")
-                    st.metric("Entry", f"${h['entry_price']}")
-                with hist_col2:
-                    risk_label = "%" if h.get('risk_mode', '% of Account') == '% of Account' else "$"
-                    st.metric("Risk", f"{h['risk_input']}{risk_label}")
-                    st.metric("Stop", f"${h['stop_loss']}")
-                with hist_col3:
-                    position_size_rounded = h.get('position_size_rounded', int(h['position_size']))
-                    st.metric("Position", f"{position_size_rounded} shares")
-                    st.caption(f"Theoretical: {h['position_size']:.2f} shares")
-                    st.metric("Profit 1:1", f"${h['profit_1_1']:.2f}")
-                with hist_col4:
-                    st.metric("Dollar Risk", f"${h['risk_amount']:.2f}")
-                    st.metric("R:R Ratio", f"{rr_ratio:.1f}:1")
-                
-                # Additional metrics row
-                add_col1, add_col2 = st.columns(2)
-                with add_col1:
-                    st.metric("% Drop to Stop", f"{pct_drop_to_stop:.2f}%")
-                with add_col2:
-                    st.metric("% Move to 1:1 Target", f"{pct_move_to_1_1:.2f}%")
-    else:
-        st.write("No calculations yet. Run one and flex it here.")
-        st.caption("If this list is empty, either you're disciplined… or you're procrastinating.")
-    if st.button("Clear All History"):
-        st.session_state.history = []
-        st.rerun()
-    st.caption("This only clears local session history, not your broker. Sadly.")
+    # Header: show ASCII + subtle emoji when edgy_mode enabled, otherwise polished header with emoji
+    with _timed("header"):
+        if 'edgy_mode' in globals() and edgy_mode:
+            st.markdown('<h1 class="main-header">(⌐■_■) RIZZK Calculator ' + ROCKET + '</h1>', unsafe_allow_html=True)
+        else:
+            st.markdown(f'<h1 class="main-header">RIZZK Calculator {ROCKET}</h1>', unsafe_allow_html=True)
+        st.markdown('<p class="sub-header">Refined risk. Raw edge. Position sizing for traders who know their RIZZ.</p>', unsafe_allow_html=True)
+
+        st.caption("Example numbers. Tune to your own playbook.")
+
+    col_left, col_right = st.columns([1, 1.5])
+
+    with col_left:
+        render_form(edgy_mode)
+
+    with col_right:
+        render_results(low_latency)
+
+    render_bulk_sizing()
 
     st.markdown("---")
-    st.caption("RIZZK is a calculator, not a crystal ball. Nothing here is financial advice.")
-    st.markdown("*Built with Streamlit — RIZZK by Fuaad Abdullah (GoblinOSRep@gmail.com)*")
+    render_history()
+
+    with _timed("footer"):
+        st.markdown("---")
+        st.caption("RIZZK is a calculator, not a crystal ball. Nothing here is financial advice.")
+        st.markdown("*Built with Streamlit — RIZZK by Fuaad Abdullah (GoblinOSRep@gmail.com)*")
+
+        # Rendered last so the counters include this run's lookups; the cache is shared by all sessions
+        cache_stats = RESULT_CACHE.stats()
+        st.sidebar.caption(
+            f"Result cache: {cache_stats.hit_rate:.0%} hit rate · {cache_stats.hits} hits · "
+            f"{cache_stats.misses} misses · {cache_stats.evictions} evictions · {cache_stats.size}/{cache_stats.maxsize} entries"
+        )
+
+    if debug_timings:
+        # Full runs include every fragment; fragment-only reruns are recorded under their own names.
+        # "results: ..." rows are parts of "results", so shares of the full run overlap.
+        _latency().record("full run", time.perf_counter() - run_started)
+        timings = _latency().summary()
+        full_run_p50 = next(row.p50_ms for row in timings if row.section == "full run")
+        with st.sidebar.expander("Render Latency", expanded=True):
+            # A markdown table rather than st.dataframe, which would pull in pandas on every cold start
+            st.markdown("| Section | Runs | Last (ms) | p50 (ms) | p95 (ms) | p99 (ms) | p50 share |\n|---|---:|---:|---:|---:|---:|---:|\n" + "\n".join(
+                f"| {row.section} | {row.runs} | {row.last_ms:.1f} | {row.p50_ms:.1f} | {row.p95_ms:.1f} | {row.p99_ms:.1f} | {row.p50_ms / full_run_p50:.0%} |"
+                for row in timings
+            ))
+            st.caption(f"Rolling percentiles over the last {_latency().window} runs of each section.")
+            if st.button("Reset Timings", key="reset_timings"):
+                _latency().clear()
+                st.rerun()
+
+    if debug_memory:
+        render_memory_panel()
 
 except Exception as e:
     st.error("Something went wrong with the calculation. Check your inputs and try again.")
-    st.exception(e)  # Show full traceback for debugging
\ No newline at end of file
+    st.exception(e)  # Show full traceback for debugging
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+End-to-end rerun latency benchmark for the RIZZK Streamlit app.
+
+Drives app.py headlessly with Streamlit's AppTest and times whole script runs
+(server side only: no browser, no websocket) for a set of scenarios:
+
+    python bench_app.py
+    python bench_app.py --save bench_app_baseline.json
+    python bench_app.py --baseline bench_app_baseline.json   # exit 1 on regressions
+
+Scenarios: "empty form" (a rerun before anything is calculated), "submission"
+(a Calculate click, which reruns the app once more to pick up the inputs) and
+"history N" (a rerun with N entries already in the session history).
+
+Session history is always the in-memory store here; RIZZK_HISTORY_DB is ignored
+so a benchmark run never writes to a shared database.
+"""
+
+import argparse
+import json
+import logging
+import os
+import platform
+import sys
+import time
+from datetime import datetime, timezone
+
+import numpy as np
+
+APP = os.path.join(os.path.dirname(os.path.abspath(__file__)), "app.py")
+HISTORY_SIZES = (5, 50, 500)
+PERCENTILES = (50, 95, 99)
+
+
+def _quiet_streamlit() -> None:
+    # Deprecation notices and bare-mode warnings would be printed on every run
+    for name in list(logging.root.manager.loggerDict):
+        if name.startswith("streamlit"):
+            logging.getLogger(name).setLevel(logging.ERROR)
+
+
+def _load_app(history_entries: int, timeout: float):
+    from streamlit.testing.v1 import AppTest
+
+    from rizzk_core import calculate_trade_metrics
+
+    app = AppTest.from_file(APP, default_timeout=timeout)
+    app.run()
+    _quiet_streamlit()
+    history = app.session_state["history"]
+    for i in range(history_entries):
+        entry_price = 100.0 + i % 50
+        stop_loss = entry_price - 5.0
+        metrics = calculate_trade_metrics("Long", 10000.0, "% of Account", 1.0, entry_price, stop_loss)
+        history.append("Long", 10000.0, "% of Account", 1.0, entry_price, stop_loss, metrics)
+    return app
+
+
+def _submit(app) -> None:
+    next(button for button in app.button if button.label == "Calculate").click()
+
+
+def scenarios() -> dict:
+    """Scenario name -> (history entries to preload, action before each timed run)."""
+    runs = {"empty form": (0, None), "submission": (0, _submit)}
+    runs.update({f"history {n}": (n, None) for n in HISTORY_SIZES})
+    return runs
+
+
+def time_scenario(history_entries: int, action, repeats: int, warmup: int, timeout: float) -> list[float]:
+    """
+    Time repeated app runs for one scenario.
+
+    Args:
+        history_entries (int): Entries to put in the session history before timing
+        action (Callable | None): Called with the AppTest before each run (e.g. a click)
+        repeats (int): Timed runs
+        warmup (int): Untimed runs first
+        timeout (float): Seconds a single run may take
+
+    Returns:
+        list[float]: Wall time of each timed run, in milliseconds
+
+    Raises:
+        RuntimeError: If the app raises an exception during a run
+    """
+    app = _load_app(history_entries, timeout)
+    timings = []
+    for run in range(warmup + repeats):
+        if action is not None:
+            action(app)
+        start = time.perf_counter()
+        app.run()
+        elapsed = (time.perf_counter() - start) * 1000
+        if app.exception:
+            raise RuntimeError(f"app.py raised during the benchmark: {app.exception[0].message}")
+        if run >= warmup:
+            timings.append(elapsed)
+    return timings
+
+
+def summarize(timings: list[float]) -> dict:
+    """Run count, mean and p50/p95/p99 of a list of timings in milliseconds."""
+    values = np.percentile(np.asarray(timings), PERCENTILES)
+    summary = {"runs": len(timings), "mean_ms": float(np.mean(timings))}
+    summary.update({f"p{q}_ms": float(v) for q, v in zip(PERCENTILES, values)})
+    return summary
+
+
+def run_benchmark(repeats: int, warmup: int, timeout: float, only: list[str] | None = None) -> dict:
+    """Run every scenario (or only the named ones) and return the report written by --save."""
+    import streamlit as st
+
+    os.environ.pop("RIZZK_HISTORY_DB", None)
+    report = {
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "streamlit": st.__version__,
+        "platform": platform.platform(),
+        "repeats": repeats,
+        "warmup": warmup,
+        "scenarios": {},
+    }
+    for name, (history_entries, action) in scenarios().items():
+        if only and name not in only:
+            continue
+        report["scenarios"][name] = summarize(time_scenario(history_entries, action, repeats, warmup, timeout))
+    return report
+
+
+def compare(report: dict, baseline: dict, tolerance: float) -> list[str]:
+    """
+    Scenarios whose p50 or p95 exceed the baseline by more than tolerance.
+
+    Args:
+        report (dict): Report from run_benchmark
+        baseline (dict): Earlier report, e.g. loaded from a --save file
+        tolerance (float): Allowed slowdown as a fraction (0.25 = 25% slower)
+
+    Returns:
+        list[str]: One message per regressed scenario and percentile
+    """
+    regressions = []
+    for name, current in report["scenarios"].items():
+        previous = baseline["scenarios"].get(name)
+        if previous is None:
+            continue
+        for key in ("p50_ms", "p95_ms"):
+            if current[key] > previous[key] * (1 + tolerance):
+                regressions.append(f"{name} {key[:-3]}: {previous[key]:.1f} ms -> {current[key]:.1f} ms")
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Time headless reruns of app.py per scenario.")
+    parser.add_argument("--repeats", type=int, default=30, help="Timed runs per scenario (default: 30)")
+    parser.add_argument("--warmup", type=int, default=3, help="Untimed runs first (default: 3)")
+    parser.add_argument("--timeout", type=float, default=30.0, help="Seconds a single run may take (default: 30)")
+    parser.add_argument("--scenario", action="append", choices=list(scenarios()), help="Only run this scenario (repeatable)")
+    parser.add_argument("--save", metavar="PATH", help="Write the report as JSON, for use as a baseline")
+    parser.add_argument("--baseline", metavar="PATH", help="Compare against a saved report; exit 1 on regressions")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed p50/p95 slowdown vs. the baseline (default: 0.25)")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args(argv)
+
+    report = run_benchmark(args.repeats, args.warmup, args.timeout, args.scenario)
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+            f.write("\n")
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print(f"{'scenario':<14}{'mean ms':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}" + (f"{'p50 vs base':>14}" if baseline else ""))
+        for name, row in report["scenarios"].items():
+            line = f"{name:<14}{row['mean_ms']:>10.1f}{row['p50_ms']:>10.1f}{row['p95_ms']:>10.1f}{row['p99_ms']:>10.1f}"
+            previous = baseline["scenarios"].get(name) if baseline else None
+            if previous:
+                line += f"{row['p50_ms'] / previous['p50_ms']:>13.2f}x"
+            print(line)
+
+    if baseline is None:
+        return 0
+    regressions = compare(report, baseline, args.tolerance)
+    for message in regressions:
+        print(f"REGRESSION {message}", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the RIZZK risk/reward bar chart.
+
+Times one chart render per approach, building the figure and handing it to
+Streamlit (run in bare mode, so the element is serialized but not sent):
+
+    python bench_chart.py
+    python bench_chart.py --repeats 200 --targets 1 2 3 5
+
+Approaches: "px" (Plotly Express from a DataFrame, the original code path),
+"template" (a reused styled figure with its bars swapped) and "native" (the
+low-latency Vega-Lite spec).
+"""
+
+import argparse
+import logging
+import statistics
+import sys
+import time
+
+from rizzk_charts import bar_chart_spec, bar_figure_template, fill_bar_figure, px_bar_figure
+
+
+def _time(render, values: list[list[float]], warmup: int) -> list[float]:
+    for run in range(warmup):
+        render(values[run % len(values)])
+    timings = []
+    for run_values in values:
+        start = time.perf_counter()
+        render(run_values)
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Time risk/reward bar chart renders per approach.")
+    parser.add_argument("--repeats", type=int, default=100, help="Timed renders per approach (default: 100)")
+    parser.add_argument("--warmup", type=int, default=10, help="Untimed renders first (default: 10)")
+    parser.add_argument("--targets", type=float, nargs="+", default=[1.0, 2.0], help="Profit target R multiples (default: 1 2)")
+    args = parser.parse_args(argv)
+
+    import streamlit as st
+    # Bare mode warns on every element; the benchmark only needs the serialization work.
+    # The first element call creates the warning loggers, so make one before silencing them.
+    st.empty()
+    for name in list(logging.root.manager.loggerDict):
+        if name.startswith("streamlit"):
+            logging.getLogger(name).setLevel(logging.ERROR)
+
+    labels = ["Risk"] + [f"{r:g}:1 Profit" for r in args.targets]
+    # Vary the risk amount so no approach can skip work on repeated values
+    values = [[100.0 + i] + [(100.0 + i) * r for r in args.targets] for i in range(args.repeats)]
+    template = bar_figure_template()
+    approaches = {
+        "px": lambda v: st.plotly_chart(px_bar_figure(labels, v), width="stretch"),
+        "template": lambda v: st.plotly_chart(fill_bar_figure(template, labels, v), width="stretch"),
+        "native": lambda v: st.vega_lite_chart(bar_chart_spec(labels, v), width="stretch"),
+    }
+
+    print(f"{'approach':<10}{'mean ms':>10}{'p50 ms':>10}{'p95 ms':>10}")
+    for name, render in approaches.items():
+        timings = sorted(_time(render, values, args.warmup))
+        p95 = timings[min(int(len(timings) * 0.95), len(timings) - 1)]
+        print(f"{name:<10}{statistics.fmean(timings):>10.2f}{statistics.median(timings):>10.2f}{p95:>10.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmarks for the RIZZK core math (rizzk_core).
+
+Measures calls/sec of every scalar function, for Long and Short setups, both
+risk modes and the error paths that raise ValueError, and rows/sec of the batch
+functions at 1e3 to 1e7 rows, and how calculate_trade_metrics_batch scales on
+rizzk_parallel's process pool:
+
+    python bench_core.py
+    python bench_core.py --sizes 1000 100000 --repeats 9
+    python bench_core.py --no-scalar --no-batch --sizes 1000000 10000000 --workers 1 2 4 8
+    python bench_core.py --save bench_core.json
+
+Every case is warmed up before it is timed. Scalar cases calibrate a loop count
+(as timeit does) so each timed repeat lasts about --min-time seconds; batch
+cases time one call per repeat. Figures are medians over the repeats, with the
+best repeat alongside, since the median is steadier on a busy machine.
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import timeit
+from datetime import datetime, timezone
+from typing import Callable
+
+import numpy as np
+
+from rizzk_core import (
+    calculate_percentage_moves,
+    calculate_profit_ladder,
+    calculate_profit_ladder_batch,
+    calculate_risk_reward,
+    calculate_risk_reward_batch,
+    calculate_risk_reward_ratio,
+    calculate_trade_metrics,
+    calculate_trade_metrics_batch,
+    describe_errors,
+    validate_risk_reward_batch,
+)
+from rizzk_parallel import ParallelBackend
+
+BATCH_SIZES = (1_000, 10_000, 100_000, 1_000_000, 10_000_000)
+WORKER_COUNTS = (1, 2, 4)
+LADDER_LEVELS = (0.5, 1.0, 2.0, 3.0)
+
+
+def _expect_error(function: Callable, *args) -> Callable[[], None]:
+    def call():
+        try:
+            function(*args)
+        except ValueError:
+            return
+        raise AssertionError(f"{function.__name__}{args} did not raise")
+    return call
+
+
+def scalar_cases() -> dict[str, Callable[[], object]]:
+    """Benchmark name -> zero-argument call, for every scalar function and error path."""
+    cases = {}
+    for position_type, entry, stop in (("Long", 100.0, 95.0), ("Short", 100.0, 105.0)):
+        for risk_mode, risk_input in (("% of Account", 1.0), ("Fixed $ Amount", 100.0)):
+            mode = "pct" if risk_mode == "% of Account" else "fixed"
+            args = (position_type, 10000.0, risk_mode, risk_input, entry, stop)
+            cases[f"calculate_risk_reward {position_type} {mode}"] = lambda args=args: calculate_risk_reward(*args)
+            cases[f"calculate_trade_metrics {position_type} {mode}"] = lambda args=args: calculate_trade_metrics(*args)
+        target = entry + (entry - stop)
+        cases[f"calculate_percentage_moves {position_type}"] = (
+            lambda e=entry, s=stop, t=target, p=position_type: calculate_percentage_moves(e, s, t, p)
+        )
+        cases[f"calculate_risk_reward_ratio {position_type}"] = (
+            lambda e=entry, s=stop, t=target, p=position_type: calculate_risk_reward_ratio(e, s, t, p)
+        )
+        cases[f"calculate_profit_ladder {position_type}"] = (
+            lambda e=entry, s=stop, p=position_type: calculate_profit_ladder(e, s, 20.0, LADDER_LEVELS, position_type=p)
+        )
+
+    # Error paths: the first check to fail decides how much work is done before raising
+    cases["error: account size"] = _expect_error(calculate_risk_reward, "Long", 0.0, "% of Account", 1.0, 100.0, 95.0)
+    cases["error: entry equals stop"] = _expect_error(calculate_risk_reward, "Long", 10000.0, "% of Account", 1.0, 100.0, 100.0)
+    cases["error: risk exceeds account"] = _expect_error(calculate_risk_reward, "Long", 10000.0, "Fixed $ Amount", 20000.0, 100.0, 95.0)
+    cases["error: long stop above entry"] = _expect_error(calculate_risk_reward, "Long", 10000.0, "% of Account", 1.0, 100.0, 105.0)
+    cases["error: short stop below entry"] = _expect_error(calculate_risk_reward, "Short", 10000.0, "% of Account", 1.0, 100.0, 95.0)
+    cases["error: position too large"] = _expect_error(calculate_risk_reward, "Long", 10000.0, "% of Account", 100.0, 100.0, 99.9999)
+    cases["error: trade_metrics"] = _expect_error(calculate_trade_metrics, "Short", 10000.0, "% of Account", 1.0, 100.0, 95.0)
+    return cases
+
+
+def batch_inputs(rows: int, invalid_fraction: float = 0.05, seed: int = 0) -> dict[str, np.ndarray]:
+    """
+    Random mixed trade setups for the batch functions.
+
+    Args:
+        rows (int): Number of setups
+        invalid_fraction (float): Share of rows with the stop on the wrong side
+        seed (int): Random seed, so every run sizes the same setups
+
+    Returns:
+        dict[str, np.ndarray]: Keyword arguments for calculate_risk_reward_batch
+    """
+    rng = np.random.default_rng(seed)
+    is_long = rng.random(rows) < 0.5
+    is_pct = rng.random(rows) < 0.5
+    entry = rng.uniform(5.0, 500.0, rows)
+    distance = entry * rng.uniform(0.005, 0.1, rows)
+    # Flip the stop to the wrong side on some rows so the error masking is exercised
+    side = np.where(is_long, -1.0, 1.0) * np.where(rng.random(rows) < invalid_fraction, -1.0, 1.0)
+    return {
+        "position_types": np.where(is_long, "Long", "Short"),
+        "account_sizes": rng.uniform(5_000.0, 100_000.0, rows),
+        "risk_modes": np.where(is_pct, "% of Account", "Fixed $ Amount"),
+        "risk_inputs": np.where(is_pct, rng.uniform(0.25, 2.0, rows), rng.uniform(50.0, 500.0, rows)),
+        "entry_prices": entry,
+        "stop_losses": entry + side * distance,
+    }
+
+
+def batch_cases(inputs: dict[str, np.ndarray]) -> dict[str, Callable[[], object]]:
+    """Benchmark name -> zero-argument call of every batch function on the same inputs."""
+    sized = calculate_risk_reward_batch(**inputs, errors="mask")
+    error_codes, _ = validate_risk_reward_batch(**inputs)
+    return {
+        "calculate_risk_reward_batch": lambda: calculate_risk_reward_batch(**inputs, errors="mask"),
+        "calculate_trade_metrics_batch": lambda: calculate_trade_metrics_batch(**inputs, errors="mask"),
+        "validate_risk_reward_batch": lambda: validate_risk_reward_batch(**inputs),
+        "describe_errors": lambda: describe_errors(error_codes),
+        "calculate_profit_ladder_batch": lambda: calculate_profit_ladder_batch(
+            inputs["entry_prices"], inputs["stop_losses"], sized.position_size, LADDER_LEVELS,
+            position_types=inputs["position_types"]
+        ),
+    }
+
+
+def time_scalar(call: Callable[[], object], repeats: int, min_time: float, warmup: float) -> dict:
+    """
+    Calls/sec of a scalar case.
+
+    Args:
+        call (Callable[[], object]): Case to time
+        repeats (int): Timed repeats
+        min_time (float): Seconds each repeat should last; sets the loop count
+        warmup (float): Seconds of untimed calls first
+
+    Returns:
+        dict: loops per repeat, median and best calls/sec, median microseconds per call
+    """
+    timer = timeit.Timer(call)
+    deadline = time.perf_counter() + warmup
+    while time.perf_counter() < deadline:
+        call()
+    loops, elapsed = timer.autorange()
+    loops = max(int(loops * min_time / max(elapsed, 1e-9)), 1)
+    per_call = np.asarray(timer.repeat(repeats, loops)) / loops
+    return {
+        "loops": loops,
+        "calls_per_sec": float(1 / np.median(per_call)),
+        "best_calls_per_sec": float(1 / per_call.min()),
+        "us_per_call": float(np.median(per_call) * 1e6),
+    }
+
+
+def time_batch(call: Callable[[], object], rows: int, repeats: int, warmup: int) -> dict:
+    """Rows/sec of a batch case: one call per repeat, after warmup untimed calls."""
+    for _ in range(warmup):
+        call()
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        call()
+        timings.append(time.perf_counter() - start)
+    timings = np.asarray(timings)
+    return {
+        "rows": rows,
+        "ms_per_call": float(np.median(timings) * 1000),
+        "rows_per_sec": float(rows / np.median(timings)),
+        "best_rows_per_sec": float(rows / timings.min()),
+    }
+
+
+def time_scaling(inputs: dict[str, np.ndarray], rows: int, workers: int, repeats: int, warmup: int) -> dict:
+    """
+    Rows/sec of calculate_trade_metrics_batch on a pool of workers processes.
+
+    One worker means the plain single-process function, the baseline the speedups
+    are measured against; the pool is started before the untimed warmup calls.
+    """
+    if workers == 1:
+        return time_batch(lambda: calculate_trade_metrics_batch(**inputs, errors="mask"), rows, repeats, warmup)
+    with ParallelBackend(workers) as backend:
+        return time_batch(lambda: backend.trade_metrics_batch(**inputs, errors="mask"), rows, repeats, max(warmup, 1))
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark rizzk_core scalar and batch throughput.")
+    parser.add_argument("--repeats", type=int, default=7, help="Timed repeats per case (default: 7)")
+    parser.add_argument("--min-time", type=float, default=0.1, help="Seconds per scalar repeat (default: 0.1)")
+    parser.add_argument("--warmup", type=float, default=0.05, help="Seconds of untimed scalar calls first (default: 0.05)")
+    parser.add_argument("--batch-warmup", type=int, default=1, help="Untimed batch calls first (default: 1)")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(BATCH_SIZES), help="Batch row counts (default: 1e3 to 1e7)")
+    parser.add_argument("--no-scalar", action="store_true", help="Skip the scalar cases")
+    parser.add_argument("--no-batch", action="store_true", help="Skip the batch cases")
+    parser.add_argument("--workers", type=int, nargs="+", default=list(WORKER_COUNTS), help="Process counts for the scaling cases; 1 (the baseline) always runs (default: 1 2 4)")
+    parser.add_argument("--no-parallel", action="store_true", help="Skip the process-pool scaling cases")
+    parser.add_argument("--save", metavar="PATH", help="Write the report as JSON")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args(argv)
+
+    report = {
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "repeats": args.repeats,
+        "scalar": {},
+        "batch": {},
+        "parallel": {},
+    }
+    if not args.no_scalar:
+        for name, call in scalar_cases().items():
+            report["scalar"][name] = time_scalar(call, args.repeats, args.min_time, args.warmup)
+    if not args.no_batch:
+        for rows in args.sizes:
+            cases = batch_cases(batch_inputs(rows))
+            for name, call in cases.items():
+                report["batch"].setdefault(name, []).append(time_batch(call, rows, args.repeats, args.batch_warmup))
+            del cases
+    if not args.no_parallel:
+        for rows in args.sizes:
+            inputs = batch_inputs(rows)
+            baseline = None
+            for workers in sorted(set(args.workers) | {1}):
+                row = time_scaling(inputs, rows, workers, args.repeats, args.batch_warmup)
+                baseline = baseline or row["rows_per_sec"]
+                row["speedup"] = row["rows_per_sec"] / baseline
+                report["parallel"].setdefault(str(workers), []).append(row)
+            del inputs
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+            f.write("\n")
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return 0
+
+    if report["scalar"]:
+        print(f"{'scalar case':<42}{'calls/sec':>14}{'best':>14}{'us/call':>10}")
+        for name, row in report["scalar"].items():
+            print(f"{name:<42}{row['calls_per_sec']:>14,.0f}{row['best_calls_per_sec']:>14,.0f}{row['us_per_call']:>10.2f}")
+    if report["batch"]:
+        print(f"\n{'batch case':<32}{'rows':>12}{'ms/call':>12}{'rows/sec':>16}")
+        for name, rows in report["batch"].items():
+            for row in rows:
+                print(f"{name:<32}{row['rows']:>12,}{row['ms_per_call']:>12.2f}{row['rows_per_sec']:>16,.0f}")
+    if report["parallel"]:
+        print(f"\n{'trade metrics workers':<32}{'rows':>12}{'ms/call':>12}{'rows/sec':>16}{'speedup':>10}  ({report['cpus']} CPUs)")
+        for workers, rows in report["parallel"].items():
+            for row in rows:
+                print(f"{workers:<32}{row['rows']:>12,}{row['ms_per_call']:>12.2f}{row['rows_per_sec']:>16,.0f}{row['speedup']:>9.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
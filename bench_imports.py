@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Import-time report for the RIZZK Streamlit app's cold start.
+
+Runs the module-level imports of app.py in a fresh interpreter under
+``python -X importtime`` and breaks the time down by top-level package, so the
+cost of each dependency on startup is visible:
+
+    python bench_imports.py
+    python bench_imports.py --include pandas --include plotly.express   # what lazy imports defer
+    python bench_imports.py --json > imports.json
+"""
+
+import argparse
+import ast
+import json
+import subprocess
+import sys
+from collections import defaultdict
+
+_MARKER = "--rizzk-imports--"
+
+
+def module_imports(path: str) -> list[str]:
+    """Return the source of every module-level import statement in a file."""
+    with open(path, encoding="utf-8") as f:
+        tree = ast.parse(f.read(), path)
+    return [ast.unparse(node) for node in tree.body if isinstance(node, (ast.Import, ast.ImportFrom))]
+
+
+def measure(statements: list[str]) -> list[tuple[str, int, int, int]]:
+    """
+    Run import statements in a fresh interpreter under -X importtime.
+
+    Returns:
+        list[tuple[str, int, int, int]]: (module, depth, self us, cumulative us) per
+                                         imported module, in import-completion order
+    """
+    code = f"import sys; sys.stderr.write({_MARKER!r} + '\\n')\n" + "\n".join(statements)
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code], capture_output=True, text=True, check=True
+    )
+    rows = []
+    started = False
+    for line in proc.stderr.splitlines():
+        if line == _MARKER:
+            started = True
+            continue
+        if not started or not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if not fields[0].strip().isdigit():
+            continue  # header row
+        name = fields[2].rstrip()
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        rows.append((name.strip(), depth, int(fields[0]), int(fields[1])))
+    return rows
+
+
+def summarize(rows: list[tuple[str, int, int, int]]) -> dict:
+    """Total time, self time per top-level package and cumulative time of each direct import."""
+    by_package = defaultdict(int)
+    for name, _, self_us, _ in rows:
+        by_package[name.split(".")[0]] += self_us
+    total_us = sum(by_package.values())
+    return {
+        "total_ms": total_us / 1000,
+        "packages": sorted(
+            ({"package": name, "ms": us / 1000, "share": us / total_us if total_us else 0.0}
+             for name, us in by_package.items()),
+            key=lambda row: row["ms"], reverse=True
+        ),
+        "direct": [
+            {"module": name, "cumulative_ms": cumulative / 1000}
+            for name, depth, _, cumulative in rows if depth == 0
+        ],
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Break down the app's import time by package.")
+    parser.add_argument("--file", default="app.py", help="Script whose module-level imports are measured (default: app.py)")
+    parser.add_argument("--include", action="append", default=[], metavar="MODULE", help="Also import MODULE (e.g. a lazily imported one)")
+    parser.add_argument("--top", type=int, default=15, help="Packages to list (default: 15)")
+    parser.add_argument("--json", action="store_true", help="Print the full report as JSON")
+    args = parser.parse_args(argv)
+
+    statements = module_imports(args.file) + [f"import {module}" for module in args.include]
+    report = summarize(measure(statements))
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return 0
+
+    print(f"Import time for {args.file}" + (f" + {', '.join(args.include)}" if args.include else "") + f": {report['total_ms']:.1f} ms")
+    print(f"\n{'package':<24}{'ms':>10}{'share':>9}")
+    for row in report["packages"][:args.top]:
+        print(f"{row['package']:<24}{row['ms']:>10.1f}{row['share']:>9.1%}")
+    print(f"\n{'direct import':<24}{'cumulative ms':>15}")
+    for row in report["direct"]:
+        print(f"{row['module']:<24}{row['cumulative_ms']:>15.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,407 @@
+#!/usr/bin/env python3
+"""
+Process-wide result cache for the RIZZK calculators.
+
+Streamlit reruns the whole script on every interaction, and every session on a
+server computes the same presets. The cached_* wrappers memoize the profit-ladder
+chart data on normalized inputs in RESULT_CACHE, which lives at module level and
+is therefore shared by all sessions in the process. Setting RIZZK_CACHE_DB puts
+a SQLite file behind it so several server processes share results too.
+RESULT_CACHE.stats() reports how much work that saves.
+
+The scalar calculators are deliberately not wrapped: they take 1-2 microseconds,
+less than a cache lookup, so memoizing them would only slow them down.
+"""
+
+import inspect
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+from typing import Callable, Hashable, Literal, NamedTuple
+
+from numpy.typing import ArrayLike
+
+from rizzk_core import ProfitLadder, calculate_profit_ladder
+
+DEFAULT_CACHE_SIZE = 1024
+DEFAULT_DISK_CACHE_SIZE = 100_000
+
+# Environment variables configuring RESULT_CACHE
+CACHE_SIZE_ENV = "RIZZK_CACHE_SIZE"  # in-memory entries; 0 disables caching
+CACHE_TTL_ENV = "RIZZK_CACHE_TTL"  # seconds an entry stays valid; unset = forever
+CACHE_DB_ENV = "RIZZK_CACHE_DB"  # SQLite file shared between processes; unset = memory only
+CACHE_DB_SIZE_ENV = "RIZZK_CACHE_DB_SIZE"  # entries kept in the SQLite file
+
+_MISSING = object()
+
+
+class CacheStats(NamedTuple):
+    """Snapshot of cache counters."""
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    size: int
+    maxsize: int
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class _Cache:
+    """get/put interface shared by the cache tiers."""
+
+    def get(self, key: Hashable, default=None):
+        raise NotImplementedError
+
+    def put(self, key: Hashable, value) -> None:
+        raise NotImplementedError
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], object]):
+        """Return the cached value for key, computing and storing it on a miss."""
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = compute()
+            self.put(key, value)
+        return value
+
+
+def _check_limits(maxsize: int, ttl: float | None) -> None:
+    if maxsize < 0:
+        raise ValueError("Cache size cannot be negative.")
+    if ttl is not None and ttl <= 0:
+        raise ValueError("Cache TTL must be greater than 0.")
+
+
+class LRUCache(_Cache):
+    """
+    Thread-safe least-recently-used cache with hit/miss/eviction counters.
+
+    Entries older than ttl seconds (if given) count as misses and are dropped.
+    Values are computed outside the lock, so two threads missing on the same key
+    may both compute it; the second result simply replaces the first.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_CACHE_SIZE, ttl: float | None = None):
+        _check_limits(maxsize, ttl)
+        self.maxsize = maxsize
+        self.ttl = ttl
+        # key -> (monotonic expiry time or None, value)
+        self._entries: OrderedDict[Hashable, tuple[float | None, object]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = self._misses = self._evictions = self._expirations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def get(self, key: Hashable, default=None):
+        """Return the cached value for key (marking it most recently used), else default."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] is not None and entry[0] <= time.monotonic():
+                del self._entries[key]
+                self._expirations += 1
+                entry = None
+            if entry is None:
+                self._misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[1]
+
+    def put(self, key: Hashable, value, ttl: float | None = None) -> None:
+        """
+        Store value, evicting the least recently used entries beyond maxsize.
+
+        Args:
+            key (Hashable): Cache key
+            value: Value to store
+            ttl (float | None): Seconds this entry stays valid, capped at the cache's own ttl;
+                                None uses the cache's ttl (e.g. the time a disk entry has left)
+        """
+        if self.maxsize == 0:
+            return
+        if ttl is None or (self.ttl is not None and self.ttl < ttl):
+            ttl = self.ttl
+        expires = time.monotonic() + ttl if ttl is not None else None
+        with self._lock:
+            self._entries[key] = (expires, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                self._hits, self._misses, self._evictions, self._expirations, len(self._entries), self.maxsize
+            )
+
+    def clear(self) -> None:
+        """Drop every entry and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = self._evictions = self._expirations = 0
+
+
+class SQLiteCache(_Cache):
+    """
+    Result cache in a SQLite file, shareable between processes on one host.
+
+    Values are pickled, so only point it at a file this deployment owns. Each
+    thread gets its own connection; WAL mode lets readers run alongside a writer.
+    Counters are per process.
+
+    Writes don't clean up after themselves one row at a time: expired rows are
+    purged every purge_interval seconds, and once the table grows a tenth past
+    maxsize the least recently used rows are evicted back down to maxsize in one
+    batch. Expired rows are never returned in between.
+    """
+
+    purge_interval = 60.0
+
+    def __init__(self, path: str, maxsize: int = DEFAULT_DISK_CACHE_SIZE, ttl: float | None = None):
+        _check_limits(maxsize, ttl)
+        self.path = path
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._hits = self._misses = self._evictions = self._expirations = 0
+        with self._connection() as db:
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS results "
+                "(key TEXT PRIMARY KEY, value BLOB NOT NULL, expires REAL, accessed REAL NOT NULL)"
+            )
+            db.execute("CREATE INDEX IF NOT EXISTS results_accessed ON results (accessed)")
+            db.execute("CREATE INDEX IF NOT EXISTS results_expires ON results (expires)")
+            # Rows written since the last clean-up, by any process, are only counted by the next one
+            self._rows = db.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+        self._high_water = maxsize + maxsize // 10
+        self._next_purge = time.time() + self.purge_interval
+
+    def _connection(self) -> sqlite3.Connection:
+        db = getattr(self._local, "db", None)
+        if db is None:
+            db = sqlite3.connect(self.path, timeout=30)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            self._local.db = db
+        return db
+
+    def _count(self, **counters: int) -> None:
+        with self._lock:
+            for name, n in counters.items():
+                setattr(self, f"_{name}", getattr(self, f"_{name}") + n)
+
+    def get(self, key: Hashable, default=None):
+        """Return the cached value for key (refreshing its access time), else default."""
+        return self.get_with_expiry(key, default)[0]
+
+    def get_with_expiry(self, key: Hashable, default=None) -> tuple[object, float | None]:
+        """Return (value, expiry as a time.time() timestamp or None) for key, else (default, None)."""
+        db = self._connection()
+        now = time.time()
+        row = db.execute("SELECT value, expires FROM results WHERE key = ?", (repr(key),)).fetchone()
+        if row is not None and row[1] is not None and row[1] <= now:
+            with db:
+                db.execute("DELETE FROM results WHERE key = ?", (repr(key),))
+            self._count(expirations=1)
+            row = None
+        if row is None:
+            self._count(misses=1)
+            return default, None
+        with db:
+            db.execute("UPDATE results SET accessed = ? WHERE key = ?", (now, repr(key)))
+        self._count(hits=1)
+        return pickle.loads(row[0]), row[1]
+
+    def put(self, key: Hashable, value) -> None:
+        """Store value; purges expired rows and evicts least recently used ones when due."""
+        if self.maxsize == 0:
+            return
+        db = self._connection()
+        now = time.time()
+        expires = now + self.ttl if self.ttl is not None else None
+        with db:
+            db.execute(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?)",
+                (repr(key), pickle.dumps(value, pickle.HIGHEST_PROTOCOL), expires, now)
+            )
+        with self._lock:
+            # Replacing an existing key overcounts; the clean-up recounts
+            self._rows += 1
+            due = self._rows > self._high_water or now >= self._next_purge
+            if due:
+                self._next_purge = now + self.purge_interval
+        if due:
+            self._clean_up(db, now)
+
+    def _clean_up(self, db: sqlite3.Connection, now: float) -> None:
+        """Purge expired rows, then evict least recently used rows beyond maxsize."""
+        with db:
+            expired = db.execute("DELETE FROM results WHERE expires <= ?", (now,)).rowcount
+            rows = db.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+            evicted = 0
+            if rows > self.maxsize:
+                evicted = db.execute(
+                    "DELETE FROM results WHERE key IN (SELECT key FROM results ORDER BY accessed LIMIT ?)",
+                    (rows - self.maxsize,)
+                ).rowcount
+        with self._lock:
+            self._rows = rows - evicted
+        self._count(expirations=expired, evictions=evicted)
+
+    def __len__(self) -> int:
+        return self._connection().execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+    def stats(self) -> CacheStats:
+        size = len(self)
+        with self._lock:
+            return CacheStats(self._hits, self._misses, self._evictions, self._expirations, size, self.maxsize)
+
+    def clear(self) -> None:
+        """Drop every row (for all processes) and reset this process's counters."""
+        with self._connection() as db:
+            db.execute("DELETE FROM results")
+        with self._lock:
+            self._rows = 0
+            self._hits = self._misses = self._evictions = self._expirations = 0
+
+
+class TieredCache(_Cache):
+    """
+    An in-memory LRU in front of a shared SQLiteCache.
+
+    Disk hits are promoted into memory for the time the disk entry has left, so
+    a value never outlives the TTL it was written with; new values are written
+    to both tiers.
+    """
+
+    def __init__(self, memory: LRUCache, disk: SQLiteCache):
+        self.memory = memory
+        self.disk = disk
+
+    def __len__(self) -> int:
+        return len(self.disk)
+
+    def get(self, key: Hashable, default=None):
+        value = self.memory.get(key, _MISSING)
+        if value is _MISSING:
+            value, expires = self.disk.get_with_expiry(key, _MISSING)
+            if value is _MISSING:
+                return default
+            self.memory.put(key, value, None if expires is None else expires - time.time())
+        return value
+
+    def put(self, key: Hashable, value) -> None:
+        self.memory.put(key, value)
+        self.disk.put(key, value)
+
+    def stats(self) -> CacheStats:
+        """Combined counters: a lookup misses only if neither tier has the key."""
+        memory, disk = self.memory.stats(), self.disk.stats()
+        return CacheStats(
+            memory.hits + disk.hits, disk.misses, disk.evictions,
+            memory.expirations + disk.expirations, disk.size, disk.maxsize
+        )
+
+    def clear(self) -> None:
+        self.memory.clear()
+        self.disk.clear()
+
+
+def _number_from_env(name: str, default: float | None, cast: Callable = int) -> float | None:
+    try:
+        value = cast(os.environ[name])
+    except (KeyError, ValueError):
+        return default
+    return value if value >= 0 else default
+
+
+def cache_size_from_env(default: int = DEFAULT_CACHE_SIZE) -> int:
+    """Read the cache size from RIZZK_CACHE_SIZE, falling back to default if unset or invalid."""
+    return _number_from_env(CACHE_SIZE_ENV, default)
+
+
+def build_result_cache() -> LRUCache | TieredCache:
+    """
+    Build the cache described by the RIZZK_CACHE_* environment variables: an
+    LRUCache, backed by a SQLiteCache when RIZZK_CACHE_DB names a file.
+    """
+    ttl = _number_from_env(CACHE_TTL_ENV, None, float) or None
+    memory = LRUCache(cache_size_from_env(), ttl)
+    path = os.environ.get(CACHE_DB_ENV)
+    if not path:
+        return memory
+    return TieredCache(memory, SQLiteCache(path, _number_from_env(CACHE_DB_SIZE_ENV, DEFAULT_DISK_CACHE_SIZE), ttl))
+
+
+def _normalize(value) -> Hashable:
+    # 100, 100.0 and np.float64(100) share a key; -0.0 folds into 0.0
+    if type(value) is float:
+        return value + 0.0
+    if value is None or isinstance(value, str):
+        return value
+    if isinstance(value, (list, tuple)) or getattr(value, "ndim", 0) > 0:
+        return tuple(_normalize(item) for item in value)
+    return float(value) + 0.0
+
+
+def memoize(cache: _Cache) -> Callable[[Callable], Callable]:
+    """
+    Decorator caching a function's results in cache, keyed on its name and normalized
+    arguments (defaults filled in). Exceptions are not cached, so invalid inputs raise
+    every time.
+
+    Positional calls pad the arguments with the defaults directly; only calls with
+    keyword arguments go through inspect.Signature.bind, which costs several
+    microseconds. Even so, a hit costs a few microseconds (more with a SQLite
+    tier), so only wrap functions that take clearly longer than that.
+    """
+    def decorator(func: Callable) -> Callable:
+        signature = inspect.signature(func)
+        parameters = signature.parameters.values()
+        defaults = tuple(parameter.default for parameter in parameters)
+        required = sum(parameter.default is parameter.empty for parameter in parameters)
+        positional_only = all(parameter.kind is parameter.POSITIONAL_OR_KEYWORD for parameter in parameters)
+        name = func.__name__
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not kwargs and positional_only and required <= len(args) <= len(defaults):
+                args += defaults[len(args):]
+            else:
+                bound = signature.bind(*args, **kwargs)
+                bound.apply_defaults()
+                args = bound.args
+            key = (name,) + tuple(map(_normalize, args))
+            return cache.get_or_compute(key, lambda: func(*args))
+        return wrapper
+    return decorator
+
+
+# Shared by every wrapper below (and every session), so its stats cover all cached calculations
+RESULT_CACHE = build_result_cache()
+
+
+@memoize(RESULT_CACHE)
+def cached_profit_ladder(
+    entry_price: float,
+    stop_loss: float,
+    position_size: float,
+    r_multiples: ArrayLike,
+    weights: ArrayLike | None = None,
+    position_type: Literal["Long", "Short"] = "Long"
+) -> ProfitLadder:
+    """Memoized calculate_profit_ladder. The arrays are shared between callers; don't modify them."""
+    return calculate_profit_ladder(entry_price, stop_loss, position_size, r_multiples, weights, position_type)
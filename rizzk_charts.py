@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Chart builders for the RIZZK risk/reward bar chart.
+
+Plotly Express rebuilds and validates a whole figure on every call. Instead,
+the app keeps one styled figure per session (bar_figure_template) and only
+swaps the bar values (fill_bar_figure). bar_chart_spec is a plain Vega-Lite
+spec for low-latency mode, needing neither Plotly nor pandas. Plotly is
+imported lazily so importing this module is free.
+"""
+
+BAR_COLOR = "#FFD700"
+
+
+def px_bar_figure(labels: list[str], values: list[float]):
+    """Build the chart with Plotly Express from a DataFrame, as the app originally did (for comparison)."""
+    import pandas as pd
+    import plotly.express as px
+
+    chart_data = pd.DataFrame({"Scenario": labels, "Amount": values})
+    return px.bar(chart_data, x="Scenario", y="Amount", color_discrete_sequence=[BAR_COLOR] * len(chart_data))
+
+
+def bar_figure_template():
+    """Return an empty bar figure styled like px_bar_figure's output, to be filled by fill_bar_figure."""
+    import plotly.graph_objects as go
+
+    figure = go.Figure(go.Bar(
+        x=[], y=[], marker_color=BAR_COLOR, hovertemplate="Scenario=%{x}<br>Amount=%{y}<extra></extra>"
+    ))
+    figure.update_layout(
+        xaxis_title_text="Scenario", yaxis_title_text="Amount", barmode="relative", margin_t=60
+    )
+    return figure
+
+
+def fill_bar_figure(figure, labels: list[str], values: list[float]):
+    """Swap the bars of a bar_figure_template figure in place and return it."""
+    figure.data[0].update(x=labels, y=values)
+    return figure
+
+
+def bar_chart_spec(labels: list[str], values: list[float]) -> dict:
+    """Vega-Lite spec for st.vega_lite_chart, with the data inline and bars in the given order."""
+    return {
+        "data": {"values": [{"Scenario": label, "Amount": value} for label, value in zip(labels, values)]},
+        "mark": {"type": "bar", "color": BAR_COLOR},
+        "encoding": {
+            "x": {"field": "Scenario", "type": "nominal", "sort": None, "axis": {"labelAngle": 0}},
+            "y": {"field": "Amount", "type": "quantitative"},
+        },
+    }
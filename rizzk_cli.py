@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Command-line trade-plan sizer for the RIZZK Risk-to-Reward Calculator.
+
+Streams CSV/NDJSON/Parquet/Arrow plan rows through the batch engine in
+fixed-size chunks:
+
+    python rizzk_cli.py plan.csv > sized.csv
+    cat plan.ndjson | python rizzk_cli.py --format ndjson --account-size 25000 -
+    python rizzk_cli.py plan.parquet -o sized.arrow
+    python rizzk_cli.py plan.csv --write-plan plan.rzk       # convert once...
+    python rizzk_cli.py plan.rzk -o sized.csv                # ...then size it from a memory map
+    python rizzk_cli.py plan.rzk --workers 4 --chunk-size 1000000 -o sized.arrow
+"""
+
+import argparse
+import sys
+import time
+from contextlib import nullcontext
+
+from rizzk_io import (
+    FORMATS,
+    PLAN_FORMATS,
+    PlanWriter,
+    detect_format,
+    read_plan_chunks,
+    size_plan_columns,
+    write_binary_plan,
+)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="rizzk",
+        description="Size every row of a trade-plan file. Results and error codes go to stdout.",
+    )
+    parser.add_argument("input", nargs="?", default="-", help="Plan file, or - for stdin (default)")
+    parser.add_argument("-o", "--output", default="-", help="Output file, or - for stdout (default)")
+    parser.add_argument("-f", "--format", choices=PLAN_FORMATS, help="Input format (default: from extension, else csv)")
+    parser.add_argument("--output-format", choices=FORMATS, help="Output format (default: same as input)")
+    parser.add_argument("--write-plan", metavar="PATH", help="Convert the plan to the binary .rzk format instead of sizing it")
+    parser.add_argument("--chunk-size", type=int, default=100_000, help="Rows per chunk (default: 100000)")
+    parser.add_argument("--workers", type=int, default=1, help="Worker processes that share each chunk's sizing (default: 1, no pool; 0: one per CPU)")
+    parser.add_argument("--account-size", type=float, help="Account size for plans without an account_size column")
+    parser.add_argument("--risk-mode", choices=["% of Account", "Fixed $ Amount"], help="Risk mode for plans without a risk_mode column")
+    parser.add_argument("--risk-input", type=float, help="Risk %% or $ for plans without a risk_input column")
+    parser.add_argument("-q", "--quiet", action="store_true", help="Don't report throughput on stderr")
+    return parser
+
+
+def _backend(workers: int):
+    """A process pool for --workers other than 1, else a context that yields None."""
+    if workers == 1:
+        return nullcontext()
+    # Imported here so single-process runs don't pay for the pool machinery
+    from rizzk_parallel import ParallelBackend
+    return ParallelBackend(workers or None)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    if args.chunk_size <= 0:
+        print("rizzk: --chunk-size must be greater than 0", file=sys.stderr)
+        return 2
+    if args.workers < 0:
+        print("rizzk: --workers must be 0 or more", file=sys.stderr)
+        return 2
+    input_format = args.format or detect_format(args.input)
+    default_output = input_format if input_format in FORMATS else "csv"
+    output_format = args.output_format or (detect_format(args.output, default_output) if args.output != "-" else default_output)
+    defaults = {"account_size": args.account_size, "risk_mode": args.risk_mode, "risk_input": args.risk_input}
+
+    if args.write_plan:
+        try:
+            records = write_binary_plan(args.write_plan, read_plan_chunks(args.input, input_format, args.chunk_size), defaults)
+        except (ImportError, OSError, ValueError) as e:
+            print(f"rizzk: {e}", file=sys.stderr)
+            return 1
+        if not args.quiet:
+            print(f"rizzk: wrote {records:,} plan rows to {args.write_plan}", file=sys.stderr)
+        return 0
+
+    rows = errors = 0
+    start = time.perf_counter()
+    try:
+        with _backend(args.workers) as backend, PlanWriter(args.output, output_format) as writer:
+            for chunk in read_plan_chunks(args.input, input_format, args.chunk_size):
+                sized = size_plan_columns(chunk, defaults, backend)
+                writer.write(sized)
+                rows += len(sized["error_code"])
+                errors += int((sized["error_code"] != 0).sum())
+    except (ImportError, OSError, ValueError) as e:
+        print(f"rizzk: {e}", file=sys.stderr)
+        return 1
+    elapsed = time.perf_counter() - start
+
+    if not args.quiet:
+        rate = rows / elapsed if elapsed > 0 else float("inf")
+        print(f"rizzk: sized {rows:,} rows ({errors:,} invalid) in {elapsed:.2f}s - {rate:,.0f} rows/sec", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
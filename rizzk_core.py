@@ -4,7 +4,60 @@ Core calculation functions for the RIZZK Risk-to-Reward Calculator.
 Centralized math logic for position sizing and risk management.
 """
 
-from typing import Literal
+from typing import Literal, NamedTuple
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+POSITION_TYPES = ("Long", "Short")
+RISK_MODES = ("% of Account", "Fixed $ Amount")
+
+# Positions above this many shares mean the stop is effectively at entry.
+MAX_POSITION_SIZE = 1_000_000
+
+# Validation error codes, numbered in the order calculate_risk_reward checks them.
+ERR_OK = 0
+ERR_ACCOUNT_SIZE = 1
+ERR_ENTRY_PRICE = 2
+ERR_STOP_LOSS = 3
+ERR_ENTRY_EQUALS_STOP = 4
+ERR_RISK_PERCENTAGE = 5
+ERR_RISK_AMOUNT = 6
+ERR_RISK_EXCEEDS_ACCOUNT = 7
+ERR_LONG_STOP_ABOVE_ENTRY = 8
+ERR_SHORT_STOP_BELOW_ENTRY = 9
+ERR_POSITION_TOO_LARGE = 10
+# Only raised for free-text inputs (trade-plan files); the typed API takes the labels as given
+ERR_POSITION_TYPE = 11
+ERR_RISK_MODE = 12
+ERR_NOT_A_NUMBER = 13
+
+ERROR_MESSAGES: dict[int, str] = {
+    ERR_OK: "",
+    ERR_ACCOUNT_SIZE: "Account size must be greater than 0.",
+    ERR_ENTRY_PRICE: "Entry price must be greater than 0.",
+    ERR_STOP_LOSS: "Stop loss price must be greater than 0.",
+    ERR_ENTRY_EQUALS_STOP: "Entry price and stop loss cannot be the same.",
+    ERR_RISK_PERCENTAGE: "Risk percentage must be between 0 and 100.",
+    ERR_RISK_AMOUNT: "Risk amount must be greater than 0.",
+    ERR_RISK_EXCEEDS_ACCOUNT: "Risk amount cannot exceed account size.",
+    ERR_LONG_STOP_ABOVE_ENTRY: "Entry price must be higher than stop loss for long positions.",
+    ERR_SHORT_STOP_BELOW_ENTRY: "Entry price must be lower than stop loss for short positions.",
+    ERR_POSITION_TOO_LARGE: "Your stop is basically at entry. That's not a trade, that's a wish.",
+    ERR_POSITION_TYPE: "Position type must be Long or Short.",
+    ERR_RISK_MODE: "Risk mode must be '% of Account' or 'Fixed $ Amount'.",
+    ERR_NOT_A_NUMBER: "Account size, risk, entry and stop must be numbers.",
+}
+
+
+class TradeResult(NamedTuple):
+    """Outputs of calculate_risk_reward; unpacks like the original 6-tuple."""
+    position_size: float
+    position_size_rounded: int
+    risk_amount: float
+    profit_1_1: float
+    profit_2_1: float
+    stop_loss_amount: float
 
 
 def calculate_risk_reward(
@@ -14,7 +67,7 @@ def calculate_risk_reward(
     risk_input: float,
     entry_price: float,
     stop_loss: float
-) -> tuple[float, float, float, float, float, float]:
+) -> TradeResult:
     """
     Calculate position size, risk amount, and profit targets.
 
@@ -28,56 +81,58 @@ def calculate_risk_reward(
         stop_loss (float): Stop loss price
 
     Returns:
-        tuple[float, float, float, float, float, float]: (position_size, position_size_rounded, 
-                                                          risk_amount, profit_1_1, profit_2_1, stop_loss_amount)
+        TradeResult: (position_size, position_size_rounded, risk_amount,
+                      profit_1_1, profit_2_1, stop_loss_amount)
 
     Raises:
         ValueError: If inputs are invalid
     """
     if account_size <= 0:
-        raise ValueError("Account size must be greater than 0.")
+        raise ValueError(ERROR_MESSAGES[ERR_ACCOUNT_SIZE])
     if entry_price <= 0:
-        raise ValueError("Entry price must be greater than 0.")
+        raise ValueError(ERROR_MESSAGES[ERR_ENTRY_PRICE])
     if stop_loss <= 0:
-        raise ValueError("Stop loss price must be greater than 0.")
+        raise ValueError(ERROR_MESSAGES[ERR_STOP_LOSS])
     if entry_price == stop_loss:
-        raise ValueError("Entry price and stop loss cannot be the same.")
+        raise ValueError(ERROR_MESSAGES[ERR_ENTRY_EQUALS_STOP])
     
     # Calculate risk amount based on mode
     if risk_mode == "% of Account":
         if risk_input <= 0 or risk_input > 100:
-            raise ValueError("Risk percentage must be between 0 and 100.")
+            raise ValueError(ERROR_MESSAGES[ERR_RISK_PERCENTAGE])
         risk_amount = account_size * (risk_input / 100)
     else:  # Fixed $ Amount
         if risk_input <= 0:
-            raise ValueError("Risk amount must be greater than 0.")
+            raise ValueError(ERROR_MESSAGES[ERR_RISK_AMOUNT])
         if risk_input > account_size:
-            raise ValueError("Risk amount cannot exceed account size.")
+            raise ValueError(ERROR_MESSAGES[ERR_RISK_EXCEEDS_ACCOUNT])
         risk_amount = risk_input
 
     if position_type == "Long":
         if entry_price <= stop_loss:
-            raise ValueError("Entry price must be higher than stop loss for long positions.")
+            raise ValueError(ERROR_MESSAGES[ERR_LONG_STOP_ABOVE_ENTRY])
         position_size = risk_amount / (entry_price - stop_loss)
         stop_loss_amount = position_size * (entry_price - stop_loss)
         profit_1_1 = entry_price + (entry_price - stop_loss)
         profit_2_1 = entry_price + 2 * (entry_price - stop_loss)
     else:  # Short
         if entry_price >= stop_loss:
-            raise ValueError("Entry price must be lower than stop loss for short positions.")
+            raise ValueError(ERROR_MESSAGES[ERR_SHORT_STOP_BELOW_ENTRY])
         position_size = risk_amount / (stop_loss - entry_price)
         stop_loss_amount = position_size * (stop_loss - entry_price)
         profit_1_1 = entry_price - (stop_loss - entry_price)
         profit_2_1 = entry_price - 2 * (stop_loss - entry_price)
 
     # Check for insane position sizes (stop loss too close to entry)
-    if position_size > 1_000_000:
-        raise ValueError("Your stop is basically at entry. That's not a trade, that's a wish.")
+    if position_size > MAX_POSITION_SIZE:
+        raise ValueError(ERROR_MESSAGES[ERR_POSITION_TOO_LARGE])
 
     # Calculate rounded position size (most brokers don't accept fractional shares)
     position_size_rounded = int(position_size)
 
-    return position_size, position_size_rounded, risk_amount, profit_1_1, profit_2_1, stop_loss_amount
+    return TradeResult(position_size, position_size_rounded, risk_amount, profit_1_1, profit_2_1, stop_loss_amount)
+
+
 def calculate_percentage_moves(entry_price: float, stop_loss: float, profit_1_1: float, position_type: Literal["Long", "Short"] = "Long") -> tuple[float, float]:
     """
     Calculate percentage moves for stop loss and profit targets.
@@ -121,4 +176,533 @@ def calculate_risk_reward_ratio(entry_price: float, stop_loss: float, profit_tar
         risk = stop_loss - entry_price
         reward = entry_price - profit_target
 
-    return reward / risk if risk != 0 else 0
\ No newline at end of file
+    return reward / risk if risk != 0 else 0
+
+
+
+# Batch kernel API: the unchecked building blocks of the batch functions, for sibling
+# modules (sweeps, process-pool shards) that need intermediate arrays or their own sharding.
+
+class KernelResult(NamedTuple):
+    """Unchecked batch sizing; invalid rows hold garbage until apply_batch_errors masks them.
+
+    distance is the entry-to-stop risk per share on the correct side of the trade.
+    """
+    sizing: list[np.ndarray]  # [position_size, risk_amount, profit_1_1, profit_2_1, stop_loss_amount]
+    is_long: np.ndarray
+    entry: np.ndarray
+    distance: np.ndarray
+    error_codes: np.ndarray
+
+
+def broadcast_batch_inputs(
+    position_types: ArrayLike,
+    account_sizes: ArrayLike,
+    risk_modes: ArrayLike,
+    risk_inputs: ArrayLike,
+    entry_prices: ArrayLike,
+    stop_losses: ArrayLike
+) -> list[np.ndarray]:
+    """
+    Normalize batch arguments to broadcast arrays for risk_reward_flags_kernel.
+
+    Args:
+        position_types (ArrayLike): "Long" or "Short" per row
+        account_sizes (ArrayLike): Total account size in dollars per row
+        risk_modes (ArrayLike): "% of Account" or "Fixed $ Amount" per row
+        risk_inputs (ArrayLike): Risk percentage or fixed risk amount per row
+        entry_prices (ArrayLike): Entry price per row
+        stop_losses (ArrayLike): Stop loss price per row
+
+    Returns:
+        list[np.ndarray]: (is_long, account, is_pct, risk_input, entry, stop), all one shape
+    """
+    return np.broadcast_arrays(
+        np.asarray(position_types) == "Long",
+        np.asarray(account_sizes, dtype=np.float64),
+        np.asarray(risk_modes) == "% of Account",
+        np.asarray(risk_inputs, dtype=np.float64),
+        np.asarray(entry_prices, dtype=np.float64),
+        np.asarray(stop_losses, dtype=np.float64),
+    )
+
+
+def _batch_error_codes(
+    is_long: np.ndarray,
+    account: np.ndarray,
+    is_pct: np.ndarray,
+    risk_input: np.ndarray,
+    entry: np.ndarray,
+    stop: np.ndarray,
+    position_size: np.ndarray
+) -> np.ndarray:
+    """Per-row error code of the first rule calculate_risk_reward would reject, else ERR_OK."""
+    conditions = [
+        ~(account > 0),
+        ~(entry > 0),
+        ~(stop > 0),
+        entry == stop,
+        is_pct & ~((risk_input > 0) & (risk_input <= 100)),
+        ~is_pct & ~(risk_input > 0),
+        ~is_pct & (risk_input > account),
+        is_long & ~(entry > stop),
+        ~is_long & ~(entry < stop),
+        position_size > MAX_POSITION_SIZE,
+    ]
+    codes = [
+        ERR_ACCOUNT_SIZE,
+        ERR_ENTRY_PRICE,
+        ERR_STOP_LOSS,
+        ERR_ENTRY_EQUALS_STOP,
+        ERR_RISK_PERCENTAGE,
+        ERR_RISK_AMOUNT,
+        ERR_RISK_EXCEEDS_ACCOUNT,
+        ERR_LONG_STOP_ABOVE_ENTRY,
+        ERR_SHORT_STOP_BELOW_ENTRY,
+        ERR_POSITION_TOO_LARGE,
+    ]
+    # np.select picks the first matching condition, mirroring the scalar check order.
+    return np.select(conditions, codes, default=ERR_OK).astype(np.int8)
+
+
+def validate_risk_reward_batch(
+    position_types: ArrayLike,
+    account_sizes: ArrayLike,
+    risk_modes: ArrayLike,
+    risk_inputs: ArrayLike,
+    entry_prices: ArrayLike,
+    stop_losses: ArrayLike
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Check every calculate_risk_reward rule for each row without raising.
+
+    Args:
+        position_types (ArrayLike): "Long" or "Short" per row
+        account_sizes (ArrayLike): Total account size in dollars per row
+        risk_modes (ArrayLike): "% of Account" or "Fixed $ Amount" per row
+        risk_inputs (ArrayLike): Risk percentage or fixed risk amount per row
+        entry_prices (ArrayLike): Entry price per row
+        stop_losses (ArrayLike): Stop loss price per row
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: (error_codes, valid) where error_codes holds one
+                                       ERR_* code per row and valid is error_codes == ERR_OK
+    """
+    error_codes = risk_reward_kernel(
+        position_types, account_sizes, risk_modes, risk_inputs, entry_prices, stop_losses
+    )[-1]
+    return error_codes, error_codes == ERR_OK
+
+
+def describe_errors(error_codes: ArrayLike) -> np.ndarray:
+    """
+    Map error codes to the messages calculate_risk_reward raises.
+
+    Args:
+        error_codes (ArrayLike): ERR_* codes, e.g. from validate_risk_reward_batch
+
+    Returns:
+        np.ndarray: Message per code, empty string for ERR_OK
+    """
+    messages = np.array([ERROR_MESSAGES[code] for code in sorted(ERROR_MESSAGES)], dtype=object)
+    return messages[np.asarray(error_codes)]
+
+
+def risk_reward_kernel(
+    position_types: ArrayLike,
+    account_sizes: ArrayLike,
+    risk_modes: ArrayLike,
+    risk_inputs: ArrayLike,
+    entry_prices: ArrayLike,
+    stop_losses: ArrayLike
+) -> KernelResult:
+    """
+    Unchecked batch sizing shared by the batch functions; never raises on bad rows.
+
+    Arguments broadcast the same way as calculate_risk_reward_batch.
+
+    Returns:
+        KernelResult: Sizing columns, the normalized is_long / entry / distance arrays
+                      and the per-row ERR_* codes
+    """
+    return risk_reward_flags_kernel(*broadcast_batch_inputs(
+        position_types, account_sizes, risk_modes, risk_inputs, entry_prices, stop_losses
+    ))
+
+
+def risk_reward_flags_kernel(
+    is_long: np.ndarray,
+    account: np.ndarray,
+    is_pct: np.ndarray,
+    risk_input: np.ndarray,
+    entry: np.ndarray,
+    stop: np.ndarray
+) -> KernelResult:
+    """risk_reward_kernel over arrays from broadcast_batch_inputs, e.g. one shard of them."""
+    risk_amount = np.where(is_pct, account * (risk_input / 100), risk_input)
+    distance = np.where(is_long, entry - stop, stop - entry)
+    # Invalid rows may divide by zero; they are flagged by the error codes below.
+    with np.errstate(divide="ignore", invalid="ignore"):
+        position_size = risk_amount / distance
+        stop_loss_amount = position_size * distance
+    profit_1_1 = np.where(is_long, entry + distance, entry - distance)
+    profit_2_1 = np.where(is_long, entry + 2 * distance, entry - 2 * distance)
+
+    error_codes = _batch_error_codes(is_long, account, is_pct, risk_input, entry, stop, position_size)
+    sizing = [position_size, risk_amount, profit_1_1, profit_2_1, stop_loss_amount]
+    return KernelResult(sizing, is_long, entry, distance, error_codes)
+
+
+def apply_batch_errors(
+    columns: list[np.ndarray],
+    error_codes: np.ndarray,
+    errors: Literal["raise", "mask"]
+) -> list[np.ndarray]:
+    """
+    Apply a batch function's errors policy to kernel output.
+
+    Args:
+        columns (list[np.ndarray]): Float columns, e.g. KernelResult.sizing
+        error_codes (np.ndarray): Per-row ERR_* codes from the kernel
+        errors (Literal["raise", "mask"]): "raise" or "mask", as in calculate_risk_reward_batch
+
+    Returns:
+        list[np.ndarray]: The columns, with invalid rows set to NaN when masking
+
+    Raises:
+        ValueError: If errors is "raise" and any row is invalid
+    """
+    valid = error_codes == ERR_OK
+    if valid.all():
+        return columns
+    if errors == "raise":
+        row = np.unravel_index(np.argmin(valid), valid.shape)
+        index = row[0] if len(row) == 1 else row
+        raise ValueError(f"Row {index}: {ERROR_MESSAGES[int(error_codes[row])]}")
+    return [np.where(valid, column, np.nan) for column in columns]
+
+
+def calculate_risk_reward_batch(
+    position_types: ArrayLike,
+    account_sizes: ArrayLike,
+    risk_modes: ArrayLike,
+    risk_inputs: ArrayLike,
+    entry_prices: ArrayLike,
+    stop_losses: ArrayLike,
+    errors: Literal["raise", "mask"] = "raise"
+) -> TradeResult:
+    """
+    Vectorized calculate_risk_reward over arrays of trade setups.
+
+    Every argument may be an array or a scalar; inputs are broadcast against each
+    other, so e.g. a single risk mode can be applied to a whole watchlist.
+    Each valid row gives exactly the same values as the scalar function.
+
+    Args:
+        position_types (ArrayLike): "Long" or "Short" per row
+        account_sizes (ArrayLike): Total account size in dollars per row
+        risk_modes (ArrayLike): "% of Account" or "Fixed $ Amount" per row
+        risk_inputs (ArrayLike): Risk percentage or fixed risk amount per row
+        entry_prices (ArrayLike): Entry price per row
+        stop_losses (ArrayLike): Stop loss price per row
+        errors (Literal["raise", "mask"]): "raise" to raise on the first invalid row,
+                                           "mask" to return NaN (0 shares) for invalid rows;
+                                           use validate_risk_reward_batch for the reasons
+
+    Returns:
+        TradeResult: Column arrays (position_size, position_size_rounded,
+                     risk_amount, profit_1_1, profit_2_1, stop_loss_amount)
+
+    Raises:
+        ValueError: If errors is "raise" and any row is invalid; the message is the
+                    scalar error prefixed with the first bad row
+    """
+    sizing, _, _, _, error_codes = risk_reward_kernel(
+        position_types, account_sizes, risk_modes, risk_inputs, entry_prices, stop_losses
+    )
+    position_size, risk_amount, profit_1_1, profit_2_1, stop_loss_amount = apply_batch_errors(
+        sizing, error_codes, errors
+    )
+    position_size_rounded = np.trunc(np.nan_to_num(position_size)).astype(np.int64)
+
+    return TradeResult(position_size, position_size_rounded, risk_amount, profit_1_1, profit_2_1, stop_loss_amount)
+
+
+
+class TradeMetrics(NamedTuple):
+    """Sizing, percentage moves and 1:1 R:R for one trade (floats) or a batch (arrays)."""
+    position_size: float
+    position_size_rounded: int
+    risk_amount: float
+    profit_1_1: float
+    profit_2_1: float
+    stop_loss_amount: float
+    pct_drop_to_stop: float
+    pct_move_to_1_1: float
+    rr_1_1: float
+
+
+def calculate_trade_metrics(
+    position_type: Literal["Long", "Short"],
+    account_size: float,
+    risk_mode: Literal["% of Account", "Fixed $ Amount"],
+    risk_input: float,
+    entry_price: float,
+    stop_loss: float
+) -> TradeMetrics:
+    """
+    Calculate sizing, percentage moves and the 1:1 R:R in a single pass.
+
+    Equivalent to calling calculate_risk_reward, calculate_percentage_moves and
+    calculate_risk_reward_ratio in turn, but validates once and derives every
+    metric from one entry-to-stop distance. The 1:1 target is one distance
+    away by construction, so rr_1_1 is exactly 1.0.
+
+    Args:
+        position_type (Literal["Long", "Short"]): "Long" or "Short"
+        account_size (float): Total account size in dollars
+        risk_mode (Literal["% of Account", "Fixed $ Amount"]): Risk calculation mode
+        risk_input (float): Risk percentage (0-100) or fixed risk amount in dollars
+        entry_price (float): Entry price
+        stop_loss (float): Stop loss price
+
+    Returns:
+        TradeMetrics: All sizing outputs plus pct_drop_to_stop, pct_move_to_1_1 and rr_1_1
+
+    Raises:
+        ValueError: If inputs are invalid
+    """
+    # Same checks, in the same order, as calculate_risk_reward
+    if account_size <= 0:
+        raise ValueError(ERROR_MESSAGES[ERR_ACCOUNT_SIZE])
+    if entry_price <= 0:
+        raise ValueError(ERROR_MESSAGES[ERR_ENTRY_PRICE])
+    if stop_loss <= 0:
+        raise ValueError(ERROR_MESSAGES[ERR_STOP_LOSS])
+    if entry_price == stop_loss:
+        raise ValueError(ERROR_MESSAGES[ERR_ENTRY_EQUALS_STOP])
+
+    if risk_mode == "% of Account":
+        if risk_input <= 0 or risk_input > 100:
+            raise ValueError(ERROR_MESSAGES[ERR_RISK_PERCENTAGE])
+        risk_amount = account_size * (risk_input / 100)
+    else:  # Fixed $ Amount
+        if risk_input <= 0:
+            raise ValueError(ERROR_MESSAGES[ERR_RISK_AMOUNT])
+        if risk_input > account_size:
+            raise ValueError(ERROR_MESSAGES[ERR_RISK_EXCEEDS_ACCOUNT])
+        risk_amount = risk_input
+
+    if position_type == "Long":
+        if entry_price <= stop_loss:
+            raise ValueError(ERROR_MESSAGES[ERR_LONG_STOP_ABOVE_ENTRY])
+        distance = entry_price - stop_loss
+        profit_1_1 = entry_price + distance
+        profit_2_1 = entry_price + 2 * distance
+        reward = profit_1_1 - entry_price
+    else:  # Short
+        if entry_price >= stop_loss:
+            raise ValueError(ERROR_MESSAGES[ERR_SHORT_STOP_BELOW_ENTRY])
+        distance = stop_loss - entry_price
+        profit_1_1 = entry_price - distance
+        profit_2_1 = entry_price - 2 * distance
+        reward = entry_price - profit_1_1
+
+    position_size = risk_amount / distance
+    if position_size > MAX_POSITION_SIZE:
+        raise ValueError(ERROR_MESSAGES[ERR_POSITION_TOO_LARGE])
+
+    return TradeMetrics(
+        position_size, int(position_size), risk_amount, profit_1_1, profit_2_1, position_size * distance,
+        (distance / entry_price) * 100, (reward / entry_price) * 100, 1.0
+    )
+
+
+def calculate_trade_metrics_batch(
+    position_types: ArrayLike,
+    account_sizes: ArrayLike,
+    risk_modes: ArrayLike,
+    risk_inputs: ArrayLike,
+    entry_prices: ArrayLike,
+    stop_losses: ArrayLike,
+    errors: Literal["raise", "mask"] = "raise"
+) -> TradeMetrics:
+    """
+    Vectorized calculate_trade_metrics over arrays of trade setups.
+
+    Arguments broadcast the same way as calculate_risk_reward_batch.
+
+    Args:
+        position_types (ArrayLike): "Long" or "Short" per row
+        account_sizes (ArrayLike): Total account size in dollars per row
+        risk_modes (ArrayLike): "% of Account" or "Fixed $ Amount" per row
+        risk_inputs (ArrayLike): Risk percentage or fixed risk amount per row
+        entry_prices (ArrayLike): Entry price per row
+        stop_losses (ArrayLike): Stop loss price per row
+        errors (Literal["raise", "mask"]): "raise" to raise on the first invalid row,
+                                           "mask" to return NaN (0 shares) for invalid rows
+
+    Returns:
+        TradeMetrics: Column arrays for every metric
+
+    Raises:
+        ValueError: If errors is "raise" and any row is invalid
+    """
+    kernel = risk_reward_kernel(position_types, account_sizes, risk_modes, risk_inputs, entry_prices, stop_losses)
+    return trade_metrics_from_columns(trade_metrics_columns(kernel), kernel.error_codes, errors)
+
+
+def trade_metrics_columns(kernel: KernelResult) -> list[np.ndarray]:
+    """
+    Unchecked TradeMetrics float columns from kernel output; part of the batch kernel API.
+
+    Args:
+        kernel (KernelResult): Output of risk_reward_kernel or risk_reward_flags_kernel
+
+    Returns:
+        list[np.ndarray]: Every TradeMetrics column except position_size_rounded, in field order
+    """
+    profit_1_1 = kernel.sizing[2]
+    reward = np.where(kernel.is_long, profit_1_1 - kernel.entry, kernel.entry - profit_1_1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        pct_drop_to_stop = (kernel.distance / kernel.entry) * 100
+        pct_move_to_1_1 = (reward / kernel.entry) * 100
+    return kernel.sizing + [pct_drop_to_stop, pct_move_to_1_1, np.ones_like(kernel.distance)]
+
+
+def trade_metrics_from_columns(
+    columns: list[np.ndarray],
+    error_codes: np.ndarray,
+    errors: Literal["raise", "mask"]
+) -> TradeMetrics:
+    """
+    Apply the errors policy to trade_metrics_columns output and add position_size_rounded.
+
+    Args:
+        columns (list[np.ndarray]): Output of trade_metrics_columns (or shards of it, reassembled)
+        error_codes (np.ndarray): Per-row ERR_* codes from the kernel
+        errors (Literal["raise", "mask"]): "raise" or "mask", as in calculate_trade_metrics_batch
+
+    Returns:
+        TradeMetrics: Column arrays for every metric
+
+    Raises:
+        ValueError: If errors is "raise" and any row is invalid
+    """
+    position_size, risk_amount, profit_1_1, profit_2_1, stop_loss_amount, pct_drop_to_stop, pct_move_to_1_1, rr_1_1 = (
+        apply_batch_errors(columns, error_codes, errors)
+    )
+    position_size_rounded = np.trunc(np.nan_to_num(position_size)).astype(np.int64)
+
+    return TradeMetrics(
+        position_size, position_size_rounded, risk_amount, profit_1_1, profit_2_1,
+        stop_loss_amount, pct_drop_to_stop, pct_move_to_1_1, rr_1_1
+    )
+
+
+class ProfitLadder(NamedTuple):
+    """Profit targets at arbitrary R multiples, with per-level and scale-out P&L.
+
+    target_prices, pnl and scale_out_pnl have one entry per level (one row per
+    trade for batches); blended_pnl is the scale-out total per trade.
+    """
+    r_multiples: np.ndarray
+    weights: np.ndarray
+    target_prices: np.ndarray
+    pnl: np.ndarray
+    scale_out_pnl: np.ndarray
+    blended_pnl: np.ndarray
+
+
+def _ladder_levels(r_multiples: ArrayLike, weights: ArrayLike | None) -> tuple[np.ndarray, np.ndarray]:
+    """Validate R multiples and scale-out weights (default: equal split)."""
+    r_multiples = np.asarray(r_multiples, dtype=np.float64).ravel()
+    # isfinite also rejects NaN, which compares False against 0 and would slip through
+    if r_multiples.size == 0 or not np.all(np.isfinite(r_multiples) & (r_multiples > 0)):
+        raise ValueError("Profit target R multiples must be finite numbers greater than 0.")
+    if weights is None:
+        weights = np.full(r_multiples.size, 1 / r_multiples.size)
+    weights = np.asarray(weights, dtype=np.float64).ravel()
+    if weights.shape != r_multiples.shape:
+        raise ValueError("Provide one scale-out weight per profit target.")
+    if not np.all(weights >= 0) or weights.sum() > 1 + 1e-9:
+        raise ValueError("Scale-out weights must be non-negative and sum to at most 1.")
+    return r_multiples, weights
+
+
+def calculate_profit_ladder_batch(
+    entry_prices: ArrayLike,
+    stop_losses: ArrayLike,
+    position_sizes: ArrayLike,
+    r_multiples: ArrayLike,
+    weights: ArrayLike | None = None,
+    position_types: ArrayLike = "Long"
+) -> ProfitLadder:
+    """
+    Profit targets and P&L for many trades at many R multiples in one call.
+
+    Trade arguments broadcast against each other (one row per trade); levels
+    form the last axis of the result.
+
+    Args:
+        entry_prices (ArrayLike): Entry price per trade
+        stop_losses (ArrayLike): Stop loss price per trade
+        position_sizes (ArrayLike): Position size in shares per trade
+        r_multiples (ArrayLike): Reward multiples of the entry-to-stop risk, e.g. [1, 2, 3]
+        weights (ArrayLike | None): Fraction of the position sold at each level;
+                                    defaults to an equal split across levels
+        position_types (ArrayLike): "Long" or "Short" per trade
+
+    Returns:
+        ProfitLadder: target_prices, pnl (whole position exiting at each level),
+                      scale_out_pnl (weighted share per level) and blended_pnl
+
+    Raises:
+        ValueError: If R multiples or weights are invalid
+    """
+    r_multiples, weights = _ladder_levels(r_multiples, weights)
+    is_long, entry, stop, position_size = np.broadcast_arrays(
+        np.asarray(position_types) == "Long",
+        np.asarray(entry_prices, dtype=np.float64),
+        np.asarray(stop_losses, dtype=np.float64),
+        np.asarray(position_sizes, dtype=np.float64),
+    )
+    is_long, entry, position_size = is_long[..., None], entry[..., None], position_size[..., None]
+    distance = np.where(is_long, entry - stop[..., None], stop[..., None] - entry)
+
+    target_prices = np.where(is_long, entry + r_multiples * distance, entry - r_multiples * distance)
+    reward = np.where(is_long, target_prices - entry, entry - target_prices)
+    pnl = reward * position_size
+    scale_out_pnl = pnl * weights
+
+    return ProfitLadder(r_multiples, weights, target_prices, pnl, scale_out_pnl, scale_out_pnl.sum(axis=-1))
+
+
+def calculate_profit_ladder(
+    entry_price: float,
+    stop_loss: float,
+    position_size: float,
+    r_multiples: ArrayLike,
+    weights: ArrayLike | None = None,
+    position_type: Literal["Long", "Short"] = "Long"
+) -> ProfitLadder:
+    """
+    Profit targets and P&L for one trade at any number of R multiples.
+
+    Args:
+        entry_price (float): Entry price
+        stop_loss (float): Stop loss price
+        position_size (float): Position size in shares
+        r_multiples (ArrayLike): Reward multiples of the entry-to-stop risk, e.g. [0.5, 1, 2, 3]
+        weights (ArrayLike | None): Fraction of the position sold at each level;
+                                    defaults to an equal split across levels
+        position_type (Literal["Long", "Short"]): "Long" or "Short"
+
+    Returns:
+        ProfitLadder: One value per level; blended_pnl is a float
+
+    Raises:
+        ValueError: If R multiples or weights are invalid
+    """
+    ladder = calculate_profit_ladder_batch(entry_price, stop_loss, position_size, r_multiples, weights, position_type)
+    return ladder._replace(blended_pnl=float(ladder.blended_pnl))
@@ -0,0 +1,533 @@
+#!/usr/bin/env python3
+"""
+Calculation history storage for the RIZZK Risk-to-Reward Calculator.
+Keeps every calculation in preallocated NumPy columns instead of per-entry dicts,
+or, with SQLiteHistory, in an indexed SQLite file that survives restarts.
+"""
+
+import atexit
+import os
+import shutil
+import sqlite3
+import tempfile
+import threading
+import time
+import weakref
+from typing import Iterator, NamedTuple
+
+import numpy as np
+
+from rizzk_core import (
+    POSITION_TYPES,
+    RISK_MODES,
+    TradeMetrics,
+    TradeResult,
+    calculate_percentage_moves,
+    calculate_risk_reward_ratio,
+)
+
+
+class HistoryEntry(NamedTuple):
+    """One stored calculation: the form inputs, the sizing outputs and the derived metrics."""
+    position_type: str
+    account_size: float
+    risk_mode: str
+    risk_input: float
+    entry_price: float
+    stop_loss: float
+    position_size: float
+    position_size_rounded: int
+    risk_amount: float
+    profit_1_1: float
+    profit_2_1: float
+    pct_drop_to_stop: float
+    pct_move_to_1_1: float
+    rr_1_1: float
+
+
+# Column name -> dtype. Position type and risk mode are stored as int8 indexes
+# into POSITION_TYPES / RISK_MODES.
+HISTORY_COLUMNS: dict[str, type] = {
+    "position_type": np.int8,
+    "account_size": np.float64,
+    "risk_mode": np.int8,
+    "risk_input": np.float64,
+    "entry_price": np.float64,
+    "stop_loss": np.float64,
+    "position_size": np.float64,
+    "position_size_rounded": np.int64,
+    "risk_amount": np.float64,
+    "profit_1_1": np.float64,
+    "profit_2_1": np.float64,
+    "pct_drop_to_stop": np.float64,
+    "pct_move_to_1_1": np.float64,
+    "rr_1_1": np.float64,
+}
+
+
+def _metrics_row(entry_price: float, stop_loss: float, position_type: str, result: TradeResult | TradeMetrics) -> tuple:
+    """Sizing outputs plus derived metrics, computed here once if result doesn't carry them."""
+    if isinstance(result, TradeMetrics):
+        derived = result.pct_drop_to_stop, result.pct_move_to_1_1, result.rr_1_1
+    else:
+        derived = (
+            *calculate_percentage_moves(entry_price, stop_loss, result.profit_1_1, position_type),
+            calculate_risk_reward_ratio(entry_price, stop_loss, result.profit_1_1, position_type),
+        )
+    return (
+        float(result.position_size), int(result.position_size_rounded), float(result.risk_amount),
+        float(result.profit_1_1), float(result.profit_2_1), *(float(value) for value in derived),
+    )
+
+
+class TradeHistory:
+    """
+    Calculation history backed by NumPy column arrays.
+
+    Each entry costs ~106 bytes across the columns instead of a 14-key dict.
+    Storage doubles when full, so appends are amortized O(1), until it reaches
+    max_entries; from then on the columns are a fixed-size ring buffer. When the
+    ring is full, its oldest half is either written to a compressed .npz segment
+    in a private directory under spill_dir (still readable by index, page() and
+    columns()) or, without spill_dir, dropped. Either way memory stays flat.
+    The directory is only created by the first spill and is removed when the
+    history is garbage collected or the interpreter exits.
+    """
+
+    __slots__ = (
+        "_columns", "_start", "_size", "_spilled", "max_entries", "_spill_parent", "_spill_dir", "_segment", "__weakref__"
+    )
+
+    def __init__(self, capacity: int = 16, max_entries: int | None = None, spill_dir: str | None = None):
+        if max_entries is not None:
+            if max_entries < 2:
+                raise ValueError("max_entries must be at least 2.")
+            capacity = min(capacity, max_entries)
+        self.max_entries = max_entries
+        self._columns = {name: np.empty(capacity, dtype=dtype) for name, dtype in HISTORY_COLUMNS.items()}
+        self._start = 0  # physical index of the oldest in-memory entry
+        self._size = 0  # entries in memory
+        self._spilled = 0  # entries in segment files, all older than those in memory
+        self._spill_parent = spill_dir if max_entries is not None else None
+        self._spill_dir = None  # created on the first spill
+        self._segment: tuple[int, dict[str, np.ndarray]] | None = None  # last segment read
+
+    def __len__(self) -> int:
+        return self._spilled + self._size
+
+    def __bool__(self) -> bool:
+        return len(self) > 0
+
+    @property
+    def _segment_size(self) -> int:
+        return self.max_entries // 2
+
+    def _segment_path(self, number: int) -> str:
+        return os.path.join(self._spill_dir, f"segment-{number:06d}.npz")
+
+    def _row(self, index: int) -> list:
+        if index >= self._spilled:
+            physical = (self._start + index - self._spilled) % len(self._columns["position_type"])
+            return [column[physical].item() for column in self._columns.values()]
+        number, offset = divmod(index, self._segment_size)
+        if self._segment is None or self._segment[0] != number:
+            with np.load(self._segment_path(number)) as segment:
+                self._segment = number, {name: segment[name] for name in HISTORY_COLUMNS}
+        return [column[offset].item() for column in self._segment[1].values()]
+
+    def __getitem__(self, index: int) -> HistoryEntry:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("history index out of range")
+        row = self._row(index)
+        row[0] = POSITION_TYPES[row[0]]
+        row[2] = RISK_MODES[row[2]]
+        return HistoryEntry(*row)
+
+    def __iter__(self) -> Iterator[HistoryEntry]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def append(
+        self,
+        position_type: str,
+        account_size: float,
+        risk_mode: str,
+        risk_input: float,
+        entry_price: float,
+        stop_loss: float,
+        result: TradeResult | TradeMetrics
+    ) -> None:
+        """
+        Store one calculation with its derived metrics, so reading it back never recomputes.
+
+        Args:
+            position_type (str): "Long" or "Short"
+            account_size (float): Total account size in dollars
+            risk_mode (str): "% of Account" or "Fixed $ Amount"
+            risk_input (float): Risk percentage or fixed risk amount
+            entry_price (float): Entry price
+            stop_loss (float): Stop loss price
+            result (TradeResult | TradeMetrics): Output of calculate_trade_metrics (or
+                                                 calculate_risk_reward) for these inputs
+        """
+        capacity = len(self._columns["position_type"])
+        if self._size == capacity:
+            if self.max_entries is None or capacity < self.max_entries:
+                self._grow()
+            else:
+                self._evict_oldest()
+        physical = (self._start + self._size) % len(self._columns["position_type"])
+        row = (
+            POSITION_TYPES.index(position_type), account_size, RISK_MODES.index(risk_mode),
+            risk_input, entry_price, stop_loss, *_metrics_row(entry_price, stop_loss, position_type, result),
+        )
+        for column, value in zip(self._columns.values(), row):
+            column[physical] = value
+        self._size += 1
+
+    def recent(self, n: int) -> list[HistoryEntry]:
+        """Return up to the last n entries, newest first."""
+        return self.page(0, n)
+
+    def page(self, number: int, size: int) -> list[HistoryEntry]:
+        """Return page number (0 = newest) of size entries, newest first."""
+        end = len(self) - number * size
+        return [self[index] for index in range(end - 1, max(end - size, 0) - 1, -1)]
+
+    def clear(self) -> None:
+        """Drop every entry and spilled segment, keeping the allocated storage."""
+        for number in range(self._spilled // self._segment_size if self._spilled else 0):
+            os.remove(self._segment_path(number))
+        self._start = self._size = self._spilled = 0
+        self._segment = None
+
+    def _memory_columns(self) -> dict[str, np.ndarray]:
+        # Slices of the ring (views) unless it has wrapped around
+        end = self._start + self._size
+        capacity = len(self._columns["position_type"])
+        if end <= capacity:
+            return {name: column[self._start:end] for name, column in self._columns.items()}
+        return {
+            name: np.concatenate([column[self._start:], column[:end - capacity]])
+            for name, column in self._columns.items()
+        }
+
+    def columns(self) -> dict[str, np.ndarray]:
+        """
+        Return read-only arrays of every entry, oldest first.
+
+        These are views of the storage (no copies) until entries have been
+        spilled or the ring has wrapped around.
+        """
+        columns = self._memory_columns()
+        if self._spilled:
+            segments = []
+            for number in range(self._spilled // self._segment_size):
+                with np.load(self._segment_path(number)) as segment:
+                    segments.append({name: segment[name] for name in HISTORY_COLUMNS})
+            columns = {
+                name: np.concatenate([segment[name] for segment in segments] + [column])
+                for name, column in columns.items()
+            }
+        for view in columns.values():
+            view.flags.writeable = False
+        return columns
+
+    def to_pandas(self):
+        """
+        Return the history as a pandas DataFrame sharing memory with the columns.
+
+        Position type and risk mode become categoricals over the stored int8 codes.
+        """
+        import pandas as pd
+
+        columns = self.columns()
+        columns["position_type"] = pd.Categorical.from_codes(columns["position_type"], POSITION_TYPES)
+        columns["risk_mode"] = pd.Categorical.from_codes(columns["risk_mode"], RISK_MODES)
+        return pd.DataFrame(columns, copy=False)
+
+    def _grow(self) -> None:
+        # Only called before the ring first fills, so entries start at index 0
+        for name, column in self._columns.items():
+            size = max(2 * len(column), 1)
+            if self.max_entries is not None:
+                size = min(size, self.max_entries)
+            grown = np.empty(size, dtype=column.dtype)
+            grown[:len(column)] = column
+            self._columns[name] = grown
+
+    def _evict_oldest(self) -> None:
+        """Spill (or drop) the oldest half of a full ring."""
+        count = self._segment_size
+        physical = (self._start + np.arange(count)) % self.max_entries
+        if self._spill_parent is not None:
+            if self._spill_dir is None:
+                self._spill_dir = tempfile.mkdtemp(prefix="rizzk-history-", dir=self._spill_parent)
+                weakref.finalize(self, shutil.rmtree, self._spill_dir, ignore_errors=True)
+            np.savez_compressed(
+                self._segment_path(self._spilled // count),
+                **{name: column[physical] for name, column in self._columns.items()}
+            )
+            self._spilled += count
+        self._start = (self._start + count) % self.max_entries
+        self._size -= count
+
+
+def _sql_type(dtype: type) -> str:
+    return "INTEGER" if np.issubdtype(dtype, np.integer) else "REAL"
+
+
+class SQLiteHistory:
+    """
+    Persistent calculation history in a SQLite file.
+
+    Same reading interface as TradeHistory (len, recent, page, clear, to_pandas),
+    plus filtered, paginated queries on the indexed ts, position_type and rr
+    columns. Appends are buffered and written in batches of batch_size rows (or
+    after flush_interval seconds); reads flush first, so they always see every
+    append. Nothing accumulates in memory, however long the session.
+    Each thread gets its own connection, so one instance can serve every session.
+    Rows carry an owner key; pass owner to keep sessions or users apart (see
+    OwnedHistory), or leave it out to work on the whole file.
+    """
+
+    def __init__(self, path: str, batch_size: int = 64, flush_interval: float = 1.0):
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._local = threading.local()
+        self._lock = threading.Lock()  # guards _pending
+        self._write_lock = threading.Lock()  # held until a flush commits, so reads never miss rows in flight
+        self._pending: list[tuple] = []
+        self._last_flush = time.monotonic()
+        columns = ", ".join(f"{name} {_sql_type(dtype)} NOT NULL" for name, dtype in HISTORY_COLUMNS.items())
+        with self._connection() as db:
+            db.execute(
+                f"CREATE TABLE IF NOT EXISTS history (id INTEGER PRIMARY KEY, ts REAL NOT NULL, {columns}, "
+                "rr REAL NOT NULL, owner TEXT NOT NULL DEFAULT '')"
+            )
+            for column in ("ts", "position_type", "rr"):
+                db.execute(f"CREATE INDEX IF NOT EXISTS history_{column} ON history ({column})")
+            db.execute("CREATE INDEX IF NOT EXISTS history_owner_ts ON history (owner, ts)")
+        atexit.register(self.flush)
+
+    def _connection(self) -> sqlite3.Connection:
+        db = getattr(self._local, "db", None)
+        if db is None:
+            db = sqlite3.connect(self.path, timeout=30)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            self._local.db = db
+        return db
+
+    def append(
+        self,
+        position_type: str,
+        account_size: float,
+        risk_mode: str,
+        risk_input: float,
+        entry_price: float,
+        stop_loss: float,
+        result: TradeResult | TradeMetrics,
+        rr: float = 1.0,
+        owner: str = ""
+    ) -> None:
+        """
+        Queue one calculation, with its derived metrics, for the next batched write.
+
+        Args:
+            position_type (str): "Long" or "Short"
+            account_size (float): Total account size in dollars
+            risk_mode (str): "% of Account" or "Fixed $ Amount"
+            risk_input (float): Risk percentage or fixed risk amount
+            entry_price (float): Entry price
+            stop_loss (float): Stop loss price
+            result (TradeResult | TradeMetrics): Output of calculate_trade_metrics (or
+                                                 calculate_risk_reward) for these inputs
+            rr (float): R:R of the furthest planned profit target, for filtering
+            owner (str): Session or user the entry belongs to
+        """
+        row = (
+            time.time(), POSITION_TYPES.index(position_type), float(account_size), RISK_MODES.index(risk_mode),
+            float(risk_input), float(entry_price), float(stop_loss),
+            *_metrics_row(entry_price, stop_loss, position_type, result), float(rr), owner,
+        )
+        with self._lock:
+            self._pending.append(row)
+            due = len(self._pending) >= self.batch_size or time.monotonic() - self._last_flush >= self.flush_interval
+        if due:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write every queued append in one transaction; returns once they are committed."""
+        with self._write_lock:
+            with self._lock:
+                rows, self._pending = self._pending, []
+                self._last_flush = time.monotonic()
+            if rows:
+                placeholders = ", ".join("?" * len(rows[0]))
+                with self._connection() as db:
+                    db.executemany(
+                        f"INSERT INTO history (ts, {', '.join(HISTORY_COLUMNS)}, rr, owner) VALUES ({placeholders})", rows
+                    )
+
+    @staticmethod
+    def _where(
+        position_type: str | None, min_rr: float | None, since: float | None, owner: str | None = None
+    ) -> tuple[str, list]:
+        clauses, params = [], []
+        if owner is not None:
+            clauses.append("owner = ?")
+            params.append(owner)
+        if position_type is not None:
+            clauses.append("position_type = ?")
+            params.append(POSITION_TYPES.index(position_type))
+        if min_rr is not None:
+            clauses.append("rr >= ?")
+            params.append(min_rr)
+        if since is not None:
+            clauses.append("ts >= ?")
+            params.append(since)
+        return (" WHERE " + " AND ".join(clauses) if clauses else ""), params
+
+    def count(
+        self,
+        position_type: str | None = None,
+        min_rr: float | None = None,
+        since: float | None = None,
+        owner: str | None = None
+    ) -> int:
+        """Number of stored entries matching the filters (see page())."""
+        self.flush()
+        where, params = self._where(position_type, min_rr, since, owner)
+        return self._connection().execute(f"SELECT COUNT(*) FROM history{where}", params).fetchone()[0]
+
+    def page(
+        self,
+        number: int,
+        size: int,
+        position_type: str | None = None,
+        min_rr: float | None = None,
+        since: float | None = None,
+        owner: str | None = None
+    ) -> list[HistoryEntry]:
+        """
+        Return one page of entries, newest first.
+
+        Args:
+            number (int): Page number, 0 = newest
+            size (int): Entries per page
+            position_type (str | None): Only "Long" or only "Short" entries
+            min_rr (float | None): Only entries whose rr is at least this
+            since (float | None): Only entries stored at or after this Unix timestamp
+            owner (str | None): Only entries of this session or user
+
+        Returns:
+            list[HistoryEntry]: Up to size entries
+        """
+        self.flush()
+        where, params = self._where(position_type, min_rr, since, owner)
+        rows = self._connection().execute(
+            f"SELECT {', '.join(HISTORY_COLUMNS)} FROM history{where} ORDER BY ts DESC, id DESC LIMIT ? OFFSET ?",
+            params + [size, number * size]
+        )
+        return [
+            HistoryEntry(POSITION_TYPES[row[0]], row[1], RISK_MODES[row[2]], *row[3:]) for row in rows
+        ]
+
+    def __len__(self) -> int:
+        return self.count()
+
+    def __bool__(self) -> bool:
+        return len(self) > 0
+
+    def recent(self, n: int) -> list[HistoryEntry]:
+        """Return up to the last n entries, newest first."""
+        return self.page(0, n)
+
+    def clear(self, owner: str | None = None) -> None:
+        """Delete the stored entries of one owner, or every entry if owner is None."""
+        self.flush()
+        where, params = self._where(None, None, None, owner)
+        with self._connection() as db:
+            db.execute(f"DELETE FROM history{where}", params)
+
+    def prune(self, owner_prefix: str, max_age: float) -> int:
+        """
+        Delete entries older than max_age seconds whose owner starts with owner_prefix.
+
+        Args:
+            owner_prefix (str): e.g. "session:" for visitors who aren't signed in
+            max_age (float): Age in seconds, by the time each entry was stored
+
+        Returns:
+            int: Number of entries deleted
+        """
+        self.flush()
+        # A range on owner (rather than LIKE) can use the owner/ts index
+        upper = owner_prefix[:-1] + chr(ord(owner_prefix[-1]) + 1)
+        with self._connection() as db:
+            return db.execute(
+                "DELETE FROM history WHERE owner >= ? AND owner < ? AND ts < ?",
+                (owner_prefix, upper, time.time() - max_age)
+            ).rowcount
+
+    def to_pandas(self, owner: str | None = None):
+        """Return the history (oldest first, with ts, rr and owner) as a pandas DataFrame."""
+        import pandas as pd
+
+        self.flush()
+        where, params = self._where(None, None, None, owner)
+        df = pd.read_sql_query(
+            f"SELECT * FROM history{where} ORDER BY ts, id", self._connection(), params=params, index_col="id"
+        )
+        df["position_type"] = pd.Categorical.from_codes(df["position_type"], POSITION_TYPES)
+        df["risk_mode"] = pd.Categorical.from_codes(df["risk_mode"], RISK_MODES)
+        return df
+
+
+class OwnedHistory:
+    """
+    One owner's slice of a shared SQLiteHistory, with the TradeHistory interface.
+
+    The app keeps one of these per session, so sessions sharing a history file
+    only see, page through and clear their own calculations.
+    """
+
+    def __init__(self, store: SQLiteHistory, owner: str):
+        self.store = store
+        self.owner = owner
+
+    def append(self, *args, **kwargs) -> None:
+        """SQLiteHistory.append, stored under this owner."""
+        self.store.append(*args, **kwargs, owner=self.owner)
+
+    def count(self, position_type: str | None = None, min_rr: float | None = None, since: float | None = None) -> int:
+        return self.store.count(position_type, min_rr, since, owner=self.owner)
+
+    def page(
+        self,
+        number: int,
+        size: int,
+        position_type: str | None = None,
+        min_rr: float | None = None,
+        since: float | None = None
+    ) -> list[HistoryEntry]:
+        return self.store.page(number, size, position_type, min_rr, since, owner=self.owner)
+
+    def __len__(self) -> int:
+        return self.count()
+
+    def __bool__(self) -> bool:
+        return len(self) > 0
+
+    def recent(self, n: int) -> list[HistoryEntry]:
+        return self.page(0, n)
+
+    def clear(self) -> None:
+        self.store.clear(owner=self.owner)
+
+    def to_pandas(self):
+        return self.store.to_pandas(owner=self.owner)
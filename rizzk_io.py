@@ -0,0 +1,509 @@
+#!/usr/bin/env python3
+"""
+Trade-plan file I/O for the RIZZK Risk-to-Reward Calculator.
+Streams plan rows in fixed-size chunks through the batch engine.
+
+CSV and NDJSON are always available; Parquet and Arrow IPC need the optional
+pyarrow package and skip text parsing entirely. Plans that get re-sized often
+can be stored in the fixed-width binary plan format and memory-mapped.
+"""
+
+import os
+import sys
+from typing import IO, Iterable, Iterator, Mapping
+
+import numpy as np
+import pandas as pd
+
+from rizzk_core import (
+    ERR_NOT_A_NUMBER,
+    ERR_POSITION_TYPE,
+    ERR_RISK_MODE,
+    ERROR_MESSAGES,
+    POSITION_TYPES,
+    RISK_MODES,
+    describe_errors,
+    risk_reward_kernel,
+    trade_metrics_columns,
+    trade_metrics_from_columns,
+)
+
+# Input columns, in calculate_risk_reward argument order
+PLAN_COLUMNS = ("position_type", "account_size", "risk_mode", "risk_input", "entry_price", "stop_loss")
+PLAN_DTYPES = {
+    "position_type": str,
+    "account_size": np.float64,
+    "risk_mode": str,
+    "risk_input": np.float64,
+    "entry_price": np.float64,
+    "stop_loss": np.float64,
+}
+NUMERIC_PLAN_COLUMNS = tuple(name for name, dtype in PLAN_DTYPES.items() if dtype is np.float64)
+# Text readers only pin the label columns: numeric columns are inferred per chunk, so one
+# malformed cell doesn't abort the stream; size_plan_columns flags the rows that don't parse
+PLAN_READ_DTYPES = {name: dtype for name, dtype in PLAN_DTYPES.items() if dtype is str}
+RESULT_COLUMNS = (
+    "position_size", "position_size_rounded", "risk_amount", "profit_1_1", "profit_2_1",
+    "stop_loss_amount", "pct_drop_to_stop", "pct_move_to_1_1", "rr_1_1", "error_code", "error",
+)
+# Output formats; the binary plan format is input-only
+FORMATS = ("csv", "ndjson", "parquet", "arrow")
+PLAN_FORMATS = FORMATS + ("binary",)
+
+# Binary plan format: a 24-byte header followed by fixed-width little-endian
+# records. Position type and risk mode are indexes into POSITION_TYPES / RISK_MODES;
+# the padding keeps every float 8-byte aligned in the mapped file. The header's
+# record count is written last, so a file cut short doesn't pass for a smaller plan.
+BINARY_MAGIC = b"RIZZKPLN"
+BINARY_VERSION = 1
+BINARY_HEADER_DTYPE = np.dtype([("magic", "S8"), ("version", "<u4"), ("record_size", "<u4"), ("records", "<u8")])
+BINARY_RECORD_DTYPE = np.dtype([
+    ("position_type", "i1"),
+    ("risk_mode", "i1"),
+    ("_padding", "V6"),
+    ("account_size", "<f8"),
+    ("risk_input", "<f8"),
+    ("entry_price", "<f8"),
+    ("stop_loss", "<f8"),
+])
+
+_EXTENSIONS = {
+    ".csv": "csv",
+    ".ndjson": "ndjson",
+    ".jsonl": "ndjson",
+    ".parquet": "parquet",
+    ".pq": "parquet",
+    ".arrow": "arrow",
+    ".feather": "arrow",
+    ".ipc": "arrow",
+    ".rzk": "binary",
+}
+
+
+def _require_pyarrow():
+    try:
+        import pyarrow
+    except ImportError:
+        raise ImportError("Parquet and Arrow plans need pyarrow: pip install pyarrow") from None
+    return pyarrow
+
+
+def detect_format(path: str, default: str = "csv") -> str:
+    """Guess a plan format from a file extension, falling back to default (e.g. for stdin)."""
+    return _EXTENSIONS.get(os.path.splitext(path)[1].lower(), default)
+
+
+def _arrow_columns(batch) -> dict[str, np.ndarray]:
+    """Map a record batch onto NumPy columns; numeric columns without nulls are zero-copy views."""
+    return {name: column.to_numpy(zero_copy_only=False) for name, column in zip(batch.schema.names, batch.columns)}
+
+
+def _seekable(source: IO) -> bool:
+    try:
+        return source.seekable()
+    except (AttributeError, OSError, ValueError):
+        return False
+
+
+def _read_arrow_chunks(source: str | IO, chunk_size: int) -> Iterator[dict[str, np.ndarray]]:
+    pa = _require_pyarrow()
+    if isinstance(source, str):
+        # Memory-map so batches reference the file pages instead of being read in
+        reader = pa.ipc.open_file(pa.memory_map(source))
+        batches = (reader.get_batch(i) for i in range(reader.num_record_batches))
+    elif hasattr(source, "peek") and source.peek(6)[:6] == b"ARROW1":
+        # An IPC file piped in: its footer is at the end, so it has to be buffered
+        reader = pa.ipc.open_file(pa.py_buffer(source.read()))
+        batches = (reader.get_batch(i) for i in range(reader.num_record_batches))
+    else:
+        batches = pa.ipc.open_stream(source)
+    for batch in batches:
+        for offset in range(0, batch.num_rows, chunk_size):
+            yield _arrow_columns(batch.slice(offset, chunk_size))
+
+
+def read_plan_chunks(source: str | IO, fmt: str = "csv", chunk_size: int = 100_000) -> Iterator[Mapping[str, np.ndarray]]:
+    """
+    Yield a trade-plan file in chunks of at most chunk_size rows.
+
+    Args:
+        source (str | IO): File path, "-" for stdin, or an open file object
+        fmt (str): "csv", "ndjson", "parquet" (read into memory first when piped), "arrow"
+                   (Arrow IPC file, or stream on stdin)
+                   or "binary" (memory-mapped .rzk plan; files only)
+        chunk_size (int): Rows per chunk; bounds memory regardless of file size
+
+    Yields:
+        Mapping[str, np.ndarray]: Plan columns by name - a DataFrame for text formats,
+                                  a dict of NumPy columns for Parquet/Arrow/binary
+    """
+    if source == "-":
+        source = sys.stdin if fmt in ("csv", "ndjson") else sys.stdin.buffer
+    if fmt == "csv":
+        with pd.read_csv(source, chunksize=chunk_size, dtype=PLAN_READ_DTYPES, skipinitialspace=True) as reader:
+            yield from reader
+    elif fmt == "ndjson":
+        with pd.read_json(source, lines=True, chunksize=chunk_size, dtype=PLAN_READ_DTYPES) as reader:
+            yield from reader
+    elif fmt == "parquet":
+        pa = _require_pyarrow()
+        import pyarrow.parquet as pq
+        if not isinstance(source, str) and not _seekable(source):
+            # Parquet's footer (the schema and row group index) is at the end, so a pipe has to be buffered
+            source = pa.BufferReader(source.read())
+        parquet_file = pq.ParquetFile(source, memory_map=isinstance(source, str))
+        for batch in parquet_file.iter_batches(batch_size=chunk_size):
+            yield _arrow_columns(batch)
+    elif fmt == "arrow":
+        yield from _read_arrow_chunks(source, chunk_size)
+    elif fmt == "binary":
+        if not isinstance(source, str):
+            raise ValueError("Binary plans must be read from a file so they can be memory-mapped.")
+        plan = BinaryPlan(source)
+        for start in range(0, len(plan), chunk_size):
+            yield plan.plan_columns(start, start + chunk_size)
+    else:
+        raise ValueError(f"Unsupported plan format: {fmt}")
+
+
+def _numeric_column(values) -> tuple[np.ndarray, np.ndarray | bool]:
+    """Parse a plan column as float64; also returns a mask of non-blank cells that aren't numbers."""
+    values = np.asarray(values)
+    if values.dtype.kind in "biuf":
+        return values.astype(np.float64, copy=False), False
+    text = pd.Series(values, dtype=object)
+    parsed = pd.to_numeric(text, errors="coerce")
+    blank = text.isna() | text.astype(str).str.strip().eq("")
+    return parsed.to_numpy(np.float64), (parsed.isna() & ~blank).to_numpy()
+
+
+def size_plan_columns(plan: Mapping[str, np.ndarray], defaults: dict | None = None, backend=None) -> dict[str, np.ndarray]:
+    """
+    Run a chunk of plan columns through the batch engine without raising on bad rows.
+
+    Args:
+        plan (Mapping[str, np.ndarray]): Plan columns by name (a dict or DataFrame)
+        defaults (dict | None): Values for PLAN_COLUMNS missing from the plan,
+                                e.g. {"account_size": 25000, "risk_mode": "% of Account"}
+        backend (rizzk_parallel.ParallelBackend | None): Shard the sizing across its worker
+                                                          processes; None sizes in this process
+
+    Returns:
+        dict[str, np.ndarray]: The plan columns followed by RESULT_COLUMNS except the
+                               error message; invalid rows (including numeric cells
+                               that don't parse) have NaN results and a non-zero error_code
+
+    Raises:
+        ValueError: If a required column is missing and has no default
+    """
+    defaults = defaults or {}
+    inputs = []
+    not_a_number = False
+    for name in PLAN_COLUMNS:
+        if name in plan and name in NUMERIC_PLAN_COLUMNS:
+            values, unparsed = _numeric_column(plan[name])
+            inputs.append(values)
+            not_a_number = not_a_number | unparsed
+        elif name in plan:
+            inputs.append(np.asarray(plan[name]))
+        elif defaults.get(name) is not None:
+            inputs.append(defaults[name])
+        else:
+            raise ValueError(f"Trade plan is missing the '{name}' column.")
+
+    if backend is None:
+        kernel = risk_reward_kernel(*inputs)
+        columns, error_codes = trade_metrics_columns(kernel), kernel.error_codes
+    else:
+        columns, error_codes = backend.trade_metrics_columns(*inputs)
+    metrics = trade_metrics_from_columns(columns, error_codes, "mask")
+
+    sized = {name: np.broadcast_to(value, error_codes.shape) for name, value in zip(PLAN_COLUMNS, inputs)}
+    sized.update(zip(metrics._fields, metrics))
+
+    # The batch engine sizes anything but "Long" as a short and anything but "% of Account"
+    # as a fixed amount, so free-text labels from files are checked first
+    error_codes = np.select(
+        [
+            np.broadcast_to(not_a_number, error_codes.shape),
+            ~np.isin(sized["position_type"], POSITION_TYPES),
+            ~np.isin(sized["risk_mode"], RISK_MODES),
+        ],
+        [ERR_NOT_A_NUMBER, ERR_POSITION_TYPE, ERR_RISK_MODE],
+        error_codes
+    ).astype(np.int8)
+    flagged = error_codes >= ERR_POSITION_TYPE
+    if flagged.any():
+        for name in metrics._fields:
+            sized[name][flagged] = 0 if name == "position_size_rounded" else np.nan
+    sized["error_code"] = error_codes
+    return sized
+
+
+def size_plan(plan: pd.DataFrame, defaults: dict | None = None) -> pd.DataFrame:
+    """
+    DataFrame version of size_plan_columns, including the error message column.
+
+    Args:
+        plan (pd.DataFrame): Plan rows with PLAN_COLUMNS
+        defaults (dict | None): Values for PLAN_COLUMNS missing from the plan
+
+    Returns:
+        pd.DataFrame: The plan columns followed by RESULT_COLUMNS
+
+    Raises:
+        ValueError: If a required column is missing and has no default
+    """
+    sized = size_plan_columns(plan, defaults)
+    sized["error"] = describe_errors(sized["error_code"])
+    return pd.DataFrame(sized, index=plan.index)
+
+
+def _arrow_batch(sized: Mapping[str, np.ndarray]):
+    """Build a record batch from sized columns; numeric columns are wrapped without copying."""
+    pa = _require_pyarrow()
+    columns = {name: pa.array(np.ascontiguousarray(column)) for name, column in sized.items() if name != "error"}
+    # Messages are a dictionary over the int8 error codes rather than a string per row
+    messages = [ERROR_MESSAGES[code] for code in sorted(ERROR_MESSAGES)]
+    columns["error"] = pa.DictionaryArray.from_arrays(columns["error_code"], pa.array(messages))
+    return pa.record_batch(columns)
+
+
+class PlanWriter:
+    """Appends sized chunks to a CSV, NDJSON, Parquet or Arrow IPC output."""
+
+    def __init__(self, dest: str | IO, fmt: str = "csv"):
+        if fmt not in FORMATS:
+            raise ValueError(f"Unsupported plan format: {fmt}")
+        if fmt in ("parquet", "arrow"):
+            _require_pyarrow()
+        self.fmt = fmt
+        self._binary = fmt in ("parquet", "arrow")
+        self._owns_file = dest != "-" and isinstance(dest, str)
+        if dest == "-":
+            self._file = sys.stdout.buffer if self._binary else sys.stdout
+        elif isinstance(dest, str):
+            self._file = open(dest, "wb") if self._binary else open(dest, "w", newline="")
+        else:
+            self._file = dest
+        self._header = True
+        self._arrow_writer = None
+
+    def __enter__(self) -> "PlanWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def write(self, sized: Mapping[str, np.ndarray]) -> None:
+        """Append one chunk of sized rows (from size_plan or size_plan_columns)."""
+        if self._binary:
+            self._write_arrow(_arrow_batch(sized))
+            return
+        if not isinstance(sized, pd.DataFrame):
+            sized = pd.DataFrame({**sized, "error": describe_errors(sized["error_code"])})
+        if self.fmt == "csv":
+            sized.to_csv(self._file, header=self._header, index=False)
+        else:
+            sized.to_json(self._file, orient="records", lines=True, double_precision=15)
+        self._header = False
+
+    def _write_arrow(self, batch) -> None:
+        if self._arrow_writer is None:
+            pa = _require_pyarrow()
+            if self.fmt == "parquet":
+                import pyarrow.parquet as pq
+                self._arrow_writer = pq.ParquetWriter(self._file, batch.schema)
+            elif self._owns_file:
+                self._arrow_writer = pa.ipc.new_file(self._file, batch.schema)
+            else:
+                # Streams can't seek back to write a file footer
+                self._arrow_writer = pa.ipc.new_stream(self._file, batch.schema)
+        self._arrow_writer.write_batch(batch)
+
+    def close(self) -> None:
+        """Finish the output; closes it if this writer opened it."""
+        if self._arrow_writer is not None:
+            self._arrow_writer.close()
+        self._file.flush()
+        if self._owns_file:
+            self._file.close()
+
+
+class BinaryPlan:
+    """
+    Memory-mapped binary trade plan.
+
+    Columns are NumPy views straight onto the file pages: nothing is parsed and
+    nothing is copied, so re-sizing the same plan (e.g. with a new account
+    balance passed to the batch functions) costs only the math.
+    """
+
+    def __init__(self, path: str):
+        header = np.fromfile(path, dtype=BINARY_HEADER_DTYPE, count=1)
+        if len(header) != 1 or header["magic"][0] != BINARY_MAGIC:
+            raise ValueError(f"{path} is not a RIZZK binary plan.")
+        if header["version"][0] != BINARY_VERSION or header["record_size"][0] != BINARY_RECORD_DTYPE.itemsize:
+            raise ValueError(f"{path} uses an unsupported binary plan version.")
+        n_records = int(header["records"][0])
+        if os.path.getsize(path) != BINARY_HEADER_DTYPE.itemsize + n_records * BINARY_RECORD_DTYPE.itemsize:
+            raise ValueError(f"{path} is truncated or corrupt: its size doesn't match its {n_records:,} records.")
+        self.path = path
+        if n_records:
+            self.records = np.memmap(
+                path, dtype=BINARY_RECORD_DTYPE, mode="r", offset=BINARY_HEADER_DTYPE.itemsize, shape=(n_records,)
+            )
+        else:
+            self.records = np.empty(0, dtype=BINARY_RECORD_DTYPE)
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    @property
+    def entry_price(self) -> np.ndarray:
+        return self.records["entry_price"]
+
+    @property
+    def stop_loss(self) -> np.ndarray:
+        return self.records["stop_loss"]
+
+    @property
+    def account_size(self) -> np.ndarray:
+        return self.records["account_size"]
+
+    @property
+    def risk_input(self) -> np.ndarray:
+        return self.records["risk_input"]
+
+    def plan_columns(self, start: int = 0, stop: int | None = None) -> dict[str, np.ndarray]:
+        """
+        Rows [start, stop) as PLAN_COLUMNS for the batch engine.
+
+        Numeric columns are views of the mapped file; position type and risk mode
+        are decoded from their codes for just these rows.
+        """
+        rows = self.records[start:stop]
+        columns = {name: rows[name] for name in ("account_size", "risk_input", "entry_price", "stop_loss")}
+        for name, labels in (("position_type", POSITION_TYPES), ("risk_mode", RISK_MODES)):
+            codes = rows[name]
+            bad = (codes < 0) | (codes >= len(labels))
+            if bad.any():
+                index = int(np.argmax(bad))
+                raise ValueError(f"{self.path} is corrupt: record {start + index:,} has {name} code {codes[index]}.")
+            columns[name] = np.asarray(labels)[codes]
+        return columns
+
+
+class BinaryPlanWriter:
+    """
+    Appends plan chunks to a binary plan file (see BINARY_RECORD_DTYPE).
+
+    Records go to a temporary file next to path, which only replaces path once
+    close() has written the final record count. A conversion that fails part way
+    (or a writer used as a context manager that exits with an exception) leaves
+    path untouched.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.records = 0
+        self._tmp_path = f"{path}.{os.getpid()}.tmp"
+        self._file = open(self._tmp_path, "wb")
+        self._write_header()
+
+    def __enter__(self) -> "BinaryPlanWriter":
+        return self
+
+    def __exit__(self, exc_type, *exc) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.discard()
+
+    def _write_header(self) -> None:
+        header = np.array(
+            [(BINARY_MAGIC, BINARY_VERSION, BINARY_RECORD_DTYPE.itemsize, self.records)], dtype=BINARY_HEADER_DTYPE
+        )
+        header.tofile(self._file)
+
+    def write(self, plan: Mapping[str, np.ndarray], defaults: dict | None = None) -> int:
+        """
+        Append plan rows.
+
+        Args:
+            plan (Mapping[str, np.ndarray]): Plan columns by name (a dict or DataFrame)
+            defaults (dict | None): Values for PLAN_COLUMNS missing from the plan
+
+        Raises:
+            ValueError: If a column is missing without a default, a position type
+                        or risk mode is not one of the known values, or a numeric
+                        cell isn't a number
+
+        Returns:
+            int: Number of records written
+        """
+        defaults = defaults or {}
+        columns = {}
+        for name in PLAN_COLUMNS:
+            if name in plan and name in NUMERIC_PLAN_COLUMNS:
+                values, unparsed = _numeric_column(plan[name])
+                if np.any(unparsed):
+                    raise ValueError(f"Not a number in {name}: {np.asarray(plan[name])[np.argmax(unparsed)]!r}")
+                columns[name] = values
+            elif name in plan:
+                columns[name] = np.asarray(plan[name])
+            elif defaults.get(name) is not None:
+                columns[name] = defaults[name]
+            else:
+                raise ValueError(f"Trade plan is missing the '{name}' column.")
+        columns = dict(zip(columns, np.broadcast_arrays(*columns.values())))
+
+        records = np.zeros(len(columns["entry_price"]), dtype=BINARY_RECORD_DTYPE)
+        for name, labels in (("position_type", POSITION_TYPES), ("risk_mode", RISK_MODES)):
+            values = columns.pop(name)
+            known = np.isin(values, labels)
+            if not known.all():
+                raise ValueError(f"Unknown {name}: {values[np.argmin(known)]!r}")
+            records[name] = np.where(values == labels[0], 0, 1)
+        for name, column in columns.items():
+            records[name] = column
+        records.tofile(self._file)
+        self.records += len(records)
+        return len(records)
+
+    def close(self) -> None:
+        """Write the record count and move the finished plan to path."""
+        if self._file.closed:
+            return
+        self._file.seek(0)
+        self._write_header()
+        self._file.close()
+        os.replace(self._tmp_path, self.path)
+
+    def discard(self) -> None:
+        """Drop the records written so far; path keeps whatever it held before."""
+        if not self._file.closed:
+            self._file.close()
+        try:
+            os.remove(self._tmp_path)
+        except FileNotFoundError:
+            pass
+
+
+def write_binary_plan(path: str, chunks: Iterable[Mapping[str, np.ndarray]], defaults: dict | None = None) -> int:
+    """
+    Convert plan chunks (e.g. from read_plan_chunks) into a binary plan file.
+
+    The file at path is only created (or replaced) once every chunk converted.
+
+    Returns:
+        int: Number of records written
+
+    Raises:
+        ValueError: If a chunk can't be converted (see BinaryPlanWriter.write)
+    """
+    records = 0
+    with BinaryPlanWriter(path) as writer:
+        for chunk in chunks:
+            records += writer.write(chunk, defaults)
+    return records
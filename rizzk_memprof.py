@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""
+Session memory profiling for the RIZZK Streamlit app.
+
+tracemalloc traces every allocation in the process, so its snapshots can't tell
+sessions apart. Each session's SessionMemoryProfiler therefore records two views
+per sample: the process-wide traced memory grouped by the package that
+allocated it (plotly, pandas, numpy, ...), and the deep size of the objects the
+session itself holds (its history, cached figures, DataFrames). Growth between
+samples is listed by source line, so a leak can be traced to the code that
+keeps allocating.
+
+Tracing slows allocation-heavy code down noticeably, so it is opt-in.
+"""
+
+import gc
+import json
+import os
+import sys
+import sysconfig
+import time
+import tracemalloc
+from collections import deque
+from types import BuiltinFunctionType, FunctionType, ModuleType
+from typing import NamedTuple
+
+import numpy as np
+
+DEFAULT_INTERVAL = 30.0
+DEFAULT_MAX_SAMPLES = 120
+MEMPROF_INTERVAL_ENV = "RIZZK_MEMPROF_INTERVAL"  # seconds between samples per session
+
+# Shared by every session (or not owned by any): never counted towards an object's size
+_SKIP_TYPES = (type, ModuleType, FunctionType, BuiltinFunctionType)
+_STDLIB = sysconfig.get_paths()["stdlib"]
+
+
+class MemorySample(NamedTuple):
+    """One memory measurement of a session, sizes in bytes."""
+    timestamp: float
+    traced_bytes: int
+    peak_bytes: int
+    rss_bytes: int | None
+    objects: dict[str, int]
+    packages: dict[str, int]
+
+
+class MemoryGrowth(NamedTuple):
+    """Traced memory allocated at one source line, and its change since the previous sample."""
+    location: str
+    size_bytes: int
+    size_diff_bytes: int
+    count_diff: int
+
+
+def start_tracing(frames: int = 1) -> None:
+    """Start tracing allocations, unless tracemalloc is already running."""
+    if not tracemalloc.is_tracing():
+        tracemalloc.start(frames)
+
+
+def rss_bytes() -> int | None:
+    """Resident set size of this process, or None where /proc isn't available."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+
+def deep_sizeof(obj) -> int:
+    """
+    Approximate memory held by an object and everything it references.
+
+    NumPy arrays count their data buffer (once, by the array that owns it);
+    classes, modules and functions are shared code, so they aren't followed.
+
+    Args:
+        obj: Object to measure
+
+    Returns:
+        int: Size in bytes
+    """
+    seen = set()
+    stack = [obj]
+    total = 0
+    while stack:
+        item = stack.pop()
+        if id(item) in seen or isinstance(item, _SKIP_TYPES):
+            continue
+        seen.add(id(item))
+        if isinstance(item, np.ndarray):
+            total += sys.getsizeof(item) if item.base is None else item.__sizeof__()
+            if item.dtype != object:
+                continue
+        else:
+            total += sys.getsizeof(item)
+        stack.extend(gc.get_referents(item))
+    return total
+
+
+def classify(key: str, value) -> str:
+    """Group a session_state item: history, figures, dataframes or other session state."""
+    module = type(value).__module__
+    if key == "history":
+        return "history"
+    if module.startswith("plotly"):
+        return "figures"
+    if module.startswith("pandas"):
+        return "dataframes"
+    return "other session state"
+
+
+def package_of(filename: str) -> str:
+    """Top-level package (or script name) of the file an allocation came from."""
+    parts = filename.replace("\\", "/").split("/")
+    for marker in ("site-packages", "dist-packages"):
+        if marker in parts:
+            index = parts.index(marker)
+            if index + 1 < len(parts):
+                return os.path.splitext(parts[index + 1])[0]
+    if filename.startswith("<frozen") or filename.startswith(_STDLIB):
+        return "stdlib"
+    return os.path.splitext(parts[-1])[0]
+
+
+def short_location(frame: tracemalloc.Frame) -> str:
+    """filename:lineno with the site-packages or standard library prefix dropped."""
+    filename = frame.filename.replace("\\", "/")
+    for marker in ("/site-packages/", "/dist-packages/"):
+        if marker in filename:
+            filename = filename.split(marker, 1)[1]
+            break
+    else:
+        if filename.startswith(_STDLIB):
+            filename = filename[len(_STDLIB):].lstrip("/\\")
+    return f"{filename}:{frame.lineno}"
+
+
+def traced_by_package(stats: list[tracemalloc.Statistic]) -> dict[str, int]:
+    """Traced bytes per allocating package, largest first, from per-line or per-file statistics."""
+    sizes: dict[str, int] = {}
+    for stat in stats:
+        package = package_of(stat.traceback[0].filename)
+        sizes[package] = sizes.get(package, 0) + stat.size
+    return dict(sorted(sizes.items(), key=lambda item: item[1], reverse=True))
+
+
+class SessionMemoryProfiler:
+    """
+    Memory samples for one session, taken at most every interval seconds.
+
+    Grouping a snapshot by source line is the expensive part (seconds with a
+    few hundred thousand traces), so each sample groups once and derives both
+    the per-package totals and the growth from that. Only the per-line sizes of
+    the last sample are kept, not the snapshot itself.
+    """
+
+    def __init__(self, interval: float = DEFAULT_INTERVAL, max_samples: int = DEFAULT_MAX_SAMPLES):
+        if interval < 0 or max_samples < 1:
+            raise ValueError("interval must be >= 0 and max_samples >= 1.")
+        self.interval = interval
+        self.samples: deque[MemorySample] = deque(maxlen=max_samples)
+        self.growth: list[MemoryGrowth] = []
+        self._lines: dict[str, tuple[int, int]] | None = None  # location -> (size, count) at the last sample
+
+    def due(self, now: float | None = None) -> bool:
+        """Whether interval seconds have passed since the last sample."""
+        now = time.time() if now is None else now
+        return not self.samples or now - self.samples[-1].timestamp >= self.interval
+
+    def sample(self, session_items: dict, top: int = 10) -> MemorySample:
+        """
+        Record a sample now.
+
+        Args:
+            session_items (dict): The session's state (e.g. dict(st.session_state)); the
+                                  profiler skips itself if it is among the values
+            top (int): Source lines to keep in growth
+
+        Returns:
+            MemorySample: The new sample
+
+        Raises:
+            RuntimeError: If tracemalloc isn't tracing (call start_tracing() first)
+        """
+        if not tracemalloc.is_tracing():
+            raise RuntimeError("tracemalloc is not tracing; call start_tracing() first.")
+        objects: dict[str, int] = {}
+        for key, value in session_items.items():
+            if value is self:
+                continue
+            group = classify(key, value)
+            objects[group] = objects.get(group, 0) + deep_sizeof(value)
+
+        # Leave out tracemalloc's own bookkeeping and this module's, or they show up as growth
+        snapshot = tracemalloc.take_snapshot().filter_traces([
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),
+        ])
+        stats = snapshot.statistics("lineno")
+        lines = {short_location(stat.traceback[0]): (stat.size, stat.count) for stat in stats}
+        if self._lines is not None:
+            previous = self._lines
+            growth = [
+                MemoryGrowth(location, size, size - previous.get(location, (0, 0))[0], count - previous.get(location, (0, 0))[1])
+                for location, (size, count) in lines.items()
+            ]
+            growth += [
+                MemoryGrowth(location, 0, -size, -count)
+                for location, (size, count) in previous.items() if location not in lines
+            ]
+            growth.sort(key=lambda row: abs(row.size_diff_bytes), reverse=True)
+            self.growth = growth[:top]
+        self._lines = lines
+
+        traced, peak = tracemalloc.get_traced_memory()
+        sample = MemorySample(time.time(), traced, peak, rss_bytes(), objects, traced_by_package(stats))
+        self.samples.append(sample)
+        return sample
+
+    def maybe_sample(self, session_items: dict, now: float | None = None) -> MemorySample | None:
+        """Take a sample if one is due, else return None."""
+        return self.sample(session_items) if self.due(now) else None
+
+    def report(self) -> dict:
+        """Every sample and the latest growth, as a JSON-serializable dict."""
+        return {
+            "interval_s": self.interval,
+            "samples": [sample._asdict() for sample in self.samples],
+            "growth": [row._asdict() for row in self.growth],
+        }
+
+    def to_json(self) -> str:
+        return json.dumps(self.report(), indent=2)
+
+
+def interval_from_env(default: float = DEFAULT_INTERVAL) -> float:
+    """Seconds between samples from RIZZK_MEMPROF_INTERVAL, or default if unset or invalid."""
+    try:
+        value = float(os.environ[MEMPROF_INTERVAL_ENV])
+    except (KeyError, ValueError):
+        return default
+    return value if value >= 0 else default
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Monte Carlo equity-curve simulation for the RIZZK Risk-to-Reward Calculator.
+Compounds fixed-fractional sizing over many trades and many simulated paths.
+"""
+
+from typing import NamedTuple
+
+import numpy as np
+
+DEFAULT_PERCENTILES = (5, 25, 50, 75, 95)
+
+
+class MonteCarloResult(NamedTuple):
+    """Per-path outcomes of simulate_equity_curves."""
+    terminal_equity: np.ndarray
+    max_drawdown: np.ndarray
+    ruined: np.ndarray
+
+    @property
+    def risk_of_ruin(self) -> float:
+        """Fraction of paths that hit the ruin level."""
+        return float(self.ruined.mean())
+
+    def terminal_percentiles(self, q: tuple[float, ...] = DEFAULT_PERCENTILES) -> dict[float, float]:
+        """Terminal equity in dollars at each percentile."""
+        return dict(zip(q, np.percentile(self.terminal_equity, q).tolist()))
+
+    def drawdown_percentiles(self, q: tuple[float, ...] = DEFAULT_PERCENTILES) -> dict[float, float]:
+        """Maximum peak-to-trough drawdown (0-1) at each percentile."""
+        return dict(zip(q, np.percentile(self.max_drawdown, q).tolist()))
+
+
+def chunk_seeds(seed: int | None, n_paths: int, chunk_size: int) -> list[np.random.SeedSequence]:
+    """
+    Independent seed per chunk of paths.
+
+    Seeding by chunk index (not by worker) keeps results identical however the
+    chunks are scheduled.
+    """
+    n_chunks = -(-n_paths // chunk_size)
+    return np.random.SeedSequence(seed).spawn(n_chunks)
+
+
+def check_simulation_inputs(
+    account_size: float,
+    risk_percentage: float,
+    win_rate: float,
+    reward_multiple: float,
+    n_trades: int,
+    n_paths: int,
+    stop_distance: float | None,
+    chunk_size: int
+) -> None:
+    """Raise ValueError for simulation inputs simulate_equity_curves would reject."""
+    if account_size <= 0:
+        raise ValueError("Account size must be greater than 0.")
+    if risk_percentage <= 0 or risk_percentage > 100:
+        raise ValueError("Risk percentage must be between 0 and 100.")
+    if not 0 <= win_rate <= 1:
+        raise ValueError("Win rate must be between 0 and 1.")
+    if reward_multiple <= 0:
+        raise ValueError("Reward multiple must be greater than 0.")
+    if n_trades <= 0 or n_paths <= 0 or chunk_size <= 0:
+        raise ValueError("Trade, path and chunk counts must be greater than 0.")
+    if stop_distance is not None and stop_distance <= 0:
+        raise ValueError("Stop distance must be greater than 0.")
+
+
+def simulate_chunk(
+    seed: np.random.SeedSequence,
+    n_paths: int,
+    account_size: float,
+    risk_percentage: float,
+    win_rate: float,
+    reward_multiple: float,
+    n_trades: int,
+    stop_distance: float | None = None,
+    ruin_level: float = 0.5
+) -> MonteCarloResult:
+    """
+    Simulate one chunk of paths; see simulate_equity_curves for the arguments.
+
+    Memory is O(n_paths): trades are stepped one at a time across all paths.
+    """
+    rng = np.random.default_rng(seed)
+    equity = np.full(n_paths, float(account_size))
+    peak = equity.copy()
+    max_drawdown = np.zeros(n_paths)
+    ruined = np.zeros(n_paths, dtype=bool)
+    ruin_equity = account_size * ruin_level
+
+    for _ in range(n_trades):
+        # Same formula as calculate_risk_reward in "% of Account" mode
+        risk_amount = equity * (risk_percentage / 100)
+        if stop_distance is not None:
+            # Whole shares only, like position_size_rounded
+            risk_amount = np.trunc(risk_amount / stop_distance) * stop_distance
+        wins = rng.random(n_paths) < win_rate
+        pnl = np.where(wins, risk_amount * reward_multiple, -risk_amount)
+        # Ruined paths stop trading
+        equity += np.where(ruined, 0.0, pnl)
+
+        np.maximum(peak, equity, out=peak)
+        np.maximum(max_drawdown, 1 - equity / peak, out=max_drawdown)
+        ruined |= equity <= ruin_equity
+
+    return MonteCarloResult(equity, max_drawdown, ruined)
+
+
+def simulate_equity_curves(
+    account_size: float,
+    risk_percentage: float,
+    win_rate: float,
+    reward_multiple: float = 2.0,
+    n_trades: int = 1000,
+    n_paths: int = 100_000,
+    stop_distance: float | None = None,
+    ruin_level: float = 0.5,
+    chunk_size: int = 8192,
+    seed: int | None = None
+) -> MonteCarloResult:
+    """
+    Simulate fixed-fractional equity curves driven by R-multiple outcomes.
+
+    Each trade risks risk_percentage of the current equity (1R); a win pays
+    reward_multiple R (1.0 for the 1:1 target, 2.0 for 2:1), a loss costs 1R.
+
+    Args:
+        account_size (float): Starting account size in dollars
+        risk_percentage (float): Percent of current equity risked per trade (0-100)
+        win_rate (float): Probability of hitting the target (0-1)
+        reward_multiple (float): Reward in R for a winning trade
+        n_trades (int): Trades per path
+        n_paths (int): Number of simulated paths
+        stop_distance (float | None): Entry-to-stop distance per share; when given,
+                                      positions are rounded down to whole shares
+        ruin_level (float): Fraction of the starting account at or below which a
+                            path counts as ruined and stops trading
+        chunk_size (int): Paths simulated at once; bounds peak memory
+        seed (int | None): Seed for reproducible results
+
+    Returns:
+        MonteCarloResult: Terminal equity, max drawdown and ruin flag per path
+
+    Raises:
+        ValueError: If inputs are invalid
+    """
+    check_simulation_inputs(
+        account_size, risk_percentage, win_rate, reward_multiple, n_trades, n_paths, stop_distance, chunk_size
+    )
+
+    chunks = []
+    for index, seed_seq in enumerate(chunk_seeds(seed, n_paths, chunk_size)):
+        paths = min(chunk_size, n_paths - index * chunk_size)
+        chunks.append(simulate_chunk(
+            seed_seq, paths, account_size, risk_percentage, win_rate,
+            reward_multiple, n_trades, stop_distance, ruin_level
+        ))
+
+    return MonteCarloResult(*(np.concatenate(column) for column in zip(*chunks)))
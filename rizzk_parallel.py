@@ -0,0 +1,298 @@
+#!/usr/bin/env python3
+"""
+Process-pool execution backend for large RIZZK batches, sweeps and simulations.
+Shards work across worker processes; arrays travel through shared memory.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from typing import Callable, Literal
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from rizzk_core import (
+    ERR_OK,
+    TradeMetrics,
+    TradeResult,
+    apply_batch_errors,
+    broadcast_batch_inputs,
+    risk_reward_flags_kernel,
+    trade_metrics_columns,
+    trade_metrics_from_columns,
+)
+from rizzk_montecarlo import MonteCarloResult, check_simulation_inputs, chunk_seeds, simulate_chunk
+from rizzk_sweep import SweepResult, sweep_entry_stop
+
+# (shared memory block name, shape, dtype string) - all a worker needs to map an array
+ArraySpec = tuple[str, tuple[int, ...], str]
+
+
+def _view(block: SharedMemory, spec: ArraySpec) -> np.ndarray:
+    return np.ndarray(spec[1], dtype=spec[2], buffer=block.buf)
+
+
+def _run_shard(task: Callable, in_specs: list[ArraySpec], out_specs: list[ArraySpec], *args) -> None:
+    """Worker entry point: map the shared arrays and run task(inputs, outputs, *args)."""
+    in_blocks = [SharedMemory(name=spec[0]) for spec in in_specs]
+    out_blocks = [SharedMemory(name=spec[0]) for spec in out_specs]
+    try:
+        # The views only live for the duration of the call, so the blocks can close after
+        task(
+            [_view(block, spec) for block, spec in zip(in_blocks, in_specs)],
+            [_view(block, spec) for block, spec in zip(out_blocks, out_specs)],
+            *args
+        )
+    finally:
+        for block in in_blocks + out_blocks:
+            block.close()
+
+
+def _risk_reward_task(inputs: list[np.ndarray], outputs: list[np.ndarray], start: int, stop: int) -> None:
+    sizing, _, _, _, error_codes = risk_reward_flags_kernel(*(column[start:stop] for column in inputs))
+    for out, column in zip(outputs, sizing + [error_codes]):
+        out[start:stop] = column
+
+
+def _trade_metrics_task(inputs: list[np.ndarray], outputs: list[np.ndarray], start: int, stop: int) -> None:
+    kernel = risk_reward_flags_kernel(*(column[start:stop] for column in inputs))
+    for out, column in zip(outputs, trade_metrics_columns(kernel) + [kernel.error_codes]):
+        out[start:stop] = column
+
+
+def _sweep_task(
+    inputs: list[np.ndarray],
+    outputs: list[np.ndarray],
+    start: int,
+    stop: int,
+    position_type: str,
+    account_size: float,
+    risk_mode: str,
+    risk_input: float
+) -> None:
+    entries, stops = inputs
+    result = sweep_entry_stop(position_type, account_size, risk_mode, risk_input, entries[start:stop], stops)
+    for out, grid in zip(outputs, result[2:]):
+        out[start:stop] = np.ma.getdata(grid)
+
+
+def _simulation_task(
+    inputs: list[np.ndarray],
+    outputs: list[np.ndarray],
+    seeds: list[tuple[int, np.random.SeedSequence, int]],
+    *simulation_args
+) -> None:
+    for offset, seed, n_paths in seeds:
+        for out, column in zip(outputs, simulate_chunk(seed, n_paths, *simulation_args)):
+            out[offset:offset + n_paths] = column
+
+
+class _SharedArrays:
+    """Shared memory blocks owned by one parallel call; unlinked on close()."""
+
+    def __init__(self):
+        self._blocks: dict[str, SharedMemory] = {}
+
+    def put(self, array: np.ndarray) -> ArraySpec:
+        spec = self.empty(array.shape, array.dtype)
+        _view(self._blocks[spec[0]], spec)[...] = array
+        return spec
+
+    def empty(self, shape: tuple[int, ...], dtype) -> ArraySpec:
+        dtype = np.dtype(dtype)
+        block = SharedMemory(create=True, size=max(int(np.prod(shape)) * dtype.itemsize, 1))
+        self._blocks[block.name] = block
+        return block.name, tuple(shape), dtype.str
+
+    def get(self, spec: ArraySpec) -> np.ndarray:
+        """Copy an array out so it outlives the shared block."""
+        return _view(self._blocks[spec[0]], spec).copy()
+
+    def close(self) -> None:
+        for block in self._blocks.values():
+            block.close()
+            block.unlink()
+        self._blocks.clear()
+
+
+class ParallelBackend:
+    """
+    Runs batch sizing, sweeps and Monte Carlo simulations on a process pool.
+
+    Results are identical to the single-process functions: every element is
+    computed by the same code, and simulations seed by chunk, not by worker.
+    Use as a context manager (or call close()) to shut the pool down.
+    """
+
+    def __init__(self, workers: int | None = None, min_shard_rows: int = 65_536):
+        self.workers = workers or os.cpu_count() or 1
+        self.min_shard_rows = min_shard_rows
+        self._executor = ProcessPoolExecutor(max_workers=self.workers)
+
+    def __enter__(self) -> "ParallelBackend":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Shut down the worker pool."""
+        self._executor.shutdown()
+
+    def _shards(self, n_rows: int, min_rows: int) -> list[tuple[int, int]]:
+        """Split rows into ~4 shards per worker, each at least min_rows long."""
+        size = max(-(-n_rows // (4 * self.workers)), min_rows)
+        return [(start, min(start + size, n_rows)) for start in range(0, n_rows, size)]
+
+    def _run(self, task: Callable, in_specs: list[ArraySpec], out_specs: list[ArraySpec], shard_args: list[tuple]) -> None:
+        futures = [
+            self._executor.submit(_run_shard, task, in_specs, out_specs, *args) for args in shard_args
+        ]
+        for future in futures:
+            future.result()
+
+    def risk_reward_batch(
+        self,
+        position_types: ArrayLike,
+        account_sizes: ArrayLike,
+        risk_modes: ArrayLike,
+        risk_inputs: ArrayLike,
+        entry_prices: ArrayLike,
+        stop_losses: ArrayLike,
+        errors: Literal["raise", "mask"] = "raise"
+    ) -> TradeResult:
+        """Parallel calculate_risk_reward_batch; same arguments and results."""
+        inputs = broadcast_batch_inputs(
+            position_types, account_sizes, risk_modes, risk_inputs, entry_prices, stop_losses
+        )
+        shape = inputs[0].shape
+        n_rows = inputs[0].size
+        shared = _SharedArrays()
+        try:
+            in_specs = [shared.put(column.ravel()) for column in inputs]
+            out_specs = [shared.empty((n_rows,), np.float64) for _ in range(5)] + [shared.empty((n_rows,), np.int8)]
+            self._run(_risk_reward_task, in_specs, out_specs, self._shards(n_rows, self.min_shard_rows))
+            *sizing, error_codes = (shared.get(spec).reshape(shape) for spec in out_specs)
+        finally:
+            shared.close()
+
+        position_size, risk_amount, profit_1_1, profit_2_1, stop_loss_amount = apply_batch_errors(
+            sizing, error_codes, errors
+        )
+        position_size_rounded = np.trunc(np.nan_to_num(position_size)).astype(np.int64)
+        return TradeResult(position_size, position_size_rounded, risk_amount, profit_1_1, profit_2_1, stop_loss_amount)
+
+    def trade_metrics_columns(
+        self,
+        position_types: ArrayLike,
+        account_sizes: ArrayLike,
+        risk_modes: ArrayLike,
+        risk_inputs: ArrayLike,
+        entry_prices: ArrayLike,
+        stop_losses: ArrayLike
+    ) -> tuple[list[np.ndarray], np.ndarray]:
+        """
+        Parallel rizzk_core.trade_metrics_columns over the batch kernel.
+
+        Returns:
+            tuple[list[np.ndarray], np.ndarray]: (unchecked metric columns, per-row ERR_* codes),
+                                                 for trade_metrics_from_columns
+        """
+        inputs = broadcast_batch_inputs(
+            position_types, account_sizes, risk_modes, risk_inputs, entry_prices, stop_losses
+        )
+        shape = inputs[0].shape
+        n_rows = inputs[0].size
+        shared = _SharedArrays()
+        try:
+            in_specs = [shared.put(column.ravel()) for column in inputs]
+            out_specs = [shared.empty((n_rows,), np.float64) for _ in range(8)] + [shared.empty((n_rows,), np.int8)]
+            self._run(_trade_metrics_task, in_specs, out_specs, self._shards(n_rows, self.min_shard_rows))
+            *columns, error_codes = (shared.get(spec).reshape(shape) for spec in out_specs)
+        finally:
+            shared.close()
+        return columns, error_codes
+
+    def trade_metrics_batch(
+        self,
+        position_types: ArrayLike,
+        account_sizes: ArrayLike,
+        risk_modes: ArrayLike,
+        risk_inputs: ArrayLike,
+        entry_prices: ArrayLike,
+        stop_losses: ArrayLike,
+        errors: Literal["raise", "mask"] = "raise"
+    ) -> TradeMetrics:
+        """Parallel calculate_trade_metrics_batch; same arguments and results."""
+        columns, error_codes = self.trade_metrics_columns(
+            position_types, account_sizes, risk_modes, risk_inputs, entry_prices, stop_losses
+        )
+        return trade_metrics_from_columns(columns, error_codes, errors)
+
+    def sweep_entry_stop(
+        self,
+        position_type: Literal["Long", "Short"],
+        account_size: float,
+        risk_mode: Literal["% of Account", "Fixed $ Amount"],
+        risk_input: float,
+        entries: ArrayLike,
+        stops: ArrayLike
+    ) -> SweepResult:
+        """Parallel rizzk_sweep.sweep_entry_stop, sharded by entry rows."""
+        entries = np.asarray(entries, dtype=np.float64)
+        stops = np.asarray(stops, dtype=np.float64)
+        shape = (len(entries), len(stops))
+        dtypes = [np.float64, np.int64, np.float64, np.float64, np.float64, np.float64, np.int8]
+        min_rows = max(self.min_shard_rows // max(len(stops), 1), 1)
+        shared = _SharedArrays()
+        try:
+            in_specs = [shared.put(entries), shared.put(stops)]
+            out_specs = [shared.empty(shape, dtype) for dtype in dtypes]
+            self._run(_sweep_task, in_specs, out_specs, [
+                (start, stop, position_type, account_size, risk_mode, risk_input)
+                for start, stop in self._shards(len(entries), min_rows)
+            ])
+            *grids, error_codes = (shared.get(spec) for spec in out_specs)
+        finally:
+            shared.close()
+
+        invalid = error_codes != ERR_OK
+        return SweepResult(
+            entries, stops, *(np.ma.masked_array(grid, mask=invalid) for grid in grids), error_codes
+        )
+
+    def simulate_equity_curves(
+        self,
+        account_size: float,
+        risk_percentage: float,
+        win_rate: float,
+        reward_multiple: float = 2.0,
+        n_trades: int = 1000,
+        n_paths: int = 100_000,
+        stop_distance: float | None = None,
+        ruin_level: float = 0.5,
+        chunk_size: int = 8192,
+        seed: int | None = None
+    ) -> MonteCarloResult:
+        """Parallel rizzk_montecarlo.simulate_equity_curves, sharded by chunk of paths."""
+        check_simulation_inputs(
+            account_size, risk_percentage, win_rate, reward_multiple, n_trades, n_paths, stop_distance, chunk_size
+        )
+        chunks = [
+            (index * chunk_size, seed_seq, min(chunk_size, n_paths - index * chunk_size))
+            for index, seed_seq in enumerate(chunk_seeds(seed, n_paths, chunk_size))
+        ]
+        per_shard = -(-len(chunks) // (4 * self.workers))
+        shared = _SharedArrays()
+        try:
+            out_specs = [shared.empty((n_paths,), dtype) for dtype in (np.float64, np.float64, np.bool_)]
+            self._run(_simulation_task, [], out_specs, [
+                (chunks[i:i + per_shard], account_size, risk_percentage, win_rate, reward_multiple,
+                 n_trades, stop_distance, ruin_level)
+                for i in range(0, len(chunks), per_shard)
+            ])
+            result = MonteCarloResult(*(shared.get(spec) for spec in out_specs))
+        finally:
+            shared.close()
+        return result
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Render latency tracking for the RIZZK Streamlit app.
+
+Each app section (the whole script run, or one fragment) records how long it
+took into a rolling window, so per-interaction costs can be compared.
+"""
+
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Iterator, NamedTuple
+
+import numpy as np
+
+DEFAULT_WINDOW = 200
+
+
+class LatencySummary(NamedTuple):
+    """Rolling latency for one section, in milliseconds."""
+    section: str
+    runs: int
+    last_ms: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+
+
+class LatencyLog:
+    """Keeps the last window timings (seconds) of every section."""
+
+    def __init__(self, window: int = DEFAULT_WINDOW):
+        self.window = window
+        self._samples: dict[str, deque[float]] = {}
+        self._runs: dict[str, int] = {}
+
+    def record(self, section: str, seconds: float) -> None:
+        self._samples.setdefault(section, deque(maxlen=self.window)).append(seconds)
+        self._runs[section] = self._runs.get(section, 0) + 1
+
+    @contextmanager
+    def time(self, section: str) -> Iterator[None]:
+        """Record the wall time of the with-block, even if it exits early (st.stop, st.rerun)."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(section, time.perf_counter() - start)
+
+    def summary(self) -> list[LatencySummary]:
+        """One row per section, in the order sections were first recorded."""
+        rows = []
+        for section, samples in self._samples.items():
+            p50, p95, p99 = np.percentile(np.fromiter(samples, dtype=np.float64), [50, 95, 99]) * 1000
+            rows.append(LatencySummary(section, self._runs[section], samples[-1] * 1000, float(p50), float(p95), float(p99)))
+        return rows
+
+    def clear(self) -> None:
+        self._samples.clear()
+        self._runs.clear()
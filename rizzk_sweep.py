@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Entry x stop parameter sweeps for the RIZZK Risk-to-Reward Calculator.
+Evaluates the core sizing math over a whole grid of price levels with broadcasting.
+"""
+
+from typing import Literal, NamedTuple
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from rizzk_core import ERR_OK, risk_reward_kernel
+
+
+class SweepResult(NamedTuple):
+    """Sizing over an entry x stop grid; rows follow entries, columns follow stops.
+
+    Metric grids are masked arrays: cells the core would reject (stop on the wrong
+    side, oversized position, ...) are masked and their reason is in error_codes.
+    """
+    entries: np.ndarray
+    stops: np.ndarray
+    position_size: np.ma.MaskedArray
+    position_size_rounded: np.ma.MaskedArray
+    risk_amount: np.ma.MaskedArray
+    rounded_risk_amount: np.ma.MaskedArray
+    profit_1_1: np.ma.MaskedArray
+    profit_2_1: np.ma.MaskedArray
+    error_codes: np.ndarray
+
+
+def price_levels(center: float, span_pct: float, levels: int) -> np.ndarray:
+    """
+    Evenly spaced candidate prices around a level.
+
+    Args:
+        center (float): Price to center the levels on
+        span_pct (float): Half-width of the range as a percentage of center
+        levels (int): Number of price levels
+
+    Returns:
+        np.ndarray: Ascending prices from center * (1 - span) to center * (1 + span)
+    """
+    span = center * span_pct / 100
+    return np.linspace(center - span, center + span, levels)
+
+
+def price_slider_range(center: float, span_pct: float, ticks: int = 1000) -> tuple[float, float, float]:
+    """
+    Bounds and step for a price slider around a level, on a fixed tick grid.
+
+    The step is the largest power of ten (at least one cent) that still gives
+    about ticks positions across the range, and both bounds sit on that grid.
+    Every slider value is then a grid price, so the same prices recur as the
+    slider moves back and forth and memoized calculations hit their cache.
+
+    Args:
+        center (float): Price to center the range on (> 0)
+        span_pct (float): Half-width of the range as a percentage of center (> 0)
+        ticks (int): Approximate number of slider positions
+
+    Returns:
+        tuple[float, float, float]: (low, high, step), with step <= low < high
+
+    Raises:
+        ValueError: If center, span_pct or ticks is not positive
+    """
+    if center <= 0 or span_pct <= 0 or ticks <= 0:
+        raise ValueError("center, span_pct and ticks must be greater than 0")
+    span = center * span_pct / 100
+    step = max(10.0 ** np.floor(np.log10(2 * span / ticks)), 0.01)
+    low = max(np.floor((center - span) / step), 1.0) * step
+    high = max(np.ceil((center + span) / step), np.floor((center - span) / step) + 1, 2.0) * step
+    return round(float(low), 2), round(float(high), 2), round(float(step), 2)
+
+
+def sweep_entry_stop(
+    position_type: Literal["Long", "Short"],
+    account_size: float,
+    risk_mode: Literal["% of Account", "Fixed $ Amount"],
+    risk_input: float,
+    entries: ArrayLike,
+    stops: ArrayLike
+) -> SweepResult:
+    """
+    Size every combination of candidate entry and stop in one broadcast pass.
+
+    Args:
+        position_type (Literal["Long", "Short"]): "Long" or "Short"
+        account_size (float): Total account size in dollars
+        risk_mode (Literal["% of Account", "Fixed $ Amount"]): Risk calculation mode
+        risk_input (float): Risk percentage (0-100) or fixed risk amount in dollars
+        entries (ArrayLike): Candidate entry prices (grid rows)
+        stops (ArrayLike): Candidate stop loss prices (grid columns)
+
+    Returns:
+        SweepResult: len(entries) x len(stops) grids of the sizing outputs
+    """
+    entries = np.asarray(entries, dtype=np.float64)
+    stops = np.asarray(stops, dtype=np.float64)
+    sizing, _, _, distance, error_codes = risk_reward_kernel(
+        position_type, account_size, risk_mode, risk_input, entries[:, None], stops[None, :]
+    )
+    position_size, risk_amount, profit_1_1, profit_2_1, _ = sizing
+    invalid = error_codes != ERR_OK
+
+    position_size_rounded = np.trunc(np.where(invalid, 0, position_size)).astype(np.int64)
+    # Dollars actually at risk once the position is rounded down to whole shares
+    rounded_risk_amount = position_size_rounded * distance
+
+    def masked(grid: np.ndarray) -> np.ma.MaskedArray:
+        return np.ma.masked_array(grid, mask=invalid)
+
+    return SweepResult(
+        entries,
+        stops,
+        masked(position_size),
+        masked(position_size_rounded),
+        masked(risk_amount),
+        masked(rounded_risk_amount),
+        masked(profit_1_1),
+        masked(profit_2_1),
+        error_codes,
+    )
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Headless tests of the RIZZK Streamlit app, driven with Streamlit's AppTest.
+"""
+
+import os
+
+import pytest
+from streamlit.testing.v1 import AppTest
+
+APP = os.path.join(os.path.dirname(os.path.abspath(__file__)), "app.py")
+
+
+@pytest.fixture
+def app(monkeypatch):
+    monkeypatch.delenv("RIZZK_HISTORY_DB", raising=False)
+    return AppTest.from_file(APP, default_timeout=30).run()
+
+
+def _submit(app, **values):
+    for label, value in values.items():
+        next(widget for widget in app.number_input if widget.label == label).set_value(value)
+    next(button for button in app.button if button.label == "Calculate").click()
+    return app.run()
+
+
+def test_invalid_setup_stays_in_results_panel(app):
+    """A setup the core rejects shows its error in the results panel, on later reruns too."""
+    _submit(app, **{"💥 Stop Loss Price ($)": 105.0})
+    for _ in range(2):
+        assert not app.exception
+        assert [e.value for e in app.error] == ["Entry price must be higher than stop loss for long positions."]
+        assert any(h.value.endswith("Calculation History") for h in app.header)
+        app.sidebar.checkbox[0].check().run()
+    assert len(app.session_state["history"]) == 0
+
+
+def test_sweep_heatmap_only_renders_on_request(app):
+    """The collapsed-by-default sweep builds no heatmap until its toggle is switched on."""
+    _submit(app)
+    assert len(app.get("plotly_chart")) == 1
+
+    next(toggle for toggle in app.toggle if toggle.label == "Show sweep").set_value(True).run()
+    assert not app.exception
+    assert len(app.get("plotly_chart")) == 2
+
+
+def test_bulk_sizing_flags_malformed_rows(app):
+    """A non-numeric cell in a pasted plan marks that row instead of rejecting the plan."""
+    app.text_area(key="bulk_text").input("position_type,entry_price,stop_loss\nLong,100,95\nLong,abc,95").run()
+    assert not app.exception and not app.error
+    sized = app.dataframe[0].value
+    assert sized["error"].tolist() == ["", "Account size, risk, entry and stop must be numbers."]
+
+
+def test_shared_history_is_per_session(monkeypatch, tmp_path):
+    """With RIZZK_HISTORY_DB set, sessions don't see or clear each other's calculations."""
+    monkeypatch.setenv("RIZZK_HISTORY_DB", str(tmp_path / "history.db"))
+    first = AppTest.from_file(APP, default_timeout=30).run()
+    _submit(first)
+    second = AppTest.from_file(APP, default_timeout=30).run()
+    _submit(second)
+    _submit(second)
+
+    assert (len(first.session_state["history"]), len(second.session_state["history"])) == (1, 2)
+    next(button for button in second.button if button.label == "Clear All History").click().run()
+    assert (len(first.session_state["history"]), len(second.session_state["history"])) == (1, 0)
+
+
+@pytest.mark.parametrize("targets, message", [
+    ("1, nan", "Profit target R multiples must be finite numbers greater than 0."),
+    ("inf", "Profit target R multiples must be finite numbers greater than 0."),
+    ("2, -1", "Profit target R multiples must be finite numbers greater than 0."),
+    ("1, two", "Profit targets must be comma-separated numbers."),
+])
+def test_invalid_profit_targets_are_rejected(app, targets, message):
+    """NaN, infinite, non-positive and unparseable R multiples get an error, not a crash or infinite targets."""
+    app.text_input[0].input(targets)
+    _submit(app)
+    assert not app.exception
+    assert [e.value for e in app.error] == [message]
+    assert len(app.session_state["history"]) == 0
+
+
+def test_untouched_what_if_sliders_show_no_deltas(app):
+    """Off-grid submitted prices snap onto the slider grid without counting as a move."""
+    _submit(app, **{"Entry Price ($)": 1000.05, "💥 Stop Loss Price ($)": 990.03})
+    assert not app.exception
+    what_if = next(e for e in app.expander if e.label == "What-If Sliders")
+    assert [s.value for s in what_if.slider] == [1000.0, 990.0]
+    tiles = what_if.metric
+    assert len(tiles) == 5 and not any(tile.delta for tile in tiles)
+
+    what_if.slider[0].set_value(1001.0).run()
+    what_if = next(e for e in app.expander if e.label == "What-If Sliders")
+    assert what_if.metric[0].delta
+
+
+def test_anonymous_history_survives_a_reload(monkeypatch, tmp_path):
+    """Without sign-in, the history token in the URL brings a reloaded page back to the same rows."""
+    monkeypatch.setenv("RIZZK_HISTORY_DB", str(tmp_path / "history.db"))
+    first = AppTest.from_file(APP, default_timeout=30).run()
+    _submit(first)
+    token = first.query_params["history"]
+
+    reloaded = AppTest.from_file(APP, default_timeout=30)
+    reloaded.query_params["history"] = token
+    reloaded.run()
+    assert len(reloaded.session_state["history"]) == 1
+
+    stranger = AppTest.from_file(APP, default_timeout=30)
+    stranger.query_params["history"] = "not-a-token"
+    stranger.run()
+    assert len(stranger.session_state["history"]) == 0 and stranger.query_params["history"] != token
+
+
+def test_low_latency_toggle_swaps_the_results_chart(app):
+    """Low-latency mode draws the results bars with Vega-Lite instead of Plotly."""
+    _submit(app)
+    assert len(app.get("plotly_chart")) == 1
+    assert not app.get("vega_lite_chart")
+    next(c for c in app.sidebar.checkbox if c.label == "⚡ Low-latency charts").check().run()
+    assert not app.exception
+    assert len(app.get("vega_lite_chart")) == 1
+    assert not app.get("plotly_chart")
+
+
+@pytest.mark.parametrize("flag", [None, "1"])
+def test_render_latency_panel_needs_debug_timings(monkeypatch, flag):
+    """The sidebar latency table only renders when DEBUG_TIMINGS is set."""
+    monkeypatch.delenv("RIZZK_HISTORY_DB", raising=False)
+    if flag is None:
+        monkeypatch.delenv("DEBUG_TIMINGS", raising=False)
+    else:
+        monkeypatch.setenv("DEBUG_TIMINGS", flag)
+    app = _submit(AppTest.from_file(APP, default_timeout=30).run())
+    assert not app.exception
+    panels = [e for e in app.sidebar.expander if e.label == "Render Latency"]
+    assert len(panels) == (flag is not None)
+    if panels:
+        assert "| full run |" in panels[0].markdown[0].value
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the RIZZK LRU result cache.
+"""
+
+import time
+
+import numpy as np
+import pytest
+from rizzk_cache import (
+    RESULT_CACHE,
+    LRUCache,
+    SQLiteCache,
+    TieredCache,
+    cache_size_from_env,
+    cached_profit_ladder,
+    memoize,
+)
+from rizzk_core import calculate_profit_ladder
+
+
+def test_lru_eviction_and_counters():
+    """The least recently used entry is evicted first and every lookup is counted."""
+    cache = LRUCache(maxsize=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1  # "b" is now least recently used
+    cache.put("c", 3)
+
+    assert "b" not in cache
+    assert cache.get("b") is None
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.evictions, stats.size) == (1, 1, 1, 2)
+    assert stats.hit_rate == 0.5
+
+
+def test_cached_ladder_normalizes_inputs():
+    """Equivalent inputs share one entry, positional or keyword; results match the core and errors aren't cached."""
+    RESULT_CACHE.clear()
+    first = cached_profit_ladder(100, 95, 20, [1, 2])
+    again = cached_profit_ladder(100.0, np.float64(95.0), 20.0, np.array([1.0, 2.0]), None, "Long")
+    by_keyword = cached_profit_ladder(100.0, 95.0, 20.0, (1, 2), position_type="Long")
+
+    assert first is again is by_keyword
+    assert np.array_equal(first.target_prices, calculate_profit_ladder(100.0, 95.0, 20.0, [1, 2]).target_prices)
+    assert cached_profit_ladder(100.0, 95.0, 20.0, [1, 2], None, "Short") is not first
+    assert RESULT_CACHE.stats()[:3] == (2, 2, 0)
+
+    for _ in range(2):
+        with pytest.raises(ValueError, match="finite numbers greater than 0"):
+            cached_profit_ladder(100.0, 95.0, 20.0, [0])
+    assert len(RESULT_CACHE) == 2
+    with pytest.raises(TypeError):
+        cached_profit_ladder(100.0, 95.0)
+
+
+def test_cache_size_configuration(monkeypatch):
+    """RIZZK_CACHE_SIZE sets the bound; a size of 0 disables storage."""
+    monkeypatch.setenv("RIZZK_CACHE_SIZE", "0")
+    assert cache_size_from_env() == 0
+    monkeypatch.setenv("RIZZK_CACHE_SIZE", "lots")
+    assert cache_size_from_env(64) == 64
+
+    calls = []
+    disabled = LRUCache(maxsize=0)
+    square = memoize(disabled)(lambda x: calls.append(x) or x * x)
+    assert square(3) == square(3) == 9
+    assert len(calls) == 2 and len(disabled) == 0
+
+
+def test_ttl_expires_entries(monkeypatch):
+    """Entries past their TTL are dropped and counted as expirations, in memory and on disk."""
+    clock = [1000.0]
+    monkeypatch.setattr(time, "monotonic", lambda: clock[0])
+    monkeypatch.setattr(time, "time", lambda: clock[0])
+    for cache in (LRUCache(maxsize=8, ttl=60), SQLiteCache(":memory:", maxsize=8, ttl=60)):
+        cache.put("preset", 1)
+        clock[0] += 30
+        assert cache.get("preset") == 1
+        clock[0] += 31
+        assert cache.get("preset") is None
+        assert cache.stats().expirations == 1 and len(cache) == 0
+
+
+def test_sqlite_cache_shared_between_instances(tmp_path):
+    """A second process (here, a second connection) sees results stored by the first; tiers promote hits."""
+    path = str(tmp_path / "cache.db")
+    ladder_args = (100.0, 95.0, 20.0, [1, 2, 3])
+    writer = SQLiteCache(path, maxsize=2)
+    writer.put(("ladder",) + ladder_args[:3], cached_profit_ladder(*ladder_args))
+
+    reader = TieredCache(LRUCache(maxsize=4), SQLiteCache(path, maxsize=2))
+    ladder = reader.get(("ladder",) + ladder_args[:3])
+    assert np.array_equal(ladder.pnl, [100.0, 200.0, 300.0])
+    assert reader.get(("ladder",) + ladder_args[:3]) is ladder  # second hit comes from memory
+    assert reader.memory.stats().hits == 1 and reader.disk.stats().hits == 1
+
+    writer.put("b", 2)
+    writer.put("c", 3)
+    assert writer.stats().evictions == 1 and len(reader) == 2
+
+
+def test_promoted_entries_keep_their_remaining_ttl(monkeypatch):
+    """A disk hit promoted into memory expires when the disk entry would, not a full TTL later."""
+    clock = [1000.0]
+    monkeypatch.setattr(time, "monotonic", lambda: clock[0])
+    monkeypatch.setattr(time, "time", lambda: clock[0])
+    disk = SQLiteCache(":memory:", maxsize=8, ttl=60)
+    disk.put("preset", 1)
+    tiered = TieredCache(LRUCache(maxsize=8, ttl=60), disk)
+
+    clock[0] = 1050.0
+    assert tiered.get("preset") == 1 and "preset" in tiered.memory
+    clock[0] = 1061.0
+    assert tiered.get("preset") is None
+
+
+def test_sqlite_cache_cleans_up_in_batches(monkeypatch):
+    """Eviction waits for the high-water mark and purges expired rows on an interval, not on every put."""
+    clock = [1000.0]
+    monkeypatch.setattr(time, "time", lambda: clock[0])
+    cache = SQLiteCache(":memory:", maxsize=20, ttl=600)
+    for i in range(22):
+        cache.put(i, i)
+        clock[0] += 1
+    assert len(cache) == 22 and cache.stats().evictions == 0  # within 10% of maxsize
+    cache.put(22, 22)
+    assert len(cache) == 20 and cache.stats().evictions == 3
+    assert cache.get(0) is None and cache.get(22) == 22  # least recently used went first
+
+    clock[0] += 601
+    assert cache.get(22) is None  # expired rows are never returned...
+    cache.put("fresh", 1)
+    assert len(cache) == 1 and cache.stats().expirations == 20  # ...and the interval purge drops them
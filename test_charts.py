@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the RIZZK risk/reward chart builders.
+"""
+
+from rizzk_charts import BAR_COLOR, bar_chart_spec, bar_figure_template, fill_bar_figure, px_bar_figure
+
+LABELS = ["Risk", "1:1 Profit", "2:1 Profit"]
+
+
+def test_template_matches_plotly_express():
+    """A refilled template shows the same bars as the Plotly Express figure it replaces."""
+    template = bar_figure_template()
+    fill_bar_figure(template, LABELS, [50.0, 50.0, 100.0])
+    figure = fill_bar_figure(template, LABELS, [100.0, 100.0, 200.0])
+    expected = px_bar_figure(LABELS, [100.0, 100.0, 200.0])
+
+    assert figure is template and len(figure.data) == 1
+    assert list(figure.data[0].x) == list(expected.data[0].x)
+    assert list(figure.data[0].y) == list(expected.data[0].y)
+    assert figure.data[0].marker.color == expected.data[0].marker.color == BAR_COLOR
+    assert figure.layout.xaxis.title.text == expected.layout.xaxis.title.text
+
+
+def test_native_spec_keeps_bar_order():
+    """The Vega-Lite spec carries the data inline and doesn't sort the scenarios."""
+    spec = bar_chart_spec(LABELS, [100.0, 100.0, 200.0])
+
+    assert [row["Scenario"] for row in spec["data"]["values"]] == LABELS
+    assert spec["encoding"]["x"]["sort"] is None
@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the RIZZK streaming trade-plan sizer.
+"""
+
+import os
+import subprocess
+import sys
+from io import StringIO
+
+import numpy as np
+import pandas as pd
+import pytest
+from rizzk_cli import main
+from rizzk_core import (
+    ERR_NOT_A_NUMBER,
+    ERR_POSITION_TYPE,
+    ERR_RISK_MODE,
+    ERR_SHORT_STOP_BELOW_ENTRY,
+    ERR_STOP_LOSS,
+    calculate_risk_reward,
+)
+from rizzk_io import BINARY_HEADER_DTYPE, BINARY_RECORD_DTYPE, BinaryPlan, read_plan_chunks, write_binary_plan
+
+PLAN_CSV = """position_type,account_size,risk_mode,risk_input,entry_price,stop_loss
+Long,10000,% of Account,1,100,95
+Short,10000,% of Account,1,100,95
+Short,5000,Fixed $ Amount,75,12.5,13.05
+"""
+
+
+def test_csv_plan_in_small_chunks(tmp_path, capsys):
+    """Rows stream through in chunks; bad rows get error codes instead of aborting."""
+    plan = tmp_path / "plan.csv"
+    plan.write_text(PLAN_CSV)
+    out = tmp_path / "sized.csv"
+
+    assert main([str(plan), "-o", str(out), "--chunk-size", "2"]) == 0
+    sized = pd.read_csv(out)
+
+    assert len(sized) == 3
+    assert sized["error_code"].tolist() == [0, ERR_SHORT_STOP_BELOW_ENTRY, 0]
+    assert sized["error"][1] == "Entry price must be lower than stop loss for short positions."
+    expected = calculate_risk_reward("Short", 5000.0, "Fixed $ Amount", 75.0, 12.5, 13.05)
+    assert sized["position_size"][2] == expected.position_size
+    assert sized["position_size_rounded"][2] == expected.position_size_rounded
+    assert "rows/sec" in capsys.readouterr().err
+
+
+def test_ndjson_with_column_defaults(tmp_path, capsys):
+    """Missing plan columns can come from command-line defaults; NDJSON in and out."""
+    plan = tmp_path / "plan.ndjson"
+    plan.write_text(
+        '{"position_type": "Long", "entry_price": 50.0, "stop_loss": 48.0}\n'
+        '{"position_type": "Short", "entry_price": 20.0, "stop_loss": 21.0}\n'
+    )
+
+    assert main([str(plan), "--account-size", "25000", "--risk-mode", "% of Account", "--risk-input", "1", "-q"]) == 0
+    captured = capsys.readouterr()
+    sized = pd.read_json(StringIO(captured.out), lines=True)
+
+    assert sized["position_size"].tolist() == [125.0, 250.0]
+    assert captured.err == ""
+
+
+def test_missing_column_is_an_error(tmp_path, capsys):
+    """A plan without a required column and no default fails cleanly."""
+    plan = tmp_path / "plan.csv"
+    plan.write_text("position_type,entry_price,stop_loss\nLong,100,95\n")
+
+    assert main([str(plan), "-o", str(tmp_path / "out.csv")]) == 1
+    assert "missing the 'account_size' column" in capsys.readouterr().err
+
+
+def test_parquet_in_arrow_out(tmp_path, capsys):
+    """Parquet plans map straight onto the batch inputs; Arrow output memory-maps back zero-copy."""
+    pa = pytest.importorskip("pyarrow")
+    plan = tmp_path / "plan.parquet"
+    out = tmp_path / "sized.arrow"
+    pd.read_csv(StringIO(PLAN_CSV)).to_parquet(plan, index=False)
+
+    assert main([str(plan), "-o", str(out), "--chunk-size", "2", "-q"]) == 0
+    table = pa.ipc.open_file(pa.memory_map(str(out))).read_all()
+
+    assert table.num_rows == 3
+    assert table.column("error_code").to_pylist() == [0, ERR_SHORT_STOP_BELOW_ENTRY, 0]
+    assert table.column("error").to_pylist()[1] == "Entry price must be lower than stop loss for short positions."
+    position_size = table.column("position_size").chunk(0).to_numpy(zero_copy_only=True)
+    assert position_size[0] == 20.0
+
+
+def test_parquet_from_stdin_pipe(tmp_path):
+    """A Parquet plan piped into stdin (not seekable) is buffered instead of failing with an illegal seek."""
+    pytest.importorskip("pyarrow")
+    plan = tmp_path / "plan.parquet"
+    pd.read_csv(StringIO(PLAN_CSV)).to_parquet(plan, index=False)
+    cli = os.path.join(os.path.dirname(os.path.abspath(__file__)), "rizzk_cli.py")
+
+    run = subprocess.run(
+        [sys.executable, cli, "-f", "parquet", "--output-format", "csv", "-q", "-"],
+        input=plan.read_bytes(), capture_output=True, check=False
+    )
+    assert run.returncode == 0, run.stderr.decode()
+    sized = pd.read_csv(StringIO(run.stdout.decode()))
+    assert sized["error_code"].tolist() == [0, ERR_SHORT_STOP_BELOW_ENTRY, 0]
+
+
+def test_binary_plan_round_trip(tmp_path, capsys):
+    """A converted .rzk plan memory-maps back as column views and sizes like the CSV."""
+    plan = tmp_path / "plan.csv"
+    plan.write_text(PLAN_CSV)
+    binary = tmp_path / "plan.rzk"
+    assert main([str(plan), "--write-plan", str(binary), "-q"]) == 0
+
+    mapped = BinaryPlan(str(binary))
+    assert len(mapped) == 3
+    assert mapped.entry_price.tolist() == [100.0, 100.0, 12.5]
+    assert np.shares_memory(mapped.stop_loss, mapped.records)
+
+    from_csv, from_binary = tmp_path / "a.csv", tmp_path / "b.csv"
+    assert main([str(plan), "-o", str(from_csv), "-q"]) == 0
+    assert main([str(binary), "-o", str(from_binary), "--chunk-size", "2", "-q"]) == 0
+    pd.testing.assert_frame_equal(pd.read_csv(from_csv), pd.read_csv(from_binary))
+
+    (tmp_path / "bad.rzk").write_bytes(b"not a plan")
+    assert main([str(tmp_path / "bad.rzk")]) == 1
+    assert "not a RIZZK binary plan" in capsys.readouterr().err
+
+
+def test_unknown_labels_are_flagged(tmp_path):
+    """Free-text labels outside POSITION_TYPES / RISK_MODES get their own error codes, not a silent short."""
+    plan = tmp_path / "plan.csv"
+    plan.write_text(
+        "position_type,risk_mode,entry_price,stop_loss\n"
+        "long,% of Account,100,95\n"
+        "Long,percent,100,95\n"
+        "Long,% of Account,100,95\n"
+    )
+    out = tmp_path / "sized.csv"
+
+    assert main([str(plan), "-o", str(out), "--account-size", "10000", "--risk-input", "1", "-q"]) == 0
+    sized = pd.read_csv(out)
+
+    assert sized["error_code"].tolist() == [ERR_POSITION_TYPE, ERR_RISK_MODE, 0]
+    assert sized["error"][0] == "Position type must be Long or Short."
+    assert sized["position_size"].isna().tolist() == [True, True, False]
+
+
+def test_unparseable_numbers_are_flagged_per_row(tmp_path):
+    """A malformed numeric cell flags its own row instead of aborting the stream."""
+    plan = tmp_path / "plan.csv"
+    plan.write_text(
+        "position_type,entry_price,stop_loss\n"
+        "Long,100,95\n"
+        "Long,abc,95\n"
+        "Short,42.5,\n"
+        "Long,101,96\n"
+    )
+    out = tmp_path / "sized.csv"
+
+    assert main([
+        str(plan), "-o", str(out), "--account-size", "10000", "--risk-mode", "% of Account", "--risk-input", "1",
+        "--chunk-size", "2", "-q"
+    ]) == 0
+    sized = pd.read_csv(out)
+
+    assert sized["error_code"].tolist() == [0, ERR_NOT_A_NUMBER, ERR_STOP_LOSS, 0]
+    assert sized["position_size"].isna().tolist() == [False, True, True, False]
+    assert sized["entry_price"].tolist()[3] == 101.0
+
+    with pytest.raises(ValueError, match="Not a number in entry_price: 'abc'"):
+        write_binary_plan(
+            str(tmp_path / "plan.rzk"), read_plan_chunks(str(plan)),
+            {"account_size": 10000.0, "risk_mode": "% of Account", "risk_input": 1.0}
+        )
+
+
+def test_workers_match_single_process(tmp_path):
+    """--workers shards each chunk across a process pool without changing a single value."""
+    plan = tmp_path / "plan.csv"
+    plan.write_text(PLAN_CSV + "Long,10000,% of Account,1,abc,95\nSideways,10000,% of Account,1,100,95\n")
+    single, pooled = tmp_path / "single.csv", tmp_path / "pooled.csv"
+
+    assert main([str(plan), "-o", str(single), "-q"]) == 0
+    assert main([str(plan), "-o", str(pooled), "--workers", "2", "-q"]) == 0
+    assert pooled.read_text() == single.read_text()
+
+
+def test_failed_conversion_leaves_no_plan(tmp_path, capsys):
+    """A bad cell in a later chunk aborts --write-plan without leaving a truncated, valid-looking .rzk."""
+    plan = tmp_path / "plan.csv"
+    plan.write_text(PLAN_CSV + "Long,10000,% of Account,1,abc,95\n")
+    binary = tmp_path / "plan.rzk"
+
+    assert main([str(plan), "--write-plan", str(binary), "--chunk-size", "2"]) == 1
+    assert "Not a number in entry_price" in capsys.readouterr().err
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["plan.csv"]
+
+
+def test_damaged_binary_plans_are_rejected(tmp_path, capsys):
+    """Truncated files, trailing bytes and out-of-range type codes are errors, not silently smaller plans."""
+    plan = tmp_path / "plan.csv"
+    plan.write_text(PLAN_CSV)
+    binary = tmp_path / "plan.rzk"
+    assert main([str(plan), "--write-plan", str(binary), "-q"]) == 0
+    data = binary.read_bytes()
+
+    for damaged in (data[:-BINARY_RECORD_DTYPE.itemsize], data[:-5], data + b"\0"):
+        binary.write_bytes(damaged)
+        assert main([str(binary), "-o", str(tmp_path / "out.csv")]) == 1
+        assert "truncated or corrupt" in capsys.readouterr().err
+
+    corrupt = bytearray(data)
+    corrupt[BINARY_HEADER_DTYPE.itemsize + BINARY_RECORD_DTYPE.itemsize] = 7  # position_type of record 1
+    binary.write_bytes(bytes(corrupt))
+    assert main([str(binary), "-o", str(tmp_path / "out.csv")]) == 1
+    assert "record 1 has position_type code 7" in capsys.readouterr().err
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the RIZZK calculation history storage.
+"""
+
+import numpy as np
+import pytest
+from rizzk_core import calculate_risk_reward, calculate_trade_metrics
+from rizzk_history import HistoryEntry, OwnedHistory, SQLiteHistory, TradeHistory
+
+
+def _add(history, position_type, entry_price, stop_loss, **kwargs):
+    result = calculate_risk_reward(position_type, 10000.0, "% of Account", 1.0, entry_price, stop_loss)
+    history.append(position_type, 10000.0, "% of Account", 1.0, entry_price, stop_loss, result, **kwargs)
+
+
+def test_append_and_recent():
+    """Entries round-trip through the columns and recent() is newest first."""
+    history = TradeHistory(capacity=1)
+    _add(history, "Long", 100.0, 95.0)
+    _add(history, "Short", 95.0, 100.0)
+    _add(history, "Long", 50.0, 48.0)
+
+    assert len(history) == 3
+    assert history[0] == HistoryEntry(
+        "Long", 10000.0, "% of Account", 1.0, 100.0, 95.0, 20.0, 20, 100.0, 105.0, 110.0, 5.0, 5.0, 1.0
+    )
+    assert [h.entry_price for h in history.recent(2)] == [50.0, 95.0]
+    assert history[-2].position_type == "Short"
+    with pytest.raises(IndexError):
+        history[3]
+
+
+def test_to_pandas_is_zero_copy():
+    """The DataFrame shares memory with the history columns."""
+    history = TradeHistory()
+    _add(history, "Long", 100.0, 95.0)
+    _add(history, "Short", 95.0, 100.0)
+
+    df = history.to_pandas()
+    columns = history.columns()
+
+    assert df["position_type"].tolist() == ["Long", "Short"]
+    assert np.shares_memory(df["entry_price"].to_numpy(), columns["entry_price"])
+    assert np.shares_memory(df["position_size_rounded"].to_numpy(), columns["position_size_rounded"])
+
+
+def test_clear():
+    """Clearing empties the history."""
+    history = TradeHistory()
+    _add(history, "Long", 100.0, 95.0)
+    history.clear()
+
+    assert not history
+    assert history.recent(5) == []
+
+
+def test_ring_buffer_spills_to_disk(tmp_path):
+    """Past max_entries, memory stays flat and older entries move to compressed segments."""
+    history = TradeHistory(capacity=2, max_entries=4, spill_dir=str(tmp_path))
+    for i in range(4):
+        _add(history, "Long", 100.0 + i, 95.0)
+    assert not list(tmp_path.iterdir())  # nothing spilled yet, so no directory either
+    for i in range(4, 11):
+        _add(history, "Long", 100.0 + i, 95.0)
+
+    assert len(history) == 11
+    assert len(history._columns["entry_price"]) == 4
+    assert len(list(tmp_path.glob("rizzk-history-*/segment-*.npz"))) == 4
+    assert [h.entry_price for h in history] == [100.0 + i for i in range(11)]
+    assert [h.entry_price for h in history.page(2, 4)] == [102.0, 101.0, 100.0]
+    assert history.columns()["entry_price"].tolist() == [100.0 + i for i in range(11)]
+
+    history.clear()
+    assert len(history) == 0 and not list(tmp_path.glob("rizzk-history-*/*.npz"))
+    del history
+    assert not list(tmp_path.iterdir())  # the directory goes with the history
+
+
+def test_ring_buffer_without_spill_keeps_newest():
+    """Without a spill directory the oldest entries are dropped."""
+    history = TradeHistory(max_entries=4)
+    for i in range(7):
+        _add(history, "Long", 100.0 + i, 95.0)
+
+    assert [h.entry_price for h in history.recent(10)] == [106.0, 105.0, 104.0]
+    assert history.to_pandas()["entry_price"].tolist() == [104.0, 105.0, 106.0]
+
+
+def test_sqlite_history_persists_and_pages(tmp_path):
+    """Batched appends survive reopening the file; pages and filters come back newest first."""
+    path = str(tmp_path / "history.db")
+    history = SQLiteHistory(path, batch_size=4, flush_interval=3600)
+    for i in range(10):
+        _add(history, "Long" if i % 2 == 0 else "Short", 100.0 + i, 95.0 + i if i % 2 == 0 else 105.0 + i, rr=i % 4)
+    assert history._pending  # the last two rows are still queued...
+
+    reopened = SQLiteHistory(path)
+    assert len(reopened) == 8  # ...so another instance can't see them yet
+    assert len(history) == 10  # reading flushes
+
+    assert [h.entry_price for h in reopened.page(1, 4)] == [105.0, 104.0, 103.0, 102.0]
+    assert reopened.recent(1)[0].entry_price == 109.0
+    assert [h.entry_price for h in reopened.page(0, 10, position_type="Short", min_rr=2)] == [107.0, 103.0]
+    assert reopened.count(since=0.0) == 10 and reopened.count(min_rr=3) == 2
+    assert reopened.to_pandas()["position_type"].tolist()[:2] == ["Long", "Short"]
+
+    reopened.clear()
+    assert not history
+
+
+def test_derived_metrics_stored_once(tmp_path):
+    """Derived metrics come from the appended TradeMetrics, in memory and in SQLite alike."""
+    metrics = calculate_trade_metrics("Short", 10000.0, "% of Account", 1.0, 50.0, 52.0)
+    derived = (metrics.position_size, metrics.pct_drop_to_stop, metrics.pct_move_to_1_1, metrics.rr_1_1)
+    for history in (TradeHistory(), SQLiteHistory(str(tmp_path / "history.db"))):
+        history.append("Short", 10000.0, "% of Account", 1.0, 50.0, 52.0, metrics)
+        entry = history.recent(1)[0]
+        assert (entry.position_size, entry.pct_drop_to_stop, entry.pct_move_to_1_1, entry.rr_1_1) == derived
+
+
+def test_owned_history_keeps_owners_apart(tmp_path):
+    """Owners sharing one file only count, page and clear their own rows."""
+    store = SQLiteHistory(str(tmp_path / "history.db"))
+    alice, bob = OwnedHistory(store, "user:alice"), OwnedHistory(store, "user:bob")
+    for _ in range(3):
+        _add(alice, "Long", 100.0, 95.0)
+    _add(bob, "Short", 100.0, 105.0, rr=2.0)
+
+    assert (len(alice), len(bob), len(store)) == (3, 1, 4)
+    assert len(alice.page(0, 5)) == 3 and bob.count(min_rr=2.0) == 1
+
+    alice.clear()
+    assert (len(alice), len(bob)) == (0, 1)
+
+
+def test_prune_drops_old_anonymous_rows_only(tmp_path, monkeypatch):
+    """prune() deletes rows of the given owner prefix stored before the cutoff, leaving signed-in users alone."""
+    store = SQLiteHistory(str(tmp_path / "history.db"), batch_size=1)
+    clock = [1_000_000.0]
+    monkeypatch.setattr("rizzk_history.time.time", lambda: clock[0])
+    _add(OwnedHistory(store, "session:old"), "Long", 100.0, 95.0)
+    _add(OwnedHistory(store, "user:alice"), "Long", 100.0, 95.0)
+    clock[0] += 10 * 86400
+    _add(OwnedHistory(store, "session:new"), "Long", 100.0, 95.0)
+
+    assert store.prune("session:", 7 * 86400) == 1
+    assert [(owner, store.count(owner=owner)) for owner in ("session:old", "session:new", "user:alice")] == [
+        ("session:old", 0), ("session:new", 1), ("user:alice", 1)
+    ]
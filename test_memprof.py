@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the RIZZK session memory profiler.
+"""
+
+import json
+import tracemalloc
+
+import numpy as np
+import pytest
+from rizzk_memprof import SessionMemoryProfiler, classify, deep_sizeof, package_of, start_tracing
+
+
+@pytest.fixture
+def tracing():
+    was_tracing = tracemalloc.is_tracing()
+    start_tracing()
+    yield
+    if not was_tracing:
+        tracemalloc.stop()
+
+
+def test_deep_sizeof_counts_array_buffers_once():
+    """An array's buffer counts once, views only count their header."""
+    data = np.zeros(10_000)
+    assert deep_sizeof(data) >= data.nbytes
+    assert deep_sizeof(data[::2]) < 1_000
+    assert deep_sizeof({"a": data, "b": data, "view": data[::2]}) < 2 * data.nbytes
+
+
+def test_classify_and_package_of():
+    """Session items are grouped by role, allocations by top-level package."""
+    assert classify("history", object()) == "history"
+    assert classify("recorded_trade", 3) == "other session state"
+    assert package_of("/venv/lib/python3.11/site-packages/plotly/basedatatypes.py") == "plotly"
+    assert package_of("/srv/app/rizzk_history.py") == "rizzk_history"
+
+
+def test_profiler_samples_on_interval_and_reports_growth(tracing):
+    """Samples are rate-limited, attribute session objects and list per-line growth."""
+    profiler = SessionMemoryProfiler(interval=60.0)
+    state = {"history": np.zeros(1_000), "memory_profiler": profiler}
+
+    first = profiler.maybe_sample(state)
+    assert first is not None and profiler.maybe_sample(state) is None
+    assert profiler.maybe_sample(state, now=first.timestamp + 60.0) is not None
+    assert set(first.objects) == {"history"} and first.objects["history"] >= 8_000
+
+    state["history"] = [bytearray(1_000) for _ in range(1_000)]
+    profiler.sample(state)
+    assert "test_memprof.py:" in profiler.growth[0].location
+    assert profiler.growth[0].size_diff_bytes >= 1_000_000
+    assert not any("tracemalloc.py:" in row.location or "rizzk_memprof.py:" in row.location for row in profiler.growth)
+
+    report = json.loads(profiler.to_json())
+    assert len(report["samples"]) == 3 and report["growth"]
+
+
+def test_sample_requires_tracing():
+    """Sampling without tracemalloc running is an error, not an empty report."""
+    if tracemalloc.is_tracing():
+        pytest.skip("tracemalloc already running")
+    with pytest.raises(RuntimeError):
+        SessionMemoryProfiler().sample({})
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the RIZZK Monte Carlo equity-curve simulator.
+"""
+
+import numpy as np
+import pytest
+from rizzk_montecarlo import simulate_equity_curves
+
+
+def test_same_seed_is_deterministic():
+    """The same seed reproduces every path."""
+    first = simulate_equity_curves(10000.0, 1.0, 0.5, 2.0, n_trades=50, n_paths=1000, chunk_size=256, seed=7)
+    second = simulate_equity_curves(10000.0, 1.0, 0.5, 2.0, n_trades=50, n_paths=1000, chunk_size=256, seed=7)
+
+    assert first.terminal_equity.shape == (1000,)
+    for a, b in zip(first, second):
+        assert np.array_equal(a, b)
+
+
+def test_always_win_and_always_lose():
+    """Certain outcomes compound exactly and drive ruin as expected."""
+    winners = simulate_equity_curves(10000.0, 1.0, 1.0, 2.0, n_trades=10, n_paths=4, seed=0)
+    losers = simulate_equity_curves(10000.0, 10.0, 0.0, 2.0, n_trades=10, n_paths=4, seed=0)
+
+    assert np.allclose(winners.terminal_equity, 10000.0 * 1.02 ** 10)
+    assert np.all(winners.max_drawdown == 0)
+    assert winners.risk_of_ruin == 0.0
+    # 0.9 ** 7 < 0.5, so every path is ruined and frozen after the 7th loss
+    assert losers.risk_of_ruin == 1.0
+    assert np.allclose(losers.terminal_equity, 10000.0 * 0.9 ** 7)
+    assert losers.drawdown_percentiles()[50] == pytest.approx(1 - 0.9 ** 7)
+
+
+def test_whole_shares_rounding():
+    """With a stop distance, risk per trade is rounded down to whole shares."""
+    result = simulate_equity_curves(10000.0, 1.0, 1.0, 1.0, n_trades=1, n_paths=1, stop_distance=3.0, seed=0)
+
+    # $100 risk at $3/share = 33 shares = $99 at risk, $99 won at 1:1
+    assert result.terminal_equity[0] == 10099.0
+
+
+def test_invalid_inputs_raise():
+    """Out-of-range inputs raise ValueError."""
+    with pytest.raises(ValueError):
+        simulate_equity_curves(10000.0, 1.0, 1.5)
+    with pytest.raises(ValueError):
+        simulate_equity_curves(10000.0, 0.0, 0.5)
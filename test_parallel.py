@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the RIZZK process-pool execution backend.
+"""
+
+import numpy as np
+import pytest
+from rizzk_core import calculate_risk_reward_batch, calculate_trade_metrics_batch
+from rizzk_montecarlo import simulate_equity_curves
+from rizzk_parallel import ParallelBackend
+from rizzk_sweep import price_levels, sweep_entry_stop
+
+
+@pytest.fixture(scope="module")
+def backend():
+    # Tiny shards so even small inputs are split across several tasks
+    with ParallelBackend(workers=2, min_shard_rows=16) as pool:
+        yield pool
+
+
+def test_batch_identical_to_single_process(backend):
+    """Sharded batch sizing returns exactly the single-process arrays."""
+    rng = np.random.default_rng(1)
+    n = 1000
+    position_types = np.where(rng.random(n) < 0.5, "Long", "Short")
+    entries = rng.uniform(5, 500, n)
+    stops = entries * np.where(position_types == "Long", 0.97, 1.03)
+    stops[::97] = entries[::97]  # a few invalid rows
+
+    expected = calculate_risk_reward_batch(position_types, 25000.0, "% of Account", 0.5, entries, stops, errors="mask")
+    result = backend.risk_reward_batch(position_types, 25000.0, "% of Account", 0.5, entries, stops, errors="mask")
+
+    for a, b in zip(expected, result):
+        assert np.array_equal(a, b, equal_nan=True)
+    expected = calculate_trade_metrics_batch(position_types, 25000.0, "% of Account", 0.5, entries, stops, errors="mask")
+    result = backend.trade_metrics_batch(position_types, 25000.0, "% of Account", 0.5, entries, stops, errors="mask")
+    for a, b in zip(expected, result):
+        assert np.array_equal(a, b, equal_nan=True)
+    with pytest.raises(ValueError, match="^Row 0: Entry price and stop loss cannot be the same"):
+        backend.risk_reward_batch(position_types, 25000.0, "% of Account", 0.5, entries, stops)
+
+
+def test_sweep_identical_to_single_process(backend):
+    """Sharded sweeps match sweep_entry_stop, including masks."""
+    entries = price_levels(100.0, 5.0, 64)
+    stops = price_levels(97.0, 5.0, 48)
+
+    expected = sweep_entry_stop("Long", 10000.0, "% of Account", 1.0, entries, stops)
+    result = backend.sweep_entry_stop("Long", 10000.0, "% of Account", 1.0, entries, stops)
+
+    for a, b in zip(expected, result):
+        assert np.array_equal(np.ma.getdata(a), np.ma.getdata(b), equal_nan=True)
+        assert np.array_equal(np.ma.getmaskarray(a), np.ma.getmaskarray(b))
+
+
+def test_simulation_identical_to_single_process(backend):
+    """Chunk-seeded simulations give the same paths however chunks are sharded."""
+    args = (10000.0, 1.0, 0.45, 2.0, 40, 3000)
+
+    expected = simulate_equity_curves(*args, chunk_size=128, seed=11)
+    result = backend.simulate_equity_curves(*args, chunk_size=128, seed=11)
+
+    for a, b in zip(expected, result):
+        assert np.array_equal(a, b)
@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the RIZZK render latency log.
+"""
+
+import pytest
+from rizzk_perf import LatencyLog
+
+
+def test_rolling_window_summary():
+    """Only the last window samples feed the percentiles; run counts keep growing."""
+    log = LatencyLog(window=4)
+    for ms in (100, 1, 2, 3, 4):
+        log.record("history", ms / 1000)
+
+    (row,) = log.summary()
+    assert row.section == "history" and row.runs == 5
+    assert row.last_ms == pytest.approx(4.0)
+    assert row.p50_ms == pytest.approx(2.5)
+    assert row.p99_ms == pytest.approx(3.97)
+
+
+def test_time_records_early_exits():
+    """Blocks that exit with an exception (like st.rerun) are still timed."""
+    log = LatencyLog()
+    with pytest.raises(RuntimeError):
+        with log.time("form"):
+            raise RuntimeError("rerun")
+
+    assert [row.section for row in log.summary()] == ["form"]
+    log.clear()
+    assert log.summary() == []
@@ -4,8 +4,22 @@ Unit tests for the RIZZK Risk-to-Reward Calculator core logic.
 Uses pytest for proper test framework functionality.
 """
 
+import numpy as np
 import pytest
-from rizzk_core import calculate_risk_reward
+from rizzk_core import (
+    ERR_OK,
+    ERROR_MESSAGES,
+    calculate_percentage_moves,
+    calculate_profit_ladder,
+    calculate_profit_ladder_batch,
+    calculate_risk_reward,
+    calculate_risk_reward_batch,
+    calculate_risk_reward_ratio,
+    calculate_trade_metrics,
+    calculate_trade_metrics_batch,
+    describe_errors,
+    validate_risk_reward_batch,
+)
 
 
 def test_long_basic():
@@ -83,4 +97,146 @@ def test_extreme_sanity_check():
     assert abs(risk_amount - 0.00001) < 1e-8
 
     # Position size should be reasonable (not infinite or negative)
-    assert position_size < 1e6  # Sanity check: not insanely large
\ No newline at end of file
+    assert position_size < 1e6  # Sanity check: not insanely large
+
+
+def test_batch_matches_scalar():
+    """Batch results match the scalar function row for row."""
+    rows = [
+        ("Long", 10000.0, "% of Account", 1.0, 100.0, 95.0),
+        ("Short", 10000.0, "% of Account", 1.0, 95.0, 100.0),
+        ("Long", 25000.0, "Fixed $ Amount", 250.0, 42.37, 41.12),
+        ("Short", 5000.0, "Fixed $ Amount", 75.0, 12.5, 13.05),
+        ("Long", 1.0, "% of Account", 0.001, 0.0001, 0.00009),
+    ]
+    columns = [np.array(col) for col in zip(*rows)]
+    batch = calculate_risk_reward_batch(*columns)
+
+    for i, row in enumerate(rows):
+        expected = calculate_risk_reward(*row)
+        assert tuple(col[i] for col in batch) == expected
+    assert batch[1].dtype == np.int64
+
+
+def test_batch_broadcasts_scalars():
+    """Scalar arguments are broadcast across the batch."""
+    entries = np.array([100.0, 50.0, 20.0])
+    stops = np.array([95.0, 48.0, 19.5])
+    position_size, _, risk_amount, _, _, _ = calculate_risk_reward_batch(
+        "Long", 10000.0, "% of Account", 1.0, entries, stops
+    )
+
+    assert np.allclose(risk_amount, 100.0)
+    assert np.allclose(position_size, [20.0, 50.0, 200.0])
+
+
+def test_batch_invalid_row_raises():
+    """The first invalid row raises the scalar error message with its index."""
+    with pytest.raises(ValueError, match=r"^Row 1: Entry price must be higher than stop loss"):
+        calculate_risk_reward_batch(
+            ["Long", "Long", "Short"], 10000.0, "% of Account", 1.0,
+            [100.0, 95.0, 0.0], [95.0, 100.0, 100.0]
+        )
+
+
+def test_validate_batch_matches_scalar_errors():
+    """Each invalid row gets the code of the exact error the scalar function raises."""
+    invalid_cases = [
+        ("Long", 0, "% of Account", 1, 100, 95),
+        ("Long", 10000, "% of Account", 0, 100, 95),
+        ("Long", 10000, "% of Account", 101, 100, 95),
+        ("Long", 10000, "Fixed $ Amount", 0, 100, 95),
+        ("Long", 10000, "Fixed $ Amount", 20000, 100, 95),
+        ("Long", 10000, "% of Account", 1, 0, 95),
+        ("Long", 10000, "% of Account", 1, 100, 0),
+        ("Long", 10000, "% of Account", 1, 100, 100),
+        ("Long", 10000, "% of Account", 1, 95, 100),
+        ("Short", 10000, "% of Account", 1, 100, 95),
+        ("Long", 10000, "% of Account", 1, 100, 99.99995),
+        ("Short", 10000, "% of Account", 1, 100, 100.00005),
+    ]
+    rows = invalid_cases + [("Long", 10000, "% of Account", 1, 100, 95)]
+    error_codes, valid = validate_risk_reward_batch(*[np.array(col) for col in zip(*rows)])
+
+    for code, case in zip(error_codes[:-1], invalid_cases):
+        with pytest.raises(ValueError) as excinfo:
+            calculate_risk_reward(*case)
+        assert ERROR_MESSAGES[int(code)] == str(excinfo.value)
+    assert error_codes[-1] == ERR_OK
+    assert valid.tolist() == [False] * len(invalid_cases) + [True]
+
+
+def test_batch_mask_mode_skips_bad_rows():
+    """In mask mode good rows are sized and bad rows come back as NaN / 0 shares."""
+    position_types = ["Long", "Long", "Short"]
+    entries = [100.0, 95.0, 95.0]
+    stops = [95.0, 100.0, 100.0]
+    position_size, position_size_rounded, _, profit_1_1, _, _ = calculate_risk_reward_batch(
+        position_types, 10000.0, "% of Account", 1.0, entries, stops, errors="mask"
+    )
+    error_codes, valid = validate_risk_reward_batch(position_types, 10000.0, "% of Account", 1.0, entries, stops)
+
+    assert valid.tolist() == [True, False, True]
+    assert np.isnan(position_size[1]) and np.isnan(profit_1_1[1])
+    assert position_size_rounded.tolist() == [20, 0, 20]
+    assert describe_errors(error_codes).tolist() == [
+        "", "Entry price must be higher than stop loss for long positions.", ""
+    ]
+
+
+def test_trade_metrics_match_separate_calls():
+    """The fused kernel matches the three separate core calls, scalar and batch."""
+    rows = [
+        ("Long", 10000.0, "% of Account", 1.0, 100.0, 95.0),
+        ("Short", 10000.0, "% of Account", 2.5, 95.0, 100.0),
+        ("Long", 25000.0, "Fixed $ Amount", 250.0, 42.37, 41.12),
+        ("Short", 5000.0, "Fixed $ Amount", 75.0, 12.5, 13.05),
+    ]
+    batch = calculate_trade_metrics_batch(*[np.array(col) for col in zip(*rows)])
+
+    for i, row in enumerate(rows):
+        position_type, _, _, _, entry_price, stop_loss = row
+        sizing = calculate_risk_reward(*row)
+        pct_moves = calculate_percentage_moves(entry_price, stop_loss, sizing[3], position_type)
+        rr_1_1 = calculate_risk_reward_ratio(entry_price, stop_loss, sizing[3], position_type)
+        expected = (*sizing, *pct_moves, rr_1_1)
+
+        assert tuple(calculate_trade_metrics(*row)) == expected
+        assert tuple(col[i] for col in batch) == expected
+        assert calculate_trade_metrics(*row).rr_1_1 == batch.rr_1_1[i] == 1.0
+
+
+def test_profit_ladder_matches_fixed_targets():
+    """1R and 2R ladder levels reproduce profit_1_1 and profit_2_1 exactly."""
+    for row in [("Long", 10000.0, "% of Account", 1.0, 42.37, 41.12), ("Short", 5000.0, "Fixed $ Amount", 75.0, 12.5, 13.05)]:
+        position_type, _, _, _, entry_price, stop_loss = row
+        result = calculate_risk_reward(*row)
+        ladder = calculate_profit_ladder(entry_price, stop_loss, result.position_size, [1, 2], position_type=position_type)
+
+        assert ladder.target_prices.tolist() == [result.profit_1_1, result.profit_2_1]
+        assert ladder.pnl[0] == abs(result.profit_1_1 - entry_price) * result.position_size
+
+
+def test_profit_ladder_scale_out_and_batch():
+    """Scale-out weights split P&L across levels; batches add a row per trade."""
+    ladder = calculate_profit_ladder(100.0, 95.0, 20, [0.5, 1, 2, 3], [0.25, 0.25, 0.25, 0.25])
+
+    assert np.allclose(ladder.target_prices, [102.5, 105.0, 110.0, 115.0])
+    assert np.allclose(ladder.pnl, [50.0, 100.0, 200.0, 300.0])
+    assert ladder.blended_pnl == pytest.approx(162.5)
+
+    batch = calculate_profit_ladder_batch([100.0, 95.0], [95.0, 100.0], [20, 40], [1, 2], position_types=["Long", "Short"])
+    assert batch.target_prices.shape == (2, 2)
+    assert np.allclose(batch.target_prices[1], [90.0, 85.0])
+    assert np.allclose(batch.blended_pnl, [150.0, 300.0])
+
+
+def test_profit_ladder_invalid_levels_raise():
+    """Non-positive or non-finite multiples and bad weights raise ValueError."""
+    for r_multiples in ([0, 1], [1, float("nan")], [float("inf")], [-np.inf, 2]):
+        with pytest.raises(ValueError, match="finite numbers greater than 0"):
+            calculate_profit_ladder(100.0, 95.0, 20, r_multiples)
+    with pytest.raises(ValueError):
+        calculate_profit_ladder(100.0, 95.0, 20, [1, 2], [0.8, 0.8])
+    with pytest.raises(ValueError):
+        calculate_profit_ladder(100.0, 95.0, 20, [1, 2], [1.0])
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the RIZZK entry x stop sweep engine.
+"""
+
+import numpy as np
+import pytest
+from rizzk_core import ERR_LONG_STOP_ABOVE_ENTRY, ERR_POSITION_TOO_LARGE, calculate_risk_reward
+from rizzk_sweep import price_levels, price_slider_range, sweep_entry_stop
+
+
+def test_sweep_matches_scalar_cells():
+    """Every valid cell matches the scalar calculation for that entry/stop pair."""
+    entries = np.array([100.0, 101.5, 103.0])
+    stops = np.array([94.0, 95.0, 97.25])
+    result = sweep_entry_stop("Long", 10000.0, "% of Account", 1.0, entries, stops)
+
+    assert result.position_size.shape == (3, 3)
+    for i, entry_price in enumerate(entries):
+        for j, stop_loss in enumerate(stops):
+            expected = calculate_risk_reward("Long", 10000.0, "% of Account", 1.0, entry_price, stop_loss)
+            assert result.position_size[i, j] == expected.position_size
+            assert result.position_size_rounded[i, j] == expected.position_size_rounded
+            assert result.profit_2_1[i, j] == expected.profit_2_1
+
+
+def test_sweep_masks_invalid_cells():
+    """Stops on the wrong side and oversized positions are masked with their error code."""
+    result = sweep_entry_stop("Long", 10000.0, "% of Account", 1.0, [100.0], [95.0, 99.99995, 105.0])
+
+    assert result.position_size.mask.tolist() == [[False, True, True]]
+    assert result.error_codes.tolist() == [[0, ERR_POSITION_TOO_LARGE, ERR_LONG_STOP_ABOVE_ENTRY]]
+    assert result.rounded_risk_amount[0, 0] == 100.0
+
+
+def test_price_levels():
+    """Levels are centered on the price and span +/- the given percentage."""
+    levels = price_levels(100.0, 10.0, 5)
+
+    assert np.allclose(levels, [90.0, 95.0, 100.0, 105.0, 110.0])
+
+
+def test_price_slider_range_uses_a_tick_grid():
+    """Slider bounds sit on a power-of-ten tick grid and never reach zero."""
+    assert price_slider_range(100.0, 10.0) == (90.0, 110.0, 0.01)
+    assert price_slider_range(12345.67, 10.0) == (11111.0, 13581.0, 1.0)
+
+    low, high, step = price_slider_range(0.001, 10.0)
+    assert step == low == 0.01 and high > low
+
+    with pytest.raises(ValueError):
+        price_slider_range(0.0, 10.0)